@@ -6,3 +6,9 @@ and generating reliability audit reports.
 """
 
 __version__ = "0.1.0"
+
+from .api import audit, load_data
+from .config import Config, load_config
+from .scoring import ReliabilityScore
+
+__all__ = ["audit", "load_data", "Config", "load_config", "ReliabilityScore"]
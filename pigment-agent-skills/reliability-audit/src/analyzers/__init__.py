@@ -6,10 +6,22 @@ from .performance_analyzer import PerformanceAnalyzer
 from .scoping_analyzer import ScopingAnalyzer
 from .complexity_analyzer import ComplexityAnalyzer
 from .workload_analyzer import WorkloadAnalyzer
+from .anomaly_analyzer import AnomalyAnalyzer
+from .change_impact_analyzer import ChangeImpactAnalyzer
+from .dependency_analyzer import DependencyAnalyzer
+from .formula_analyzer import FormulaAnalyzer
+from .worker_scaling_analyzer import WorkerScalingAnalyzer
+from .write_path_analyzer import WritePathAnalyzer
 
 __all__ = [
     "PerformanceAnalyzer",
     "ScopingAnalyzer",
     "ComplexityAnalyzer",
     "WorkloadAnalyzer",
+    "AnomalyAnalyzer",
+    "ChangeImpactAnalyzer",
+    "DependencyAnalyzer",
+    "FormulaAnalyzer",
+    "WorkerScalingAnalyzer",
+    "WritePathAnalyzer",
 ]
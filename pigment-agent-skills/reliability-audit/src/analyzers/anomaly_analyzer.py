@@ -0,0 +1,164 @@
+"""
+Anomaly analyzer for per-metric daily execution-time series.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+from .performance_analyzer import SEVERITY_ORDER, classify_severity
+
+
+# Scales the MAD so the robust z-score is comparable to a standard z-score
+MAD_SCALE = 0.6745
+
+
+@dataclass(slots=True)
+class AnomalyFinding:
+    """A day on which a metric's execution time deviated from its baseline."""
+
+    metric_id: str
+    metric_name: str
+    application: str
+    day: str
+    severity: str  # "watch", "warning", "critical"
+    daily_execution_time: float
+    baseline_execution_time: float
+    robust_zscore: float
+    execution_count: int
+
+
+@dataclass
+class AnomalyAnalysisResult:
+    """Results of anomaly analysis."""
+
+    # Coverage
+    metrics_scored: int = 0
+    metric_days_scored: int = 0
+    seasonal_baseline: bool = False
+
+    # Anomalies by severity
+    critical_count: int = 0
+    warning_count: int = 0
+    watch_count: int = 0
+    anomalous_metrics: int = 0
+
+    # Findings
+    findings: List[AnomalyFinding] = field(default_factory=list)
+
+
+class AnomalyAnalyzer:
+    """Detect execution-time anomalies with robust (median/MAD) z-scores."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.thresholds = config.thresholds.anomaly_zscore
+
+    def analyze(self, data: PerformanceData) -> AnomalyAnalysisResult:
+        """Run anomaly analysis on the data."""
+
+        result = AnomalyAnalysisResult(
+            seasonal_baseline=self.config.thresholds.anomaly_seasonal_baseline
+        )
+
+        if not data.has_executions:
+            return result
+
+        daily = self._daily_series(data.executions)
+
+        if daily is None or len(daily) == 0:
+            return result
+
+        self._score(daily, result.seasonal_baseline)
+
+        scored = daily[daily["robust_z"].notna()]
+        result.metrics_scored = scored["metric_id"].nunique()
+        result.metric_days_scored = len(scored)
+
+        # Classify severity in one pass over the scored days
+        anomalies = scored.assign(severity=classify_severity(scored["robust_z"], self.thresholds))
+        anomalies = anomalies[anomalies["severity"] != ""]
+
+        counts = anomalies["severity"].value_counts()
+        result.critical_count = int(counts.get("critical", 0))
+        result.warning_count = int(counts.get("warning", 0))
+        result.watch_count = int(counts.get("watch", 0))
+        result.anomalous_metrics = anomalies["metric_id"].nunique()
+
+        # Keep the most severe anomalies, largest deviation first
+        anomalies = anomalies.assign(
+            severity_rank=anomalies["severity"].map(SEVERITY_ORDER)
+        ).sort_values(["severity_rank", "robust_z"], ascending=[True, False])
+
+        for row in anomalies.head(self.config.max_findings_per_category).itertuples(index=False):
+            result.findings.append(AnomalyFinding(
+                metric_id=row.metric_id,
+                metric_name=row.metric_name,
+                application=row.application,
+                day=row.day.strftime("%Y-%m-%d"),
+                severity=row.severity,
+                daily_execution_time=round(row.total_time, 2),
+                baseline_execution_time=round(row.baseline, 2),
+                robust_zscore=round(row.robust_z, 2),
+                execution_count=int(row.exec_count),
+            ))
+
+        return result
+
+    def _daily_series(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Aggregate executions into one row per metric and day."""
+
+        if "day" in df.columns:
+            day = df["day"]
+        elif "executionStartedAt" in df.columns:
+            day = df["executionStartedAt"].dt.normalize()
+        else:
+            return None
+
+        daily = df.assign(day=day).groupby(
+            ["application", "metric_id", "metric_name", "day"],
+            observed=True,
+            sort=False,
+        ).agg(
+            total_time=("execution_time", "sum"),
+            exec_count=("execution_time", "count"),
+        ).reset_index()
+
+        # Only metrics with enough history get a meaningful baseline
+        min_days = self.config.thresholds.anomaly_min_history_days
+        history = daily.groupby("metric_id", observed=True, sort=False)["day"].transform("size")
+
+        return daily[history >= min_days].reset_index(drop=True)
+
+    def _score(self, daily: pd.DataFrame, seasonal: bool):
+        """Add baseline and robust z-score columns to the daily series."""
+
+        keys = ["metric_id"]
+        if seasonal:
+            daily["weekday"] = daily["day"].dt.dayofweek
+            keys = ["metric_id", "weekday"]
+
+        baseline = daily.groupby(keys, observed=True, sort=False)["total_time"].transform("median")
+        deviation = (daily["total_time"] - baseline).abs()
+        mad = deviation.groupby([daily[k] for k in keys], observed=True, sort=False).transform("median")
+
+        if seasonal:
+            # Weekdays with too few samples fall back to the metric-wide baseline
+            samples = daily.groupby(keys, observed=True, sort=False)["total_time"].transform("size")
+            overall = daily.groupby("metric_id", observed=True, sort=False)["total_time"].transform("median")
+            overall_mad = (daily["total_time"] - overall).abs().groupby(
+                daily["metric_id"], observed=True, sort=False
+            ).transform("median")
+
+            sparse = samples < 3
+            baseline = baseline.where(~sparse, overall)
+            mad = mad.where(~sparse, overall_mad)
+
+        # A zero MAD means a flat series; there is no spread to score against
+        mad = mad.where(mad > 0)
+
+        daily["baseline"] = baseline
+        daily["robust_z"] = MAD_SCALE * (daily["total_time"] - baseline) / mad
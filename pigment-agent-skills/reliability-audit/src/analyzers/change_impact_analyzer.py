@@ -0,0 +1,249 @@
+"""
+Change impact analyzer: attribute latency and compute spikes to model changes.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+from .anomaly_analyzer import MAD_SCALE
+from .performance_analyzer import classify_severity
+
+
+# Audit log event types that change a model
+CHANGE_EVENT_TYPES = ["BlockCreated", "BlockModified", "BlockDeleted"]
+
+# Buckets an application needs before its spikes are scored
+MIN_BUCKETS = 24
+
+
+@dataclass(slots=True)
+class ChangeImpactFinding:
+    """A model change followed by a latency or compute spike in its application."""
+
+    change_id: str
+    source: str  # "armset" or "audit_log"
+    application: str
+    block_name: Optional[str]
+    changed_at: str
+    spike_at: str
+    lag_minutes: float
+    spike_signal: str  # "latency" or "compute"
+    spike_value: float
+    baseline_value: float
+    spike_zscore: float
+    severity: str  # "watch", "warning", "critical"
+    culprit_score: float
+
+
+@dataclass
+class ChangeImpactAnalysisResult:
+    """Results of change impact analysis."""
+
+    # Coverage
+    changes_considered: int = 0
+    spikes_detected: int = 0
+    window_hours: float = 0
+
+    # Attribution
+    attributed_changes: int = 0
+    attributed_spikes: int = 0
+    critical_count: int = 0
+
+    # Findings (most likely culprits first)
+    findings: List[ChangeImpactFinding] = field(default_factory=list)
+
+
+def _utc(times: pd.Series) -> pd.Series:
+    """Timestamps as UTC; naive values are taken to be UTC already."""
+
+    if times.dt.tz is None:
+        return times.dt.tz_localize("UTC")
+    return times.dt.tz_convert("UTC")
+
+
+class ChangeImpactAnalyzer:
+    """Match change events to the spikes that follow them with as-of joins."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.thresholds = config.thresholds
+        self.bucket = pd.Timedelta(minutes=config.thresholds.change_bucket_minutes)
+        self.window = pd.Timedelta(hours=config.thresholds.change_window_hours)
+
+    def analyze(self, data: PerformanceData) -> ChangeImpactAnalysisResult:
+        """Run change impact analysis on the data."""
+
+        result = ChangeImpactAnalysisResult(window_hours=self.config.thresholds.change_window_hours)
+
+        categories = data.id_categories.get("application")
+        if categories is None:
+            return result
+
+        spikes = self._spikes(data)
+        changes = self._changes(data, categories)
+
+        result.spikes_detected = len(spikes)
+        result.changes_considered = len(changes)
+
+        if len(spikes) == 0 or len(changes) == 0:
+            return result
+
+        matched = self._attribute(changes, spikes)
+        if len(matched) == 0:
+            return result
+
+        result.attributed_changes = len(matched)
+        result.attributed_spikes = matched.groupby(["app_code", "bucket"]).ngroups
+        result.critical_count = int((matched["severity"] == "critical").sum())
+
+        for row in matched.head(self.config.max_findings_per_category).itertuples(index=False):
+            result.findings.append(ChangeImpactFinding(
+                change_id=str(row.change_id),
+                source=row.source,
+                application=categories[row.app_code],
+                block_name=row.block_name if pd.notna(row.block_name) else None,
+                changed_at=row.changed_at.isoformat(),
+                spike_at=row.bucket.isoformat(),
+                lag_minutes=round(row.lag / pd.Timedelta(minutes=1), 1),
+                spike_signal=row.signal,
+                spike_value=round(row.value, 2),
+                baseline_value=round(row.baseline, 2),
+                spike_zscore=round(row.zscore, 2),
+                severity=row.severity,
+                culprit_score=round(row.culprit_score, 3),
+            ))
+
+        return result
+
+    def _spikes(self, data: PerformanceData) -> pd.DataFrame:
+        """Per-application time buckets whose latency or compute is far above baseline."""
+
+        frames = [
+            pd.DataFrame({
+                "app_code": df[app_col].cat.codes.to_numpy(),
+                "bucket": _utc(df["executionStartedAt"]).dt.floor(self.bucket),
+                "execution_time": df["execution_time"].to_numpy(),
+            })
+            for df, app_col in (
+                (data.executions if data.has_executions else None, "application"),
+                (data.views if data.has_views else None, "app_id"),
+            )
+            if df is not None and "executionStartedAt" in df.columns and app_col in df.columns
+        ]
+        if not frames:
+            return pd.DataFrame()
+
+        load = pd.concat(frames, ignore_index=True)
+        load = load[(load["app_code"] >= 0) & load["bucket"].notna()]
+
+        buckets = load.groupby(["app_code", "bucket"], sort=False)["execution_time"].agg(
+            latency="mean", compute="sum"
+        ).reset_index()
+
+        history = buckets.groupby("app_code", sort=False)["bucket"].transform("size")
+        buckets = buckets[history >= MIN_BUCKETS].reset_index(drop=True)
+        if len(buckets) == 0:
+            return pd.DataFrame()
+
+        # Robust z-score of each signal against the application's own buckets
+        zscores, baselines = {}, {}
+        for signal in ("latency", "compute"):
+            values = buckets[signal]
+            baseline = values.groupby(buckets["app_code"], sort=False).transform("median")
+            mad = (values - baseline).abs().groupby(buckets["app_code"], sort=False).transform("median")
+            zscores[signal] = (MAD_SCALE * (values - baseline) / mad.where(mad > 0)).fillna(-np.inf)
+            baselines[signal] = baseline
+
+        compute_wins = zscores["compute"] > zscores["latency"]
+        buckets["signal"] = np.where(compute_wins, "compute", "latency")
+        buckets["zscore"] = np.where(compute_wins, zscores["compute"], zscores["latency"])
+        buckets["value"] = np.where(compute_wins, buckets["compute"], buckets["latency"])
+        buckets["baseline"] = np.where(compute_wins, baselines["compute"], baselines["latency"])
+
+        spikes = buckets[buckets["zscore"] >= self.thresholds.anomaly_zscore.watch]
+        bucket = spikes["bucket"].astype("datetime64[ns, UTC]")
+        return spikes.assign(bucket=bucket)
+
+    def _changes(self, data: PerformanceData, categories: pd.Index) -> pd.DataFrame:
+        """One row per change event from armset executions and the audit log."""
+
+        frames = []
+
+        armset = data.armset if data.has_armset else None
+        if armset is not None and {"changeId", "app_id", "executionStartedAt"} <= set(armset.columns):
+            armset = armset[armset["changeId"].notna()]
+            aggregations = {"changed_at": ("changed_at", "min"), "app_code": ("app_code", "first")}
+            if "blockName" in armset.columns:
+                aggregations["block_name"] = ("blockName", "first")
+
+            changes = armset.assign(
+                changed_at=_utc(armset["executionStartedAt"]),
+                app_code=armset["app_id"].cat.codes,
+            ).groupby("changeId", observed=True, sort=False).agg(**aggregations).reset_index()
+
+            frames.append(pd.DataFrame({
+                "change_id": changes["changeId"].astype(str).to_numpy(),
+                "changed_at": changes["changed_at"].to_numpy(),
+                "app_code": changes["app_code"].to_numpy(),
+                "block_name": changes["block_name"].astype(object).to_numpy() if "block_name" in changes else None,
+                "source": "armset",
+            }))
+
+        events = data.audit_events
+        if events is not None and len(events) > 0:
+            events = events[events["event_type"].isin(CHANGE_EVENT_TYPES)]
+            frames.append(pd.DataFrame({
+                "change_id": events["event_id"].astype(str).to_numpy(),
+                "changed_at": _utc(events["event_timestamp"]).to_numpy(),
+                "app_code": categories.get_indexer(events["application_id"].astype(str)),
+                "block_name": None,
+                "source": "audit_log",
+            }))
+
+        if not frames:
+            return pd.DataFrame()
+
+        changes = pd.concat(frames, ignore_index=True)
+        changes["changed_at"] = pd.to_datetime(changes["changed_at"], utc=True).astype("datetime64[ns, UTC]")
+        return changes[(changes["app_code"] >= 0) & changes["changed_at"].notna()]
+
+    def _attribute(self, changes: pd.DataFrame, spikes: pd.DataFrame) -> pd.DataFrame:
+        """Join each change to the first spike in its application within the window.
+
+        Spikes are keyed on their bucket start, so only buckets that start at
+        or after the change match: a bucket the change falls in may hold
+        latency from before it, and is not blamed on it.
+        """
+
+        changes = changes.assign(app_code=changes["app_code"].astype(np.int64))
+        spikes = spikes.assign(app_code=spikes["app_code"].astype(np.int64))
+
+        matched = pd.merge_asof(
+            changes.sort_values("changed_at"),
+            spikes.sort_values("bucket"),
+            left_on="changed_at",
+            right_on="bucket",
+            by="app_code",
+            direction="forward",
+            tolerance=self.window,
+        )
+        matched = matched[matched["zscore"].notna()].copy()
+        if len(matched) == 0:
+            return matched
+
+        # Closer changes are likelier culprits; blame is shared among the
+        # changes that precede the same spike
+        matched["lag"] = matched["bucket"] - matched["changed_at"]
+        proximity = 1 - matched["lag"] / self.window
+        suspects = matched.groupby(["app_code", "bucket"], sort=False)["change_id"].transform("size")
+        matched["culprit_score"] = matched["zscore"] * proximity / suspects
+        matched["severity"] = classify_severity(matched["zscore"], self.thresholds.anomaly_zscore)
+
+        return matched.sort_values(
+            ["culprit_score", "changed_at"], ascending=[False, True], kind="stable"
+        )
@@ -5,13 +5,16 @@ Complexity analyzer for dimensional analysis.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..config import Config
 from ..data_loader import PerformanceData
+from ..score_tiers import AVG_DIMENSIONS, HIGH_COMPLEXITY_PCT
+from .performance_analyzer import classify_severity, per_application
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplexityFinding:
     """A complexity finding (high-dimension metric)."""
 
@@ -77,7 +80,8 @@ class ComplexityAnalyzer:
 
         # Get unique metrics with their dimension count
         metric_dims = df_with_dims.groupby(
-            ["application", "metric_id", "metric_name"]
+            ["application", "metric_id", "metric_name"],
+            observed=True,
         ).agg({
             "nb_dims": "first",
             "execution_time": "mean",
@@ -121,40 +125,72 @@ class ComplexityAnalyzer:
                 )
 
         # Find high-complexity metrics
-        for _, row in metric_dims.iterrows():
-            dims = int(row["dimensions"])
-
-            severity = None
-            if dims >= self.thresholds.critical:
-                severity = "critical"
-                result.critical_count += 1
-            elif dims >= self.thresholds.warning:
-                severity = "warning"
-                result.warning_count += 1
-            elif dims >= self.thresholds.watch:
-                severity = "watch"
-                result.watch_count += 1
-
-            if severity:
-                result.findings.append(ComplexityFinding(
-                    metric_id=row["metric_id"],
-                    metric_name=row["metric_name"],
-                    application=row["application"],
-                    dimensions=dims,
-                    severity=severity,
-                    avg_execution_time=round(row["avg_time"], 2) if pd.notna(row["avg_time"]) else 0,
-                    avg_computed_rows=round(row["avg_rows"], 0) if pd.notna(row["avg_rows"]) else None,
-                ))
-
-        # Sort findings by dimensions (highest first)
-        result.findings.sort(key=lambda f: (-f.dimensions, -f.avg_execution_time))
-        result.findings = result.findings[:self.config.max_findings_per_category]
+        metric_dims["dimensions"] = metric_dims["dimensions"].astype(int)
+        metric_dims["severity"] = classify_severity(metric_dims["dimensions"], self.thresholds)
+        counts = metric_dims["severity"].value_counts()
+        result.critical_count = int(counts.get("critical", 0))
+        result.warning_count = int(counts.get("warning", 0))
+        result.watch_count = int(counts.get("watch", 0))
+
+        # Sort findings by dimensions (highest first), materializing only those reported
+        flagged = metric_dims[metric_dims["severity"] != ""]
+        flagged = flagged.assign(sort_time=flagged["avg_time"].round(2).fillna(0))
+        flagged = flagged.sort_values(
+            ["dimensions", "sort_time"], ascending=[False, False], kind="stable"
+        )
+
+        for row in flagged.head(self.config.max_findings_per_category).itertuples(index=False):
+            result.findings.append(ComplexityFinding(
+                metric_id=row.metric_id,
+                metric_name=row.metric_name,
+                application=row.application,
+                dimensions=int(row.dimensions),
+                severity=row.severity,
+                avg_execution_time=round(row.avg_time, 2) if pd.notna(row.avg_time) else 0,
+                avg_computed_rows=round(row.avg_rows, 0) if pd.notna(row.avg_rows) else None,
+            ))
 
         # Calculate score
         result.score = self._calculate_score(result)
 
         return result
 
+    def score_by_application(self, data: PerformanceData, applications: pd.Index) -> pd.Series:
+        """Complexity score for every application at once (see ``_calculate_score``)."""
+
+        max_score = self.config.scoring.complexity_weight
+
+        if not data.has_executions:
+            return pd.Series(float(max_score), index=applications)
+
+        df = data.executions
+        df_with_dims = df[df["nb_dims"].notna() & (df["nb_dims"] > 0)]
+
+        metric_dims = df_with_dims.groupby(
+            ["application", "metric_id", "metric_name"], observed=True
+        )["nb_dims"].first().reset_index()
+        metric_dims["high"] = np.isin(
+            classify_severity(metric_dims["nb_dims"].astype(int), self.thresholds),
+            ["critical", "warning"],
+        )
+
+        by_app = metric_dims.groupby("application", observed=True).agg(
+            total=("nb_dims", "size"),
+            high=("high", "sum"),
+            avg_dims=("nb_dims", "mean"),
+        )
+        high_complexity_pct = by_app["high"] / by_app["total"] * 100
+
+        app_scores = (
+            max_score
+            * HIGH_COMPLEXITY_PCT(high_complexity_pct.to_numpy())
+            * AVG_DIMENSIONS(by_app["avg_dims"].round(2).to_numpy())
+        )
+        app_scores = pd.Series(np.round(np.minimum(max_score, app_scores), 1), index=by_app.index)
+
+        # Applications without dimension info keep the full score
+        return per_application(app_scores, applications, float(max_score))
+
     def _calculate_score(self, result: ComplexityAnalysisResult) -> float:
         """Calculate complexity score (0-25 points)."""
 
@@ -167,21 +203,9 @@ class ComplexityAnalyzer:
         high_complexity_count = result.critical_count + result.warning_count
         high_complexity_pct = high_complexity_count / result.total_metrics * 100
 
-        if high_complexity_pct <= 5:
-            score = max_score
-        elif high_complexity_pct <= 10:
-            score = max_score * 0.85
-        elif high_complexity_pct <= 20:
-            score = max_score * 0.7
-        elif high_complexity_pct <= 30:
-            score = max_score * 0.5
-        else:
-            score = max_score * 0.3
+        score = max_score * HIGH_COMPLEXITY_PCT(high_complexity_pct)
 
         # Bonus/penalty based on average dimensions
-        if result.avg_dimensions <= 3:
-            score = min(max_score, score * 1.1)
-        elif result.avg_dimensions >= 6:
-            score *= 0.85
+        score *= AVG_DIMENSIONS(result.avg_dimensions)
 
         return round(min(max_score, score), 1)
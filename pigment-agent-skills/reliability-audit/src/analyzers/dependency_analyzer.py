@@ -0,0 +1,166 @@
+"""
+Dependency analyzer: metric dependency graph from backing metrics.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+from ..dependency_graph import DependencyGraph
+
+
+# Block ID and name columns per frame, in the order node attributes are taken
+BLOCK_COLUMNS = {
+    "executions": ("metric_id", "metric_name", "application"),
+    "armset": ("blockId", "blockName", "app_id"),
+    "views": ("blockId", "blockName", "app_id"),
+}
+
+
+@dataclass(slots=True)
+class DependencyRoot:
+    """An upstream block whose cost flows into the blocks that depend on it."""
+
+    block_id: str
+    block_name: str
+    application: str
+    own_execution_time: float
+    downstream_execution_time: float  # Own plus every distinct dependent's
+    direct_dependents: int
+
+
+@dataclass(slots=True)
+class CriticalPath:
+    """The costliest chain of dependencies ending at a block."""
+
+    block_id: str
+    block_name: str
+    application: str
+    length: int  # Blocks on the path
+    path_execution_time: float
+    path: str  # Block names, upstream first
+
+
+@dataclass
+class DependencyAnalysisResult:
+    """Results of dependency graph analysis."""
+
+    # Graph shape
+    blocks: int = 0
+    dependencies: int = 0
+    roots: int = 0
+    depth: int = 0
+    cyclic_blocks: int = 0
+
+    # Findings (costliest first)
+    root_findings: List[DependencyRoot] = field(default_factory=list)
+    critical_paths: List[CriticalPath] = field(default_factory=list)
+
+
+class DependencyAnalyzer:
+    """Build the backing-metric graph and rank roots and critical paths by cost."""
+
+    def __init__(self, config: Config):
+        self.config = config
+
+    def analyze(self, data: PerformanceData) -> DependencyAnalysisResult:
+        """Run dependency analysis on the data."""
+
+        result = DependencyAnalysisResult()
+
+        categories = data.id_categories.get("block")
+        armset = data.armset if data.has_armset else None
+        if categories is None or armset is None or "backingMetricId" not in armset.columns:
+            return result
+
+        src = armset["backingMetricId"].cat.codes.to_numpy()
+        dst = armset["blockId"].cat.codes.to_numpy()
+        linked = (src >= 0) & (dst >= 0)
+        if not linked.any():
+            return result
+
+        graph = DependencyGraph(src[linked], dst[linked], len(categories))
+        in_degree, out_degree = graph.in_degree(), graph.out_degree()
+        in_graph = (in_degree > 0) | (out_degree > 0)
+
+        result.blocks = int(in_graph.sum())
+        result.dependencies = graph.n_edges
+        result.depth = len(graph.levels) - 1
+        result.cyclic_blocks = len(graph.cyclic_nodes())
+
+        cost = self._block_cost(data, len(categories))
+        names, applications = self._block_attributes(data, categories)
+        limit = self.config.max_findings_per_category
+
+        # Roots, by the cost of everything that depends on them
+        roots = np.flatnonzero((in_degree == 0) & (out_degree > 0))
+        downstream = graph.downstream_cost(cost, roots)
+        result.roots = len(roots)
+        top = np.argsort(-downstream, kind="stable")[:limit]
+        for node, total in zip(roots[top], downstream[top]):
+            result.root_findings.append(DependencyRoot(
+                block_id=categories[node],
+                block_name=names[node],
+                application=applications[node],
+                own_execution_time=round(float(cost[node]), 2),
+                downstream_execution_time=round(float(total), 2),
+                direct_dependents=int(out_degree[node]),
+            ))
+
+        # Critical paths, ending at the blocks nothing else depends on
+        path_cost, parent = graph.longest_paths(cost)
+        sinks = np.flatnonzero((out_degree == 0) & (in_degree > 0) & ~np.isnan(path_cost))
+        sinks = sinks[np.argsort(-path_cost[sinks], kind="stable")][:limit]
+        for node in sinks:
+            path = graph.trace(parent, node)
+            result.critical_paths.append(CriticalPath(
+                block_id=categories[node],
+                block_name=names[node],
+                application=applications[node],
+                length=len(path),
+                path_execution_time=round(float(path_cost[node]), 2),
+                path=" → ".join(names[step] for step in path),
+            ))
+
+        return result
+
+    def _block_cost(self, data: PerformanceData, n_blocks: int) -> np.ndarray:
+        """Total execution time recorded against each block code, in any frame."""
+
+        cost = np.zeros(n_blocks)
+        for name, (id_col, _, _) in BLOCK_COLUMNS.items():
+            df = data.frames().get(name)
+            if df is None or id_col not in df.columns or "execution_time" not in df.columns:
+                continue
+            codes = df[id_col].cat.codes.to_numpy()
+            times = df["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+            known = (codes >= 0) & ~np.isnan(times)
+            cost += np.bincount(codes[known], weights=times[known], minlength=n_blocks)
+        return cost
+
+    def _block_attributes(self, data: PerformanceData, categories: pd.Index):
+        """Name and application of each block code, from the first frame that has it."""
+
+        names = pd.Series(pd.NA, index=range(len(categories)), dtype=object)
+        applications = pd.Series(pd.NA, index=range(len(categories)), dtype=object)
+
+        for name, (id_col, name_col, app_col) in BLOCK_COLUMNS.items():
+            df = data.frames().get(name)
+            if df is None or not {id_col, name_col, app_col} <= set(df.columns):
+                continue
+            firsts = pd.DataFrame({
+                "code": df[id_col].cat.codes.to_numpy(),
+                "name": df[name_col].astype(object).to_numpy(),
+                "application": df[app_col].astype(object).to_numpy(),
+            })
+            firsts = firsts[firsts["code"] >= 0].drop_duplicates("code").set_index("code")
+            names = names.fillna(firsts["name"])
+            applications = applications.fillna(firsts["application"])
+
+        # Blocks seen only as a backing metric are named by their ID
+        names = names.fillna(pd.Series(categories, index=names.index))
+        return names.astype(str).tolist(), applications.fillna("").astype(str).tolist()
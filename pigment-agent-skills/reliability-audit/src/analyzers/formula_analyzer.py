@@ -0,0 +1,130 @@
+"""
+Formula analyzer: hotspots by macroFormula fingerprint across blocks and apps.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+from .performance_analyzer import classify_severity
+
+
+# Blocks a formula must appear in to count as shared (and be flagged)
+MIN_SHARED_BLOCKS = 3
+
+
+@dataclass(slots=True)
+class FormulaHotspot:
+    """A formula shape and the compute it costs wherever it is used."""
+
+    formula: str
+    applications: int
+    blocks: int
+    execution_count: int
+    total_execution_time: float
+    avg_execution_time: Optional[float]
+    p95_execution_time: Optional[float]
+    rows_per_ms: Optional[float]
+    shared: bool
+    severity: str  # "watch", "warning", "critical", or "" when not flagged
+
+
+@dataclass
+class FormulaAnalysisResult:
+    """Results of formula hotspot analysis."""
+
+    # Coverage
+    formulas: int = 0
+    shared_formulas: int = 0
+    shared_time_pct: float = 0.0
+
+    # Shared formulas by severity
+    critical_count: int = 0
+    warning_count: int = 0
+    watch_count: int = 0
+
+    # Findings (most total compute first)
+    findings: List[FormulaHotspot] = field(default_factory=list)
+
+
+class FormulaAnalyzer:
+    """Rank formula fingerprints by compute and flag slow shared formulas."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.thresholds = config.thresholds.metric_execution
+
+    def analyze(self, data: PerformanceData) -> FormulaAnalysisResult:
+        """Run formula analysis on the data."""
+
+        result = FormulaAnalysisResult()
+
+        armset = data.armset if data.has_armset else None
+        if armset is None or not {"macroFormula", "execution_time"} <= set(armset.columns):
+            return result
+
+        # Executions without a recorded time are left out, so a formula
+        # never timed is not ranked as if it cost nothing
+        df = armset[armset["macroFormula"].notna() & armset["execution_time"].notna()]
+        if len(df) == 0:
+            return result
+
+        # Blocks are told apart by app, ID and name, so exports without
+        # block IDs still count them by name
+        block_cols = [col for col in ("app_id", "blockId", "blockName") if col in df.columns]
+        per_formula = df.groupby("macroFormula", observed=True, sort=False)
+        stats = per_formula.agg(
+            execution_count=("execution_time", "size"),
+            total_time=("execution_time", "sum"),
+            avg_time=("execution_time", "mean"),
+        )
+        stats["p95_time"] = per_formula["execution_time"].quantile(0.95)
+        stats["blocks"] = (
+            df[["macroFormula", *block_cols]].drop_duplicates()
+            .groupby("macroFormula", observed=True, sort=False).size()
+        )
+        stats["applications"] = per_formula["app_id"].nunique() if "app_id" in df.columns else 1
+        if "computed_rows" in df.columns:
+            rows = per_formula["computed_rows"].sum()
+            stats["rows_per_ms"] = rows / stats["total_time"].where(stats["total_time"] > 0)
+        else:
+            stats["rows_per_ms"] = np.nan
+
+        stats["shared"] = stats["blocks"] >= MIN_SHARED_BLOCKS
+        stats["severity"] = np.where(stats["shared"], classify_severity(stats["p95_time"], self.thresholds), "")
+
+        result.formulas = len(stats)
+        result.shared_formulas = int(stats["shared"].sum())
+        total_time = stats["total_time"].sum()
+        if total_time > 0:
+            result.shared_time_pct = round(stats.loc[stats["shared"], "total_time"].sum() / total_time * 100, 1)
+
+        counts = stats["severity"].value_counts()
+        result.critical_count = int(counts.get("critical", 0))
+        result.warning_count = int(counts.get("warning", 0))
+        result.watch_count = int(counts.get("watch", 0))
+
+        top = stats.sort_values("total_time", ascending=False, kind="stable").reset_index()
+        for row in top.head(self.config.max_findings_per_category).itertuples(index=False):
+            result.findings.append(FormulaHotspot(
+                formula=str(row.macroFormula),
+                applications=int(row.applications),
+                blocks=int(row.blocks),
+                execution_count=int(row.execution_count),
+                total_execution_time=round(row.total_time, 2),
+                avg_execution_time=_rounded(row.avg_time, 2),
+                p95_execution_time=_rounded(row.p95_time, 2),
+                rows_per_ms=_rounded(row.rows_per_ms, 2),
+                shared=bool(row.shared),
+                severity=row.severity,
+            ))
+
+        return result
+
+
+def _rounded(value, digits: int) -> Optional[float]:
+    return round(float(value), digits) if pd.notna(value) else None
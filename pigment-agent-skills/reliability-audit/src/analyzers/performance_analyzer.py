@@ -5,13 +5,40 @@ Performance analyzer for metric and view execution times.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
-from ..config import Config
+from ..config import Config, PerformanceThresholds
 from ..data_loader import PerformanceData
+from ..score_tiers import AVG_EXECUTION_TIME
 
 
-@dataclass
+SEVERITY_ORDER = {"critical": 0, "warning": 1, "watch": 2}
+
+
+def classify_severity(values: pd.Series, thresholds: PerformanceThresholds) -> np.ndarray:
+    """Label each value "critical", "warning", "watch" or "" (below watch / missing)."""
+
+    values = values.to_numpy(dtype=float)
+    return np.select(
+        [
+            values >= thresholds.critical,
+            values >= thresholds.warning,
+            values >= thresholds.watch,
+        ],
+        ["critical", "warning", "watch"],
+        default="",
+    )
+
+
+def per_application(values: pd.Series, applications: pd.Index, fill) -> pd.Series:
+    """Align a per-application series (possibly categorical-indexed) to ``applications``."""
+
+    values = values.set_axis(values.index.astype(str))
+    return values.reindex(applications, fill_value=fill)
+
+
+@dataclass(slots=True)
 class PerformanceFinding:
     """A single performance finding."""
 
@@ -23,6 +50,7 @@ class PerformanceFinding:
     avg_execution_time: float
     max_execution_time: float
     execution_count: int
+    total_execution_time: float = 0.0
     avg_computed_rows: Optional[float] = None
     dimensions: Optional[int] = None
 
@@ -90,19 +118,6 @@ class PerformanceAnalyzer:
         # Calculate score
         result.score = self._calculate_score(result)
 
-        # Sort findings by severity and execution time
-        severity_order = {"critical": 0, "warning": 1, "watch": 2}
-        result.metric_findings.sort(
-            key=lambda f: (severity_order.get(f.severity, 3), -f.avg_execution_time)
-        )
-        result.view_findings.sort(
-            key=lambda f: (severity_order.get(f.severity, 3), -f.avg_execution_time)
-        )
-
-        # Limit findings
-        result.metric_findings = result.metric_findings[:self.config.max_findings_per_category]
-        result.view_findings = result.view_findings[:self.config.max_findings_per_category]
-
         return result
 
     def _analyze_metrics(self, df: pd.DataFrame, result: PerformanceAnalysisResult):
@@ -121,52 +136,44 @@ class PerformanceAnalyzer:
 
         # Group by metric
         metric_stats = df.groupby(
-            ["application", "metric_id", "metric_name"]
+            ["application", "metric_id", "metric_name"],
+            observed=True,
         ).agg({
-            "execution_time": ["mean", "max", "count"],
+            "execution_time": ["mean", "max", "count", "sum"],
             "computed_rows": "mean",
             "nb_dims": "first",
         }).reset_index()
 
         metric_stats.columns = [
             "application", "metric_id", "metric_name",
-            "avg_time", "max_time", "exec_count",
+            "avg_time", "max_time", "exec_count", "total_time",
             "avg_rows", "dimensions"
         ]
 
         # Find slow metrics
         thresholds = self.thresholds.metric_execution
 
-        for _, row in metric_stats.iterrows():
-            avg_time = row["avg_time"]
-
-            if pd.isna(avg_time):
-                continue
-
-            severity = None
-            if avg_time >= thresholds.critical:
-                severity = "critical"
-                result.metric_critical_count += 1
-            elif avg_time >= thresholds.warning:
-                severity = "warning"
-                result.metric_warning_count += 1
-            elif avg_time >= thresholds.watch:
-                severity = "watch"
-                result.metric_watch_count += 1
-
-            if severity:
-                result.metric_findings.append(PerformanceFinding(
-                    entity_type="metric",
-                    entity_id=row["metric_id"],
-                    entity_name=row["metric_name"],
-                    application=row["application"],
-                    severity=severity,
-                    avg_execution_time=round(avg_time, 2),
-                    max_execution_time=round(row["max_time"], 2),
-                    execution_count=int(row["exec_count"]),
-                    avg_computed_rows=round(row["avg_rows"], 0) if pd.notna(row["avg_rows"]) else None,
-                    dimensions=int(row["dimensions"]) if pd.notna(row["dimensions"]) else None,
-                ))
+        metric_stats["severity"] = classify_severity(metric_stats["avg_time"], thresholds)
+        counts = metric_stats["severity"].value_counts()
+        result.metric_critical_count += int(counts.get("critical", 0))
+        result.metric_warning_count += int(counts.get("warning", 0))
+        result.metric_watch_count += int(counts.get("watch", 0))
+
+        # Only the reported findings are materialized
+        for row in self._top_flagged(metric_stats).itertuples(index=False):
+            result.metric_findings.append(PerformanceFinding(
+                entity_type="metric",
+                entity_id=row.metric_id,
+                entity_name=row.metric_name,
+                application=row.application,
+                severity=row.severity,
+                avg_execution_time=round(row.avg_time, 2),
+                max_execution_time=round(row.max_time, 2),
+                execution_count=int(row.exec_count),
+                total_execution_time=round(row.total_time, 2),
+                avg_computed_rows=round(row.avg_rows, 0) if pd.notna(row.avg_rows) else None,
+                dimensions=int(row.dimensions) if pd.notna(row.dimensions) else None,
+            ))
 
     def _analyze_views(self, df: pd.DataFrame, result: PerformanceAnalysisResult):
         """Analyze view render performance."""
@@ -175,15 +182,16 @@ class PerformanceAnalyzer:
 
         # Group by view
         view_stats = df.groupby(
-            ["app_id", "blockId", "blockName"]
+            ["app_id", "blockId", "blockName"],
+            observed=True,
         ).agg({
-            "execution_time": ["mean", "max", "count"],
+            "execution_time": ["mean", "max", "count", "sum"],
             "computed_rows": "mean",
         }).reset_index()
 
         view_stats.columns = [
             "app_id", "block_id", "block_name",
-            "avg_time", "max_time", "exec_count", "avg_rows"
+            "avg_time", "max_time", "exec_count", "total_time", "avg_rows"
         ]
 
         result.view_total_executions += len(df)
@@ -196,35 +204,69 @@ class PerformanceAnalyzer:
             result.view_p95_execution_time_ms = exec_times.quantile(0.95)
             result.view_p99_execution_time_ms = exec_times.quantile(0.99)
 
-        for _, row in view_stats.iterrows():
-            avg_time = row["avg_time"]
-
-            if pd.isna(avg_time):
-                continue
-
-            severity = None
-            if avg_time >= thresholds.critical:
-                severity = "critical"
-                result.view_critical_count += 1
-            elif avg_time >= thresholds.warning:
-                severity = "warning"
-                result.view_warning_count += 1
-            elif avg_time >= thresholds.watch:
-                severity = "watch"
-                result.view_watch_count += 1
-
-            if severity:
-                result.view_findings.append(PerformanceFinding(
-                    entity_type="view",
-                    entity_id=row["block_id"],
-                    entity_name=row["block_name"],
-                    application=row["app_id"],
-                    severity=severity,
-                    avg_execution_time=round(avg_time, 2),
-                    max_execution_time=round(row["max_time"], 2),
-                    execution_count=int(row["exec_count"]),
-                    avg_computed_rows=round(row["avg_rows"], 0) if pd.notna(row["avg_rows"]) else None,
-                ))
+        view_stats["severity"] = classify_severity(view_stats["avg_time"], thresholds)
+        counts = view_stats["severity"].value_counts()
+        result.view_critical_count += int(counts.get("critical", 0))
+        result.view_warning_count += int(counts.get("warning", 0))
+        result.view_watch_count += int(counts.get("watch", 0))
+
+        for row in self._top_flagged(view_stats).itertuples(index=False):
+            result.view_findings.append(PerformanceFinding(
+                entity_type="view",
+                entity_id=row.block_id,
+                entity_name=row.block_name,
+                application=row.app_id,
+                severity=row.severity,
+                avg_execution_time=round(row.avg_time, 2),
+                max_execution_time=round(row.max_time, 2),
+                execution_count=int(row.exec_count),
+                total_execution_time=round(row.total_time, 2),
+                avg_computed_rows=round(row.avg_rows, 0) if pd.notna(row.avg_rows) else None,
+            ))
+
+    def _top_flagged(self, stats: pd.DataFrame) -> pd.DataFrame:
+        """Return flagged entities by severity, then slowest first, capped for reporting."""
+
+        flagged = stats[stats["severity"] != ""]
+        flagged = flagged.assign(
+            severity_rank=flagged["severity"].map(SEVERITY_ORDER),
+            sort_time=flagged["avg_time"].round(2),
+        )
+        flagged = flagged.sort_values(
+            ["severity_rank", "sort_time"], ascending=[True, False], kind="stable"
+        )
+        return flagged.head(self.config.max_findings_per_category)
+
+    def score_by_application(self, data: PerformanceData, applications: pd.Index) -> pd.Series:
+        """Performance score for every application at once (see ``_calculate_score``)."""
+
+        max_score = self.config.scoring.performance_weight
+        avg_time = pd.Series(0.0, index=applications)
+        critical_count = pd.Series(0, index=applications)
+
+        if data.has_executions:
+            df = data.executions
+            avg_time = per_application(
+                df.groupby("application", observed=True)["execution_time"].mean().fillna(0),
+                applications, 0.0,
+            )
+
+            metric_avg = df.groupby(
+                ["application", "metric_id", "metric_name"], observed=True
+            )["execution_time"].mean()
+            critical = metric_avg[
+                classify_severity(metric_avg, self.thresholds.metric_execution) == "critical"
+            ]
+            critical_count = per_application(
+                critical.groupby(level="application", observed=True).size(), applications, 0
+            )
+
+        base_score = max_score * AVG_EXECUTION_TIME(avg_time.to_numpy())
+        critical_penalty = np.minimum(critical_count.to_numpy() * 2, max_score * 0.3)
+
+        return pd.Series(
+            np.maximum(0, np.round(base_score - critical_penalty, 1)), index=applications
+        )
 
     def _calculate_score(self, result: PerformanceAnalysisResult) -> float:
         """Calculate performance score (0-25 points)."""
@@ -232,20 +274,7 @@ class PerformanceAnalyzer:
         max_score = self.config.scoring.performance_weight
 
         # Base score on average execution time
-        avg_time = result.metric_avg_execution_time_ms
-
-        if avg_time < 1000:
-            base_score = max_score
-        elif avg_time < 2000:
-            base_score = max_score * 0.9
-        elif avg_time < 3000:
-            base_score = max_score * 0.8
-        elif avg_time < 5000:
-            base_score = max_score * 0.6
-        elif avg_time < 10000:
-            base_score = max_score * 0.4
-        else:
-            base_score = max_score * 0.2
+        base_score = max_score * AVG_EXECUTION_TIME(result.metric_avg_execution_time_ms)
 
         # Penalty for critical issues
         critical_penalty = min(result.metric_critical_count * 2, max_score * 0.3)
@@ -5,13 +5,23 @@ Scoping analyzer for calculation optimization assessment.
 from dataclasses import dataclass, field
 from typing import List, Dict
 
+import numpy as np
 import pandas as pd
 
 from ..config import Config
 from ..data_loader import PerformanceData
+from ..score_tiers import SCOPED_PCT, no_change_penalty
+from .performance_analyzer import per_application
 
 
-@dataclass
+# Assumed savings when no FullyScoped history exists to learn from
+DEFAULT_SAVINGS_FRACTION = 0.5
+
+# Executions needed at each scoped level before a metric's own ratio is trusted
+MIN_SAMPLES_PER_LEVEL = 3
+
+
+@dataclass(slots=True)
 class ScopingFinding:
     """A scoping optimization opportunity."""
 
@@ -23,6 +33,8 @@ class ScopingFinding:
     total_execution_time: float
     execution_count: int
     potential_savings_pct: float  # Estimated savings if scoped
+    potential_savings_ms: float = 0.0
+    savings_basis: str = "default"  # "metric", "application", "dimensions" or "default"
 
 
 @dataclass
@@ -44,6 +56,7 @@ class ScopingAnalysisResult:
     # Time impact
     no_change_total_time_ms: float = 0.0
     potential_savings_ms: float = 0.0
+    potential_savings_pct: float = 0.0  # Of NoChange time, from the learned model
 
     # Optimization candidates
     findings: List[ScopingFinding] = field(default_factory=list)
@@ -67,18 +80,15 @@ class ScopingAnalyzer:
         if not data.has_executions:
             return result
 
-        df = data.executions
-
-        # Filter to formula executions only
-        formula_df = df[df["jobType"] == "Formula"].copy()
+        cube = data.execution_cube(self.config)
+        formula = cube.cells["jobType"] == "Formula"
 
-        if len(formula_df) == 0:
+        result.total_formula_executions = int(cube.cells.loc[formula, "count"].sum())
+        if result.total_formula_executions == 0:
             return result
 
-        result.total_formula_executions = len(formula_df)
-
         # Count by scoped level
-        scoped_counts = formula_df["scoped_level"].value_counts()
+        scoped_counts = cube.rollup(["scoped_level"], formula)["count"]
 
         result.fully_scoped_count = scoped_counts.get("FullyScoped", 0)
         result.partially_scoped_count = scoped_counts.get("PartiallyScoped", 0)
@@ -103,30 +113,30 @@ class ScopingAnalyzer:
                 result.no_change_count / applicable_count * 100, 1
             )
 
-        # Find optimization opportunities (NoChange with high execution time)
-        no_change_df = formula_df[formula_df["scoped_level"] == "NoChange"]
-
-        if len(no_change_df) > 0:
-            result.no_change_total_time_ms = no_change_df["execution_time"].sum()
+        # Find optimization opportunities (NoChange with high execution time);
+        # these need per-metric medians, so they come from the raw rows
+        df = data.executions
+        metric_stats = self._metric_level_stats(df[df["jobType"] == "Formula"])
+        no_change = metric_stats[metric_stats["nochange_count"] > 0].copy()
 
-            # Estimate potential savings (assume 50% reduction if scoped)
-            result.potential_savings_ms = result.no_change_total_time_ms * 0.5
+        if len(no_change) > 0:
+            result.no_change_total_time_ms = no_change["nochange_total"].sum()
 
-            # Group by metric and find top candidates
-            metric_stats = no_change_df.groupby(
-                ["application", "metric_id", "metric_name"]
-            ).agg({
-                "execution_time": ["mean", "sum", "count"],
-            }).reset_index()
+            # Estimate savings from the observed FullyScoped vs NoChange ratio
+            no_change["savings_fraction"], no_change["savings_basis"] = self._savings_fractions(
+                metric_stats, no_change
+            )
+            no_change["savings_ms"] = no_change["nochange_total"] * no_change["savings_fraction"]
+            result.potential_savings_ms = no_change["savings_ms"].sum()
 
-            metric_stats.columns = [
-                "application", "metric_id", "metric_name",
-                "avg_time", "total_time", "exec_count"
-            ]
+            if result.no_change_total_time_ms > 0:
+                result.potential_savings_pct = round(
+                    result.potential_savings_ms / result.no_change_total_time_ms * 100, 1
+                )
 
             # Filter to metrics worth optimizing (> 3s average)
-            candidates = metric_stats[metric_stats["avg_time"] > 3000]
-            candidates = candidates.sort_values("total_time", ascending=False)
+            candidates = no_change[no_change["nochange_avg"] > 3000]
+            candidates = candidates.sort_values("nochange_total", ascending=False)
 
             for _, row in candidates.head(self.config.max_findings_per_category).iterrows():
                 result.findings.append(ScopingFinding(
@@ -134,10 +144,12 @@ class ScopingAnalyzer:
                     metric_name=row["metric_name"],
                     application=row["application"],
                     scoped_level="NoChange",
-                    avg_execution_time=round(row["avg_time"], 2),
-                    total_execution_time=round(row["total_time"], 2),
-                    execution_count=int(row["exec_count"]),
-                    potential_savings_pct=50.0,  # Estimated
+                    avg_execution_time=round(row["nochange_avg"], 2),
+                    total_execution_time=round(row["nochange_total"], 2),
+                    execution_count=int(row["nochange_count"]),
+                    potential_savings_pct=round(row["savings_fraction"] * 100, 1),
+                    potential_savings_ms=round(row["savings_ms"], 2),
+                    savings_basis=row["savings_basis"],
                 ))
 
         # Calculate score
@@ -145,6 +157,40 @@ class ScopingAnalyzer:
 
         return result
 
+    def score_by_application(self, data: PerformanceData, applications: pd.Index) -> pd.Series:
+        """Scoping score for every application at once (see ``_calculate_score``)."""
+
+        max_score = self.config.scoring.optimization_weight
+        scores = pd.Series(float(max_score), index=applications)
+
+        if not data.has_executions:
+            return scores
+
+        cube = data.execution_cube(self.config)
+        formula = cube.cells["jobType"] == "Formula"
+        if not formula.any():
+            return scores
+
+        counts = cube.rollup(["application", "scoped_level"], formula)["count"].unstack(fill_value=0)
+        counts = counts.reindex(
+            index=cube.rollup(["application"], formula).index,
+            columns=["FullyScoped", "PartiallyScoped", "NoChange"],
+            fill_value=0,
+        )
+        applicable = counts.sum(axis=1).replace(0, np.nan)
+        pct = counts.div(applicable, axis=0).mul(100).round(1).fillna(0)
+
+        scoped_pct = pct["FullyScoped"] + pct["PartiallyScoped"] * 0.5
+        app_scores = (
+            max_score
+            * SCOPED_PCT(scoped_pct.to_numpy())
+            * no_change_penalty(self.thresholds)(pct["NoChange"].to_numpy())
+        )
+
+        # Applications without formula executions keep the full score
+        app_scores = pd.Series(np.round(app_scores, 1), index=pct.index)
+        return per_application(app_scores, applications, float(max_score))
+
     def _calculate_score(self, result: ScopingAnalysisResult) -> float:
         """Calculate scoping optimization score (0-25 points)."""
 
@@ -156,22 +202,82 @@ class ScopingAnalyzer:
 
         # Target is to have high scoping rate
         scoped_pct = result.fully_scoped_pct + (result.partially_scoped_pct * 0.5)
-
-        if scoped_pct >= 70:
-            score = max_score
-        elif scoped_pct >= 50:
-            score = max_score * 0.8
-        elif scoped_pct >= 30:
-            score = max_score * 0.6
-        elif scoped_pct >= 10:
-            score = max_score * 0.4
-        else:
-            score = max_score * 0.2
+        score = max_score * SCOPED_PCT(scoped_pct)
 
         # Penalty if too many NoChange executions
-        if result.no_change_pct > self.thresholds.non_scoped_critical:
-            score *= 0.7
-        elif result.no_change_pct > self.thresholds.non_scoped_warning:
-            score *= 0.85
+        score *= no_change_penalty(self.thresholds)(result.no_change_pct)
 
         return round(score, 1)
+
+    def _metric_level_stats(self, formula_df: pd.DataFrame) -> pd.DataFrame:
+        """Pivot formula executions into one row per metric with per-level stats."""
+
+        stats = formula_df[formula_df["scoped_level"].isin(["FullyScoped", "NoChange"])].groupby(
+            ["application", "metric_id", "metric_name", "scoped_level"],
+            observed=True,
+        ).agg(
+            avg=("execution_time", "mean"),
+            median=("execution_time", "median"),
+            total=("execution_time", "sum"),
+            count=("execution_time", "count"),
+            dims=("nb_dims", "first"),
+        ).unstack("scoped_level")
+
+        stats.columns = [f"{level.lower()}_{stat}" for stat, level in stats.columns]
+        stats = stats.reindex(columns=[
+            f"{level}_{stat}"
+            for level in ("fullyscoped", "nochange")
+            for stat in ("avg", "median", "total", "count", "dims")
+        ])
+        for col in ("fullyscoped_count", "nochange_count"):
+            stats[col] = stats[col].fillna(0)
+
+        dims = stats["nochange_dims"].fillna(stats["fullyscoped_dims"])
+        stats["dims_bucket"] = pd.cut(
+            dims,
+            bins=[
+                -float("inf"),
+                self.thresholds.dimensions.watch,
+                self.thresholds.dimensions.warning,
+                self.thresholds.dimensions.critical,
+                float("inf"),
+            ],
+            labels=False,
+        )
+
+        # Learned ratio only where both levels have enough history; medians
+        # keep a single slow run from dominating the estimate
+        learnable = (
+            (stats["fullyscoped_count"] >= MIN_SAMPLES_PER_LEVEL)
+            & (stats["nochange_count"] >= MIN_SAMPLES_PER_LEVEL)
+            & (stats["nochange_median"] > 0)
+        )
+        ratio = (stats["fullyscoped_median"] / stats["nochange_median"]).clip(0, 1)
+        stats["metric_savings"] = (1 - ratio).where(learnable)
+
+        return stats.reset_index()
+
+    def _savings_fractions(self, metric_stats: pd.DataFrame, no_change: pd.DataFrame):
+        """Resolve each NoChange metric's savings fraction with fallbacks.
+
+        Order: the metric's own ratio, its application's median, the median
+        for its dimension bucket, then the default assumption.
+        """
+
+        app_median = metric_stats.groupby("application", observed=True)["metric_savings"].median()
+        bucket_median = metric_stats.groupby("dims_bucket")["metric_savings"].median()
+
+        fallbacks = [
+            ("metric", no_change["metric_savings"]),
+            ("application", no_change["application"].map(app_median)),
+            ("dimensions", no_change["dims_bucket"].map(bucket_median)),
+        ]
+
+        fraction = pd.Series(DEFAULT_SAVINGS_FRACTION, index=no_change.index)
+        basis = pd.Series("default", index=no_change.index)
+        for name, values in reversed(fallbacks):
+            has_value = values.notna()
+            fraction = fraction.where(~has_value, values)
+            basis = basis.where(~has_value, name)
+
+        return fraction.astype(float), basis
@@ -0,0 +1,237 @@
+"""
+Worker scaling analyzer: throughput vs worker count for armset executions.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+
+
+# Executions (and distinct worker counts) a job type needs before its curve is fitted
+MIN_FIT_EXECUTIONS = 30
+MIN_WORKER_LEVELS = 2
+
+# Condition number above which a job type's normal equations are treated as
+# singular (e.g. a worker count or row count that never varies)
+MAX_CONDITION = 1e12
+
+# Rows per worker this far from the job type's typical load is mis-sized
+LOAD_FACTOR = 4
+
+
+@dataclass(slots=True)
+class WorkerScalingFit:
+    """Fitted scaling of one job type: time ~ rows^rows_exponent / workers^worker_exponent."""
+
+    job_type: str
+    executions: int
+    worker_levels: int
+    rows_exponent: float
+    worker_exponent: float  # 1 = linear speedup, 0 = no speedup
+    efficiency_at_2x: float  # Parallel efficiency of doubling the workers
+    typical_rows_per_worker: float
+
+
+@dataclass(slots=True)
+class WorkerScalingPoint:
+    """Observed throughput of one job type at one worker count."""
+
+    job_type: str
+    workers: int
+    executions: int
+    median_rows_per_ms: float
+    speedup: float  # vs the fewest workers, at the same row volume
+    parallel_efficiency: float
+
+
+@dataclass(slots=True)
+class WorkerSizingFinding:
+    """An execution that ran with too many or too few workers for its rows."""
+
+    execution_id: Optional[str]
+    block_name: str
+    application: str
+    job_type: str
+    issue: str  # "too_many_workers" or "too_few_workers"
+    workers: int
+    recommended_workers: int
+    computed_rows: int
+    execution_time: float
+    rows_per_worker: float
+    impact_ms: float  # Idle worker time, or estimated time saved
+
+
+@dataclass
+class WorkerScalingAnalysisResult:
+    """Results of worker scaling analysis."""
+
+    # Coverage
+    executions_analyzed: int = 0
+
+    # Mis-sized executions
+    too_many_workers_count: int = 0
+    too_few_workers_count: int = 0
+    idle_worker_time_ms: float = 0.0
+
+    # Curves per job type
+    fits: List[WorkerScalingFit] = field(default_factory=list)
+    curve: List[WorkerScalingPoint] = field(default_factory=list)
+
+    # Findings (largest impact first)
+    findings: List[WorkerSizingFinding] = field(default_factory=list)
+
+
+def fit_scaling(job: np.ndarray, n_jobs: int, log_rows: np.ndarray, log_workers: np.ndarray, log_time: np.ndarray):
+    """Least-squares fit of ``log_time ~ 1 + log_rows + log_workers`` per job code.
+
+    The normal equations of every job type are accumulated with bincount
+    and solved as one batch. Returns coefficients of shape (n_jobs, 3),
+    NaN where a job type's system is singular.
+    """
+
+    features = [np.ones_like(log_rows), log_rows, log_workers]
+    gram = np.empty((n_jobs, 3, 3))
+    moments = np.empty((n_jobs, 3))
+    for i, xi in enumerate(features):
+        moments[:, i] = np.bincount(job, weights=xi * log_time, minlength=n_jobs)
+        for j in range(i, 3):
+            gram[:, i, j] = gram[:, j, i] = np.bincount(job, weights=xi * features[j], minlength=n_jobs)
+
+    coefficients = np.full((n_jobs, 3), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        solvable = np.linalg.cond(gram) < MAX_CONDITION
+    if solvable.any():
+        coefficients[solvable] = np.linalg.solve(gram[solvable], moments[solvable][..., None])[..., 0]
+    return coefficients
+
+
+class WorkerScalingAnalyzer:
+    """Fit per-job-type scaling curves and flag mis-sized executions."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.slow = config.thresholds.metric_execution.warning
+
+    def analyze(self, data: PerformanceData) -> WorkerScalingAnalysisResult:
+        """Run worker scaling analysis on the data."""
+
+        result = WorkerScalingAnalysisResult()
+
+        armset = data.armset if data.has_armset else None
+        if armset is None or not {"workers", "computed_rows", "jobType", "execution_time"} <= set(armset.columns):
+            return result
+
+        workers = armset["workers"].to_numpy(dtype=float, na_value=np.nan)
+        rows = armset["computed_rows"].to_numpy(dtype=float, na_value=np.nan)
+        times = armset["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+        usable = (workers > 0) & (rows > 0) & (times > 0)
+        if not usable.any():
+            return result
+
+        df = armset[usable]
+        workers, rows, times = workers[usable], rows[usable], times[usable]
+        job, job_types = pd.factorize(df["jobType"].astype(str), sort=True)
+        n_jobs = len(job_types)
+        result.executions_analyzed = len(df)
+
+        coefficients = fit_scaling(job, n_jobs, np.log(rows), np.log(workers), np.log(times))
+        executions = np.bincount(job, minlength=n_jobs)
+        levels = pd.Series(workers).groupby(job).nunique().reindex(range(n_jobs), fill_value=0).to_numpy()
+        fitted = (executions >= MIN_FIT_EXECUTIONS) & (levels >= MIN_WORKER_LEVELS) & ~np.isnan(coefficients[:, 0])
+        rows_exponent = np.where(fitted, coefficients[:, 1], np.nan)
+        worker_exponent = np.where(fitted, -coefficients[:, 2], np.nan)
+
+        # Typical load and worker range of each job type
+        load = rows / workers
+        typical_load = pd.Series(load).groupby(job).median().to_numpy()
+        min_workers = pd.Series(workers).groupby(job).min().to_numpy()
+        max_workers = pd.Series(workers).groupby(job).max().to_numpy()
+
+        for code in np.flatnonzero(fitted):
+            result.fits.append(WorkerScalingFit(
+                job_type=job_types[code],
+                executions=int(executions[code]),
+                worker_levels=int(levels[code]),
+                rows_exponent=round(float(rows_exponent[code]), 3),
+                worker_exponent=round(float(worker_exponent[code]), 3),
+                efficiency_at_2x=round(float(2 ** (worker_exponent[code] - 1)), 3),
+                typical_rows_per_worker=round(float(typical_load[code]), 1),
+            ))
+
+        result.curve = self._curve(job, job_types, fitted, rows_exponent, rows, workers, times)
+
+        # Mis-sized executions, against the job type's typical rows per worker
+        recommended = np.clip(np.rint(rows / typical_load[job]), min_workers[job], max_workers[job])
+        too_many = (workers > recommended) & (load < typical_load[job] / LOAD_FACTOR)
+        too_few = (workers < recommended) & (load > typical_load[job] * LOAD_FACTOR) & (times >= self.slow)
+
+        # Too many: worker time spent beyond the recommendation. Too few: time
+        # the fitted curve expects to save at the recommended worker count
+        speedup = (recommended / workers) ** np.nan_to_num(worker_exponent[job])
+        impact = np.select(
+            [too_many, too_few],
+            [(workers - recommended) * times, times * (1 - 1 / speedup)],
+            default=0.0,
+        )
+
+        result.too_many_workers_count = int(too_many.sum())
+        result.too_few_workers_count = int(too_few.sum())
+        result.idle_worker_time_ms = round(float(impact[too_many].sum()), 2)
+
+        flagged = np.flatnonzero((too_many | too_few) & (impact > 0))
+        flagged = flagged[np.argsort(-impact[flagged], kind="stable")][:self.config.max_findings_per_category]
+        rows_df = df.iloc[flagged]
+        for pos, row in zip(flagged, rows_df.itertuples(index=False)):
+            result.findings.append(WorkerSizingFinding(
+                execution_id=str(row.executionId) if "executionId" in df.columns else None,
+                block_name=str(row.blockName) if "blockName" in df.columns else "",
+                application=str(row.app_id) if "app_id" in df.columns else "",
+                job_type=job_types[job[pos]],
+                issue="too_many_workers" if too_many[pos] else "too_few_workers",
+                workers=int(workers[pos]),
+                recommended_workers=int(recommended[pos]),
+                computed_rows=int(rows[pos]),
+                execution_time=round(float(times[pos]), 2),
+                rows_per_worker=round(float(load[pos]), 1),
+                impact_ms=round(float(impact[pos]), 2),
+            ))
+
+        return result
+
+    def _curve(self, job, job_types, fitted, rows_exponent, rows, workers, times) -> List[WorkerScalingPoint]:
+        """Median throughput and row-adjusted speedup per job type and worker count."""
+
+        # Times rescaled to the job type's median row volume, so worker
+        # counts are compared on the same amount of work
+        median_rows = pd.Series(rows).groupby(job).median().to_numpy()
+        adjusted = times * (median_rows[job] / rows) ** np.nan_to_num(rows_exponent[job], nan=1.0)
+
+        points = pd.DataFrame({
+            "job": job, "workers": workers, "throughput": rows / times, "adjusted": adjusted,
+        }).groupby(["job", "workers"], sort=True).agg(
+            executions=("throughput", "size"),
+            median_rows_per_ms=("throughput", "median"),
+            median_adjusted=("adjusted", "median"),
+        ).reset_index()
+        points = points[fitted[points["job"].to_numpy()]]
+
+        first = points.groupby("job", sort=False).transform("first")
+        points["speedup"] = first["median_adjusted"] / points["median_adjusted"]
+        points["parallel_efficiency"] = points["speedup"] / (points["workers"] / first["workers"])
+
+        return [
+            WorkerScalingPoint(
+                job_type=job_types[row.job],
+                workers=int(row.workers),
+                executions=int(row.executions),
+                median_rows_per_ms=round(row.median_rows_per_ms, 2),
+                speedup=round(row.speedup, 2),
+                parallel_efficiency=round(row.parallel_efficiency, 2),
+            )
+            for row in points.itertuples(index=False)
+        ]
@@ -5,13 +5,17 @@ Workload analyzer for application and temporal distribution.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..config import Config
+from ..cube import ExecutionCube
 from ..data_loader import PerformanceData
+from ..score_tiers import SLOW_VIEWS_PCT
+from .performance_analyzer import per_application
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationWorkload:
     """Workload summary for an application."""
 
@@ -21,6 +25,7 @@ class ApplicationWorkload:
     unique_metrics: int
     avg_execution_time_ms: float
     pct_of_total_time: float
+    p95_execution_time_ms: Optional[float] = None  # From the cube's quantile sketch
 
 
 @dataclass
@@ -74,7 +79,7 @@ class WorkloadAnalyzer:
 
         # Analyze metric executions
         if data.has_executions:
-            self._analyze_executions(data.executions, result)
+            self._analyze_executions(data, result)
 
         # Analyze views
         if data.has_views:
@@ -85,62 +90,64 @@ class WorkloadAnalyzer:
 
         return result
 
-    def _analyze_executions(self, df: pd.DataFrame, result: WorkloadAnalysisResult):
-        """Analyze execution workload."""
+    def _analyze_executions(self, data: PerformanceData, result: WorkloadAnalysisResult):
+        """Analyze execution workload from the execution cube."""
 
-        result.total_executions = len(df)
-        result.total_execution_time_hours = df["execution_time"].sum() / 3600000
+        cube = data.execution_cube(self.config)
+        totals = cube.total()
 
-        # By application
-        app_stats = df.groupby("application").agg({
-            "execution_time": ["sum", "mean", "count"],
-            "metric_id": "nunique",
-        }).reset_index()
+        result.total_executions = int(totals["count"])
+        result.total_execution_time_hours = totals["total_time"] / 3600000
 
-        app_stats.columns = [
-            "application", "total_time", "avg_time", "exec_count", "unique_metrics"
-        ]
+        # By application
+        by_app = cube.rollup(["application"]).sort_index()
+        app_stats = pd.DataFrame({
+            "application": by_app.index,
+            "total_time": by_app["total_time"].to_numpy(),
+            "avg_time": by_app["mean_time"].to_numpy(),
+            "exec_count": by_app["time_count"].to_numpy(),
+            "unique_metrics": cube.metric_counts.reindex(by_app.index, fill_value=0).to_numpy(),
+            "p95_time": cube.quantile(0.95, by=["application"]).reindex(by_app.index).to_numpy(),
+        })
 
         total_time = app_stats["total_time"].sum()
         result.unique_applications = len(app_stats)
 
-        for _, row in app_stats.iterrows():
-            pct = (row["total_time"] / total_time * 100) if total_time > 0 else 0
+        # Every application, by total time
+        app_stats = app_stats.sort_values("total_time", ascending=False, kind="stable")
+
+        for row in app_stats.itertuples(index=False):
+            pct = (row.total_time / total_time * 100) if total_time > 0 else 0
 
             result.app_workloads.append(ApplicationWorkload(
-                application=row["application"],
-                total_execution_time_ms=round(row["total_time"], 2),
-                total_executions=int(row["exec_count"]),
-                unique_metrics=int(row["unique_metrics"]),
-                avg_execution_time_ms=round(row["avg_time"], 2),
+                application=row.application,
+                total_execution_time_ms=round(row.total_time, 2),
+                total_executions=int(row.exec_count),
+                unique_metrics=int(row.unique_metrics),
+                avg_execution_time_ms=round(row.avg_time, 2),
                 pct_of_total_time=round(pct, 1),
+                p95_execution_time_ms=None if pd.isna(row.p95_time) else round(row.p95_time, 2),
             ))
 
-        # Sort by total time
-        result.app_workloads.sort(key=lambda x: -x.total_execution_time_ms)
-
         if result.app_workloads:
             result.top_app_pct = result.app_workloads[0].pct_of_total_time
 
         # Job type distribution
-        if "jobType" in df.columns:
-            result.job_type_distribution = df["jobType"].value_counts().to_dict()
+        if cube.has("jobType"):
+            job_types = cube.rollup(["jobType"])["count"]
+            result.job_type_distribution = job_types.sort_values(ascending=False, kind="stable").to_dict()
 
         # Temporal patterns
-        self._analyze_temporal_patterns(df, result)
+        self._analyze_temporal_patterns(cube, result)
 
-    def _analyze_temporal_patterns(self, df: pd.DataFrame, result: WorkloadAnalysisResult):
+    def _analyze_temporal_patterns(self, cube: ExecutionCube, result: WorkloadAnalysisResult):
         """Analyze temporal distribution of workload."""
 
-        if "executionStartedAt" not in df.columns:
+        if not cube.has("hour", "weekday"):
             return
 
-        df_temp = df.copy()
-        df_temp["hour"] = df_temp["executionStartedAt"].dt.hour
-        df_temp["day_of_week"] = df_temp["executionStartedAt"].dt.dayofweek
-
         # Hourly distribution
-        hourly = df_temp.groupby("hour")["execution_time"].sum()
+        hourly = cube.rollup(["hour"])["total_time"].sort_index()
         if len(hourly) > 0:
             total = hourly.sum()
             result.temporal_patterns.hourly_distribution = {
@@ -150,7 +157,7 @@ class WorkloadAnalyzer:
             result.temporal_patterns.peak_hour = int(hourly.idxmax())
 
         # Daily distribution
-        daily = df_temp.groupby("day_of_week")["execution_time"].sum()
+        daily = cube.rollup(["weekday"])["total_time"].sort_index()
         if len(daily) > 0:
             total = daily.sum()
             result.temporal_patterns.daily_distribution = {
@@ -172,6 +179,30 @@ class WorkloadAnalyzer:
             len(slow_views) / len(df) * 100 if len(df) > 0 else 0, 1
         )
 
+    def score_by_application(self, data: PerformanceData, applications: pd.Index) -> pd.Series:
+        """Views score for every application at once (see ``_calculate_score``)."""
+
+        max_score = self.config.scoring.views_weight
+
+        # No view data - neutral score
+        if not data.has_views:
+            return pd.Series(max_score * 0.8, index=applications)
+
+        df = data.views
+        view_threshold = self.config.thresholds.view_render.warning
+        slow_pct = (
+            (df["execution_time"] > view_threshold)
+            .groupby(df["app_id"], observed=True)
+            .mean()
+            .mul(100)
+            .round(1)
+        )
+
+        app_scores = pd.Series(
+            np.round(max_score * SLOW_VIEWS_PCT(slow_pct.to_numpy()), 1), index=slow_pct.index
+        )
+        return per_application(app_scores, applications, max_score * 0.8)
+
     def _calculate_score(self, result: WorkloadAnalysisResult) -> float:
         """Calculate views/workload score (0-25 points)."""
 
@@ -182,17 +213,6 @@ class WorkloadAnalyzer:
             return max_score * 0.8
 
         # Score based on slow views percentage
-        slow_pct = result.slow_views_pct
-
-        if slow_pct <= 5:
-            score = max_score
-        elif slow_pct <= 10:
-            score = max_score * 0.85
-        elif slow_pct <= 20:
-            score = max_score * 0.7
-        elif slow_pct <= 30:
-            score = max_score * 0.5
-        else:
-            score = max_score * 0.3
+        score = max_score * SLOW_VIEWS_PCT(result.slow_views_pct)
 
         return round(score, 1)
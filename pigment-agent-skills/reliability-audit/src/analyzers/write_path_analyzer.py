@@ -0,0 +1,287 @@
+"""
+Write path analyzer: write amplification, row churn and no-op recomputations.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config import Config
+from ..data_loader import PerformanceData
+from ..score_tiers import NOOP_TIME_PCT
+from .performance_analyzer import per_application
+
+
+# Key columns (application, block ID, block name, change) and written-row
+# columns per frame. Metric executions record rows updated; ARMSET/UPMSET
+# executions record rows upserted and deleted.
+WRITE_COLUMNS = {
+    "executions": (("application", "metric_id", "metric_name", "changeId"), ("updated_rows",)),
+    "armset": (("app_id", "blockId", "blockName", "changeId"), ("upserted_rows", "deleted_rows")),
+}
+
+KEY_NAMES = ["application", "block_id", "block_name", "change_id"]
+
+
+@dataclass(slots=True)
+class BlockWriteFinding:
+    """A block whose recomputations write little or nothing."""
+
+    block_id: str
+    block_name: str
+    application: str
+    execution_count: int
+    computed_rows: int
+    written_rows: int
+    write_amplification: Optional[float]  # Computed rows per written row
+    upserted_rows: int
+    deleted_rows: int
+    churn_ratio: Optional[float]  # Rows deleted per row upserted
+    noop_executions: int  # Executions that wrote nothing
+    noop_execution_time: float
+    total_execution_time: float
+
+
+@dataclass(slots=True)
+class ChangeChurnFinding:
+    """Rows a change deleted and upserted, and the recomputations it wasted."""
+
+    change_id: str
+    application: str
+    blocks: int
+    execution_count: int
+    upserted_rows: int
+    deleted_rows: int
+    churn_ratio: Optional[float]
+    noop_executions: int
+    noop_execution_time: float
+    total_execution_time: float
+
+
+@dataclass
+class WritePathAnalysisResult:
+    """Results of write path analysis."""
+
+    # Coverage
+    executions_analyzed: int = 0
+
+    # Write amplification
+    computed_rows: int = 0
+    written_rows: int = 0
+    write_amplification: Optional[float] = None
+
+    # Churn
+    upserted_rows: int = 0
+    deleted_rows: int = 0
+    churn_ratio: Optional[float] = None
+
+    # No-op recomputations
+    noop_executions: int = 0
+    noop_pct: float = 0.0
+    noop_time_ms: float = 0.0
+    noop_time_pct: float = 0.0
+
+    # Findings (most wasted time first; changes by churned rows)
+    block_findings: List[BlockWriteFinding] = field(default_factory=list)
+    change_findings: List[ChangeChurnFinding] = field(default_factory=list)
+
+    # For scoring: multiplier applied to the optimization score
+    penalty: float = 1.0
+
+
+def written_rows(df: pd.DataFrame, name: str) -> Optional[np.ndarray]:
+    """Rows each execution of frame ``name`` wrote, NaN where not recorded.
+
+    None when the frame records no writes at all, so an export without
+    write counts is not read as all no-ops.
+    """
+
+    present = [col for col in WRITE_COLUMNS[name][1] if col in df.columns]
+    if not present or "execution_time" not in df.columns:
+        return None
+
+    written = df[present].sum(axis=1, min_count=1).to_numpy(dtype=float, na_value=np.nan)
+    return written if not np.isnan(written).all() else None
+
+
+def write_rows(data: PerformanceData) -> Optional[pd.DataFrame]:
+    """One row per execution with a recorded write count, from every frame."""
+
+    parts = []
+    for name, (key_cols, written_cols) in WRITE_COLUMNS.items():
+        df = data.frames().get(name)
+        written = written_rows(df, name) if df is not None else None
+        if written is None:
+            continue
+
+        part = pd.DataFrame({
+            key: df[col] if col in df.columns else pd.Series(pd.NA, index=df.index, dtype=object)
+            for key, col in zip(KEY_NAMES, key_cols)
+        })
+        part["execution_time"] = df["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+        part["written_rows"] = written
+        part["computed_rows"] = (
+            df["computed_rows"].to_numpy(dtype=float, na_value=np.nan) if "computed_rows" in df.columns else np.nan
+        )
+
+        # Churn only where upserts and deletes are what the frame counts as written
+        for col in ("upserted_rows", "deleted_rows"):
+            churned = col in written_cols and col in df.columns
+            part[col] = df[col].to_numpy(dtype=float, na_value=np.nan) if churned else np.nan
+        parts.append(part[~np.isnan(written)])
+
+    if not parts:
+        return None
+
+    rows = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    rows["noop"] = rows["written_rows"] == 0
+    rows["noop_time"] = rows["execution_time"].where(rows["noop"], 0.0)
+    return rows
+
+
+def _ratio(numerator, denominator):
+    """``numerator / denominator``, missing where the denominator is not positive."""
+
+    if isinstance(denominator, pd.Series):
+        return numerator / denominator.where(denominator > 0)
+    return numerator / denominator if denominator > 0 else None
+
+
+class WritePathAnalyzer:
+    """Measure write amplification, churn and no-op recomputations."""
+
+    def __init__(self, config: Config):
+        self.config = config
+
+    def analyze(self, data: PerformanceData) -> WritePathAnalysisResult:
+        """Run write path analysis on the data."""
+
+        result = WritePathAnalysisResult()
+
+        rows = write_rows(data)
+        if rows is None:
+            return result
+
+        totals = rows[["execution_time", "computed_rows", "written_rows", "upserted_rows", "deleted_rows",
+                       "noop", "noop_time"]].sum()
+        result.executions_analyzed = len(rows)
+        result.computed_rows = int(totals["computed_rows"])
+        result.written_rows = int(totals["written_rows"])
+        amplification = _ratio(totals["computed_rows"], totals["written_rows"])
+        result.write_amplification = round(float(amplification), 2) if amplification is not None else None
+
+        result.upserted_rows = int(totals["upserted_rows"])
+        result.deleted_rows = int(totals["deleted_rows"])
+        churn = _ratio(totals["deleted_rows"], totals["upserted_rows"])
+        result.churn_ratio = round(float(churn), 3) if churn is not None else None
+
+        result.noop_executions = int(totals["noop"])
+        result.noop_pct = round(result.noop_executions / len(rows) * 100, 1)
+        result.noop_time_ms = round(float(totals["noop_time"]), 2)
+        if totals["execution_time"] > 0:
+            result.noop_time_pct = round(float(totals["noop_time"] / totals["execution_time"] * 100), 1)
+
+        limit = self.config.max_findings_per_category
+        result.block_findings = self._block_findings(rows, limit)
+        result.change_findings = self._change_findings(rows, limit)
+
+        result.penalty = self._calculate_penalty(result)
+
+        return result
+
+    def penalty_by_application(self, data: PerformanceData, applications: pd.Index) -> pd.Series:
+        """Optimization score multiplier for every application at once (see ``_calculate_penalty``)."""
+
+        rows = write_rows(data)
+        if rows is None:
+            return pd.Series(1.0, index=applications)
+
+        per_app = rows.groupby("application", observed=True)[["noop_time", "execution_time"]].sum()
+        noop_time_pct = (_ratio(per_app["noop_time"], per_app["execution_time"]) * 100).round(1)
+        penalties = pd.Series(NOOP_TIME_PCT(noop_time_pct.to_numpy()), index=per_app.index)
+        return per_application(penalties, applications, 1.0)
+
+    def _calculate_penalty(self, result: WritePathAnalysisResult) -> float:
+        """Optimization score multiplier by share of compute time that wrote nothing."""
+
+        return float(NOOP_TIME_PCT(result.noop_time_pct))
+
+    def _aggregate(self, rows: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        # Blocks exported without an ID are still told apart by name
+        stats = rows.groupby(keys, observed=True, dropna=False, sort=False).agg(
+            execution_count=("execution_time", "size"),
+            total_time=("execution_time", "sum"),
+            computed_rows=("computed_rows", "sum"),
+            written_rows=("written_rows", "sum"),
+            upserted_rows=("upserted_rows", "sum"),
+            deleted_rows=("deleted_rows", "sum"),
+            noop_executions=("noop", "sum"),
+            noop_time=("noop_time", "sum"),
+        )
+        stats["write_amplification"] = _ratio(stats["computed_rows"], stats["written_rows"])
+        stats["churn_ratio"] = _ratio(stats["deleted_rows"], stats["upserted_rows"])
+        return stats
+
+    def _block_findings(self, rows: pd.DataFrame, limit: int) -> List[BlockWriteFinding]:
+        stats = self._aggregate(rows, ["application", "block_id", "block_name"])
+        stats = stats[stats["noop_time"] > 0].sort_values("noop_time", ascending=False, kind="stable")
+
+        return [
+            BlockWriteFinding(
+                block_id=_label(row.block_id),
+                block_name=_label(row.block_name),
+                application=_label(row.application),
+                execution_count=int(row.execution_count),
+                computed_rows=int(row.computed_rows),
+                written_rows=int(row.written_rows),
+                write_amplification=_rounded(row.write_amplification, 2),
+                upserted_rows=int(row.upserted_rows),
+                deleted_rows=int(row.deleted_rows),
+                churn_ratio=_rounded(row.churn_ratio, 3),
+                noop_executions=int(row.noop_executions),
+                noop_execution_time=round(row.noop_time, 2),
+                total_execution_time=round(row.total_time, 2),
+            )
+            for row in stats.head(limit).reset_index().itertuples(index=False)
+        ]
+
+    def _change_findings(self, rows: pd.DataFrame, limit: int) -> List[ChangeChurnFinding]:
+        changed = rows[rows["change_id"].notna()]
+        if len(changed) == 0:
+            return []
+
+        stats = self._aggregate(changed, ["change_id", "application"])
+        stats["blocks"] = (
+            changed[["change_id", "application", "block_id", "block_name"]]
+            .drop_duplicates()
+            .groupby(["change_id", "application"], observed=True, sort=False).size()
+        )
+        stats["churned_rows"] = stats["upserted_rows"] + stats["deleted_rows"]
+        stats = stats[(stats["churned_rows"] > 0) | (stats["noop_time"] > 0)]
+        stats = stats.sort_values(["churned_rows", "noop_time"], ascending=False, kind="stable")
+
+        return [
+            ChangeChurnFinding(
+                change_id=_label(row.change_id),
+                application=_label(row.application),
+                blocks=int(row.blocks),
+                execution_count=int(row.execution_count),
+                upserted_rows=int(row.upserted_rows),
+                deleted_rows=int(row.deleted_rows),
+                churn_ratio=_rounded(row.churn_ratio, 3),
+                noop_executions=int(row.noop_executions),
+                noop_execution_time=round(row.noop_time, 2),
+                total_execution_time=round(row.total_time, 2),
+            )
+            for row in stats.head(limit).reset_index().itertuples(index=False)
+        ]
+
+
+def _label(value) -> str:
+    return "" if pd.isna(value) else str(value)
+
+
+def _rounded(value, digits: int) -> Optional[float]:
+    return round(float(value), digits) if pd.notna(value) else None
@@ -0,0 +1,62 @@
+"""
+In-process audit API.
+
+Runs the full audit on tables already held in memory (pandas DataFrames or
+pyarrow Tables) and returns the ``ReliabilityScore`` without writing any
+files, so notebooks and services do not need to round-trip through CSV.
+
+Example:
+    from src import audit
+
+    score = audit(executions=df, views=views_df)
+    print(score.total_score, score.grade)
+"""
+
+from typing import Any, Optional
+
+from .config import Config, load_config
+from .data_loader import DataLoader, PerformanceData
+from .scoring import ReliabilityScore, ReliabilityScorer
+
+
+def load_data(
+    executions: Any = None,
+    views: Any = None,
+    armset: Any = None,
+    config: Optional[Config] = None,
+    audit_events: Any = None,
+) -> PerformanceData:
+    """Prepare in-memory tables for analysis (coercion, filters, ID encoding)."""
+
+    config = config or load_config()
+    return DataLoader(config, quiet=True).load_frames(executions, views, armset, audit_events=audit_events)
+
+
+def audit(
+    executions: Any = None,
+    views: Any = None,
+    armset: Any = None,
+    config: Optional[Config] = None,
+    audit_events: Any = None,
+) -> ReliabilityScore:
+    """Score in-memory tables and return the audit result.
+
+    Args:
+        executions: Metric executions as a DataFrame or Arrow table
+        views: View executions as a DataFrame or Arrow table
+        armset: ARMSET/UPMSET executions as a DataFrame or Arrow table
+        config: Audit configuration; defaults to the bundled YAML config
+        audit_events: Change events to attribute regressions to, as returned
+            by ``AuditEventStore.query``; the on-disk store is not read
+
+    Raises:
+        ValueError: If neither executions nor views contain any rows
+    """
+
+    config = config or load_config()
+    data = load_data(executions, views, armset, config=config, audit_events=audit_events)
+
+    if not data.has_executions and not data.has_views:
+        raise ValueError("No data to audit: pass executions and/or views.")
+
+    return ReliabilityScorer(config).score(data)
@@ -0,0 +1,134 @@
+"""
+Shared async client for the Pigment REST APIs.
+
+Requests run on asyncio over a small pool of keep-alive HTTP connections
+(standard library only), with a cap on requests in flight. Rate limiting
+(429) and transient server or network errors are retried with exponential
+backoff and jitter, honouring ``Retry-After`` when the server sends it.
+"""
+
+import asyncio
+import http.client
+import json
+import queue
+import random
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+
+# HTTP statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class APIError(Exception):
+    """Raised when an API returns an unexpected response."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections to one host."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def get(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        try:
+            conn = self.idle.get_nowait()
+        except queue.Empty:
+            conn = self.connection_class(self.host, self.port, timeout=self.timeout)
+
+        try:
+            conn.request("GET", self.prefix + path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.idle.put(conn)
+
+        return response.status, dict(response.getheaders()), body
+
+    def close(self):
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+
+class ApiClient:
+    """Async JSON client with pooled connections, bounded concurrency and retries."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        concurrency: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 4,
+        backoff_seconds: float = 1.0,
+    ):
+        self.pool = ConnectionPool(base_url, timeout)
+        self.headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json"}
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+
+    async def get_json(self, path: str, params: Optional[dict] = None) -> dict:
+        if params:
+            path = f"{path}?{urlencode(params)}"
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with self.semaphore:
+                    status, headers, body = await asyncio.to_thread(self.pool.get, path, self.headers)
+            except (http.client.HTTPException, OSError):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if status == 200:
+                    return json.loads(body)
+                if status not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise APIError(f"GET {path} returned HTTP {status}", status)
+                retry_after = headers.get("Retry-After")
+
+            await asyncio.sleep(self._delay(attempt, retry_after))
+
+        raise APIError(f"GET {path} failed after {self.max_retries} retries")
+
+    async def get_all(self, path: str, items_key: str, params: Optional[dict] = None) -> list:
+        """Fetch every page of a list endpoint, following ``pagination.nextCursor``."""
+
+        params = dict(params or {})
+        items = []
+        while True:
+            page = await self.get_json(path, params)
+            items.extend(page.get(items_key, []))
+            cursor = (page.get("pagination") or {}).get("nextCursor")
+            if not cursor:
+                return items
+            params["cursor"] = cursor
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff_seconds * 2 ** attempt * random.uniform(0.5, 1.5)
+
+    def close(self):
+        self.pool.close()
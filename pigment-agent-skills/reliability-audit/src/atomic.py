@@ -0,0 +1,36 @@
+"""
+Atomic file writes for report outputs.
+
+Files are written under a temporary name in the destination directory and
+renamed into place only once complete, so readers never see a partially
+written report, even when several workers write into the same tree.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_path(path) -> Iterator[Path]:
+    """Yield a temporary path that replaces ``path`` when the block succeeds."""
+
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+
+
+@contextmanager
+def atomic_open(path, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """Open a file for writing that only appears at ``path`` once closed."""
+
+    with atomic_path(path) as tmp, open(tmp, mode, **kwargs) as f:
+        yield f
@@ -0,0 +1,251 @@
+"""
+Incremental Audit Logs API sync.
+
+Pages through ``/audit/v1/events?ingestedSince=`` and appends each page to
+a local SQLite event store, indexed by event time, event type and
+application. The next page is fetched while the previous one is being
+written. Each page and its pagination cursor are committed together, so
+an interrupted sync resumes from the last stored cursor. Once a sync
+completes, the latest ingestion timestamp becomes the watermark for the
+next run, which then fetches only new events.
+"""
+
+import asyncio
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+from .api_client import ApiClient
+from .config import Config
+
+
+EVENTS_PATH = "/audit/v1/events"
+
+# Pages fetched ahead of the writer
+PREFETCH_PAGES = 2
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one sync run."""
+
+    pages: int = 0
+    fetched: int = 0
+    inserted: int = 0
+    ingested_since: Optional[str] = None
+    watermark: Optional[str] = None
+    resumed: bool = False
+
+
+class AuditEventStore:
+    """Append-only SQLite store of audit events with sync state."""
+
+    def __init__(self, path: Path, read_only: bool = False):
+        if read_only:
+            # Never creates or modifies the file; raises if it does not exist
+            self.conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                event_id TEXT PRIMARY KEY,
+                event_type TEXT,
+                event_timestamp TEXT,
+                ingestion_timestamp TEXT,
+                member_id TEXT,
+                application_id TEXT,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS events_by_time ON events (event_timestamp);
+            CREATE INDEX IF NOT EXISTS events_by_type ON events (event_type, event_timestamp);
+            CREATE INDEX IF NOT EXISTS events_by_app ON events (application_id, event_timestamp);
+            CREATE INDEX IF NOT EXISTS events_by_ingestion ON events (ingestion_timestamp);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            """
+        )
+
+    def state(self) -> dict:
+        return dict(self.conn.execute("SELECT key, value FROM sync_state"))
+
+    def append(self, events: List[dict], state: dict) -> int:
+        """Insert a page of events and update sync state in one transaction.
+
+        Events already stored (same ``eventId``) are skipped, so pages that
+        overlap the watermark are harmless.
+        """
+
+        rows = [
+            (
+                event.get("eventId"),
+                event.get("eventType"),
+                event.get("eventTimestamp"),
+                event.get("ingestionTimestamp"),
+                (event.get("actor") or {}).get("memberId"),
+                (event.get("target") or {}).get("applicationId"),
+                json.dumps(event, separators=(",", ":")),
+            )
+            for event in events
+            if event.get("eventId")
+        ]
+
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            inserted = self.conn.total_changes - before
+            self._set_state(state)
+
+        return inserted
+
+    def complete(self, ingested_since: str) -> Optional[str]:
+        """Advance the watermark to the latest stored ingestion time and clear the cursor."""
+
+        latest = self.conn.execute("SELECT MAX(ingestion_timestamp) FROM events").fetchone()[0]
+        watermark = max(filter(None, [latest, ingested_since]))
+        with self.conn:
+            self.conn.execute("DELETE FROM sync_state WHERE key IN ('cursor', 'cursor_since')")
+            self._set_state({"ingested_since": watermark})
+        return watermark
+
+    def query(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        event_types: Optional[Iterable[str]] = None,
+        application_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Return stored events as a frame, filtered on the indexed columns."""
+
+        clauses, params = [], []
+        if since:
+            clauses.append("event_timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("event_timestamp < ?")
+            params.append(until)
+        if event_types:
+            event_types = list(event_types)
+            clauses.append(f"event_type IN ({', '.join('?' * len(event_types))})")
+            params.extend(event_types)
+        if application_id:
+            clauses.append("application_id = ?")
+            params.append(application_id)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        df = pd.read_sql_query(
+            f"SELECT event_id, event_type, event_timestamp, ingestion_timestamp, member_id, application_id "
+            f"FROM events {where} ORDER BY event_timestamp",
+            self.conn,
+            params=params,
+        )
+        for col in ("event_timestamp", "ingestion_timestamp"):
+            df[col] = pd.to_datetime(df[col], errors="coerce", utc=True)
+        return df
+
+    def _set_state(self, state: dict):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            [(key, value) for key, value in state.items()],
+        )
+
+    def close(self):
+        self.conn.close()
+
+
+class AuditLogSync:
+    """Fetch new Audit Logs API events into the local event store."""
+
+    def __init__(self, config: Config, quiet: bool = False):
+        self.config = config
+        self.quiet = quiet
+        self.base_dir = Path(__file__).parent.parent
+
+    def store_path(self) -> Path:
+        path = Path(self.config.audit_logs_store_path)
+        return path if path.is_absolute() else self.base_dir / path
+
+    def sync(self) -> SyncResult:
+        """Run one incremental sync and return its counts."""
+
+        store = AuditEventStore(self.store_path())
+        try:
+            result = asyncio.run(self._sync(store))
+        finally:
+            store.close()
+
+        if not self.quiet:
+            print(
+                f"Synced {result.inserted:,} new audit events "
+                f"({result.fetched:,} fetched in {result.pages} pages)"
+            )
+
+        return result
+
+    async def _sync(self, store: AuditEventStore) -> SyncResult:
+        state = store.state()
+        result = SyncResult()
+
+        # Resume an interrupted run from its last committed page
+        cursor = state.get("cursor")
+        if cursor:
+            result.ingested_since = state["cursor_since"]
+            result.resumed = True
+        else:
+            lookback = datetime.now(timezone.utc) - timedelta(days=self.config.audit_logs_lookback_days)
+            result.ingested_since = state.get("ingested_since") or lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        client = ApiClient(
+            self.config.api_base_url,
+            self.config.audit_logs_api_key,
+            concurrency=1,
+            max_retries=self.config.api_max_retries,
+        )
+        pages: asyncio.Queue = asyncio.Queue(maxsize=PREFETCH_PAGES)
+
+        async def fetch_pages(cursor: Optional[str]):
+            try:
+                while True:
+                    params = {"ingestedSince": result.ingested_since}
+                    if cursor:
+                        params["cursor"] = cursor
+                    page = await client.get_json(EVENTS_PATH, params)
+                    cursor = (page.get("pagination") or {}).get("nextCursor")
+                    await pages.put((page.get("events", []), cursor))
+                    if not cursor:
+                        break
+            finally:
+                await pages.put(None)
+
+        producer = asyncio.create_task(fetch_pages(cursor))
+        try:
+            while (item := await pages.get()) is not None:
+                events, next_cursor = item
+                state = (
+                    {"cursor": next_cursor, "cursor_since": result.ingested_since}
+                    if next_cursor else {}
+                )
+                result.inserted += store.append(events, state)
+                result.fetched += len(events)
+                result.pages += 1
+
+            # Surfaces any fetch error; the stored cursor lets the next run resume
+            await producer
+        finally:
+            producer.cancel()
+            client.close()
+
+        result.watermark = store.complete(result.ingested_since)
+        return result
@@ -0,0 +1,251 @@
+"""
+Sharded batch audits.
+
+Splits the loaded data into shards (one per application or per
+organization) and scores and renders each shard's reports in a pool of
+worker processes. Shards are dispatched largest first, and only as many
+shards as there are workers are materialized and in flight at once, so
+memory stays bounded by the largest shards rather than the whole input.
+Every report file is written atomically, and a JSON manifest with a
+roll-up across all shards is written once the batch completes.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .atomic import atomic_open
+from .config import Config
+from .data_loader import PerformanceData
+from .report_generator import ReportGenerator
+from .scoring import ReliabilityScorer
+
+
+# Application column in each frame
+APP_COLUMNS = {"executions": "application", "views": "app_id", "armset": "app_id"}
+
+# Organization column in each frame
+ORG_COLUMNS = {"executions": "org_id", "views": "org_id", "armset": "org_id"}
+
+# Shard key -> (column per frame, output subdirectory)
+SHARD_KEYS = {
+    "application": (APP_COLUMNS, "apps"),
+    "organization": (ORG_COLUMNS, "orgs"),
+}
+
+
+def organization_by_application(data: PerformanceData) -> pd.Series:
+    """Organization of each application, from the frames that record both."""
+
+    pairs = []
+    for name, df in data.frames().items():
+        app_col, org_col = APP_COLUMNS[name], ORG_COLUMNS[name]
+        if app_col in df.columns and org_col in df.columns:
+            pairs.append(df[[app_col, org_col]].drop_duplicates().dropna().set_axis(["application", "org"], axis=1))
+
+    if not pairs:
+        return pd.Series(dtype=object)
+
+    pairs = pd.concat(pairs, ignore_index=True).astype(str).drop_duplicates("application")
+    return pairs.set_index("application")["org"]
+
+
+def shard_keys(data: PerformanceData, name: str, columns: Dict[str, str]) -> Optional[pd.Series]:
+    """Shard key of every row of one frame, or None when it cannot be told.
+
+    Frames without an organization column (such as metric executions)
+    take the organization of their application from the other frames.
+    """
+
+    df = getattr(data, name)
+    if columns[name] in df.columns:
+        return df[columns[name]]
+
+    if columns is ORG_COLUMNS and APP_COLUMNS[name] in df.columns:
+        orgs = organization_by_application(data)
+        if len(orgs):
+            return df[APP_COLUMNS[name]].astype(str).map(orgs)
+
+    return None
+
+
+def shard_indices(data: PerformanceData, columns: Dict[str, str]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Row positions of every shard in each frame, without copying any rows."""
+
+    shards: Dict[str, Dict[str, np.ndarray]] = {}
+
+    for name in data.frames():
+        keys = shard_keys(data, name, columns)
+        if keys is None:
+            continue
+        for key, positions in keys.groupby(keys, observed=True, sort=False).indices.items():
+            shards.setdefault(str(key), {})[name] = positions
+
+    return shards
+
+
+def take_shard(data: PerformanceData, positions: Dict[str, np.ndarray]) -> PerformanceData:
+    """Materialize one shard, sharing the ID categories."""
+
+    part = PerformanceData(audit_events=data.audit_events, id_categories=data.id_categories)
+    for name, rows in positions.items():
+        setattr(part, name, getattr(data, name).iloc[rows])
+    return part
+
+
+def split_by_application(data: PerformanceData) -> Dict[str, PerformanceData]:
+    """Partition every frame by application, sharing the ID categories."""
+
+    return {
+        app: take_shard(data, positions)
+        for app, positions in shard_indices(data, APP_COLUMNS).items()
+    }
+
+
+def _audit_shard(config: Config, shard_by: str, key: str, data: PerformanceData, timestamp: str) -> dict:
+    """Score one shard and write its reports (runs in a worker)."""
+
+    score = ReliabilityScorer(config).score(data)
+    files = ReportGenerator(config).generate(score, data, timestamp=timestamp)
+
+    return {
+        shard_by: key,
+        "status": "ok",
+        "rows": sum(len(df) for df in data.frames().values()),
+        "total_score": score.total_score,
+        "grade": score.grade,
+        "files": files,
+    }
+
+
+class BatchAuditRunner:
+    """Run one audit per shard (application or organization) across a process pool."""
+
+    def __init__(
+        self, config: Config, workers: Optional[int] = None, shard_by: str = "application", quiet: bool = False
+    ):
+        if shard_by not in SHARD_KEYS:
+            raise ValueError(f"Unknown shard key: {shard_by!r}")
+
+        self.config = config
+        self.quiet = quiet
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_by = shard_by
+        self.base_dir = Path(__file__).parent.parent
+
+    def run(self, data: PerformanceData) -> str:
+        """Audit every shard and return the manifest path."""
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = self.base_dir / self.config.output_directory
+        columns, _ = SHARD_KEYS[self.shard_by]
+        shards = shard_indices(data, columns)
+        self._check_coverage(data, shards)
+
+        # Ascending by size; pop() dispatches the largest shards first so
+        # they do not straggle at the end
+        queue = sorted(shards.items(), key=lambda item: self._size(item[1]))
+
+        jobs: List[dict] = []
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {}
+
+            # Keep at most one materialized shard per worker
+            while queue or in_flight:
+                while queue and len(in_flight) < self.workers:
+                    key, positions = queue.pop()
+                    future = pool.submit(
+                        _audit_shard,
+                        self._shard_config(key),
+                        self.shard_by,
+                        key,
+                        take_shard(data, positions),
+                        timestamp,
+                    )
+                    in_flight[future] = key
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = in_flight.pop(future)
+                    try:
+                        jobs.append(future.result())
+                    except Exception as e:
+                        jobs.append({self.shard_by: key, "status": "error", "error": str(e)})
+
+        jobs.sort(key=lambda job: job[self.shard_by])
+        manifest = {
+            "generated_at": datetime.now().isoformat(),
+            "timestamp": timestamp,
+            "shard_by": self.shard_by,
+            "workers": self.workers,
+            "shards": len(jobs),
+            "failed": sum(1 for job in jobs if job["status"] != "ok"),
+            "rollup": self._rollup(jobs),
+            "jobs": jobs,
+        }
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_file = output_dir / f"manifest_{self.shard_by}_{timestamp}.json"
+        with atomic_open(manifest_file, "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+
+        return str(manifest_file)
+
+    def _check_coverage(self, data: PerformanceData, shards: Dict[str, Dict[str, np.ndarray]]):
+        """Refuse to shard a frame none of whose rows has a shard key; warn about partial gaps."""
+
+        for name, df in data.frames().items():
+            assigned = sum(len(positions.get(name, ())) for positions in shards.values())
+            if len(df) and not assigned:
+                raise ValueError(
+                    f"cannot split {name} rows by {self.shard_by}: no {SHARD_KEYS[self.shard_by][0][name]} column, "
+                    "and no frame maps their applications to one"
+                )
+            if assigned < len(df) and not self.quiet:
+                print(f"Warning: {len(df) - assigned:,} {name} rows have no {self.shard_by} and are in no shard")
+
+    def _rollup(self, jobs: List[dict]) -> dict:
+        """Summarize shard scores across the whole batch."""
+
+        ok = [job for job in jobs if job["status"] == "ok"]
+        if not ok:
+            return {}
+
+        scores = np.array([job["total_score"] for job in ok], dtype=float)
+        rows = np.array([job["rows"] for job in ok], dtype=float)
+        grades: Dict[str, int] = {}
+        for job in ok:
+            grades[job["grade"]] = grades.get(job["grade"], 0) + 1
+        lowest = min(ok, key=lambda job: job["total_score"])
+
+        return {
+            "rows": int(rows.sum()),
+            "mean_score": round(float(scores.mean()), 1),
+            "row_weighted_score": round(float(np.average(scores, weights=rows)), 1) if rows.sum() else None,
+            "min_score": float(scores.min()),
+            "max_score": float(scores.max()),
+            "lowest": lowest[self.shard_by],
+            "grade_counts": dict(sorted(grades.items())),
+        }
+
+    def _shard_config(self, key: str) -> Config:
+        """Config whose output directory is the shard's own subdirectory."""
+
+        _, subdirectory = SHARD_KEYS[self.shard_by]
+        safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", key)
+        return replace(
+            self.config,
+            output_directory=str(Path(self.config.output_directory) / subdirectory / safe_name),
+        )
+
+    @staticmethod
+    def _size(positions: Dict[str, np.ndarray]) -> int:
+        return sum(len(rows) for rows in positions.values())
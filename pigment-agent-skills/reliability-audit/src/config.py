@@ -1,22 +1,37 @@
 """
 Configuration loader for Pigment Reliability Audit.
+
+Config objects are immutable and validated on construction, so one parsed
+config can be shared (and used as a cache key) across audits; derive
+variants with ``dataclasses.replace``. ``load_config`` memoizes on the
+resolved file paths and their modification times.
 """
 
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
 from typing import Optional
 
 import yaml
 
 
-@dataclass
+@dataclass(frozen=True)
 class PerformanceThresholds:
     watch: int = 3000
     warning: int = 5000
     critical: int = 30000
 
+    def __post_init__(self):
+        if not self.watch <= self.warning <= self.critical:
+            raise ValueError(
+                f"Thresholds must satisfy watch <= warning <= critical, "
+                f"got {self.watch}/{self.warning}/{self.critical}"
+            )
+
 
-@dataclass
+@dataclass(frozen=True)
 class ThresholdsConfig:
     metric_execution: PerformanceThresholds = field(default_factory=lambda: PerformanceThresholds(3000, 5000, 30000))
     view_render: PerformanceThresholds = field(default_factory=lambda: PerformanceThresholds(2000, 3000, 15000))
@@ -25,25 +40,47 @@ class ThresholdsConfig:
     fully_scoped_target: int = 50
     non_scoped_warning: int = 30
     non_scoped_critical: int = 50
-
-
-@dataclass
+    anomaly_zscore: PerformanceThresholds = field(default_factory=lambda: PerformanceThresholds(3.5, 5, 8))
+    anomaly_min_history_days: int = 7
+    anomaly_seasonal_baseline: bool = False
+    change_window_hours: float = 6
+    change_bucket_minutes: int = 60
+
+    def __post_init__(self):
+        if not 0 <= self.non_scoped_warning <= self.non_scoped_critical <= 100:
+            raise ValueError("scoping: expected 0 <= non_scoped_warning <= non_scoped_critical <= 100")
+        if self.anomaly_min_history_days < 1:
+            raise ValueError("anomalies: min_history_days must be at least 1")
+        if self.change_window_hours <= 0 or self.change_bucket_minutes <= 0:
+            raise ValueError("change_impact: window_hours and bucket_minutes must be positive")
+
+
+@dataclass(frozen=True)
 class ScoringConfig:
     performance_weight: int = 25
     optimization_weight: int = 25
     complexity_weight: int = 25
     views_weight: int = 25
 
+    def __post_init__(self):
+        weights = (self.performance_weight, self.optimization_weight, self.complexity_weight, self.views_weight)
+        if min(weights) < 0 or sum(weights) != 100:
+            raise ValueError(f"scoring: weights must be non-negative and sum to 100, got {weights}")
 
-@dataclass
+
+@dataclass(frozen=True)
 class GradesConfig:
     A: int = 90
     B: int = 75
     C: int = 60
     D: int = 40
 
+    def __post_init__(self):
+        if not self.A >= self.B >= self.C >= self.D:
+            raise ValueError("grades: expected A >= B >= C >= D")
+
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Main configuration class."""
 
@@ -56,12 +93,30 @@ class Config:
     api_base_url: str = "https://pigment.app/api"
     metadata_api_key: Optional[str] = None
     audit_logs_api_key: Optional[str] = None
+    enrich_metadata: bool = False
+    metadata_cache_path: str = "cache/metadata.sqlite"
+    metadata_cache_ttl_hours: float = 24
+    metadata_concurrency: int = 8
+    api_max_retries: int = 4
+    audit_logs_store_path: str = "cache/audit_events.sqlite"
+    audit_logs_lookback_days: int = 180
 
     # Output config
     output_directory: str = "output"
-    output_formats: list = field(default_factory=lambda: ["csv", "html"])
+    output_formats: tuple = ("csv", "html")
     include_details: bool = True
     max_findings_per_category: int = 50
+    export_full_tables: bool = False
+    export_compression: Optional[str] = None  # "gzip" or None
+
+    # Analysis config
+    heavy_hitters_capacity: int = 1000
+    query_store_path: str = "cache/analytics.sqlite"
+    sample_fraction: Optional[float] = None  # None = analyze every row
+    sample_seed: int = 0
+    bootstrap_replicates: int = 50
+    progress_interval_seconds: Optional[float] = None  # None = load silently
+    progress_stop_delta: Optional[float] = None  # None = always read every row
 
     # Thresholds
     thresholds: ThresholdsConfig = field(default_factory=ThresholdsConfig)
@@ -69,48 +124,123 @@ class Config:
     grades: GradesConfig = field(default_factory=GradesConfig)
 
     # Filters
-    filter_applications: list = field(default_factory=list)
+    filter_applications: tuple = ()
     filter_date_from: Optional[str] = None
     filter_date_to: Optional[str] = None
-    exclude_applications: list = field(default_factory=list)
-    exclude_metrics: list = field(default_factory=list)
+    exclude_applications: tuple = ()
+    exclude_metrics: tuple = ()
+
+    def __post_init__(self):
+        # YAML and callers may pass lists; store tuples so the config hashes
+        for name in ("output_formats", "filter_applications", "exclude_applications", "exclude_metrics"):
+            object.__setattr__(self, name, tuple(getattr(self, name) or ()))
+
+        if self.max_findings_per_category < 1:
+            raise ValueError("output: max_findings_per_category must be at least 1")
+        if self.export_compression not in (None, "gzip"):
+            raise ValueError(f"output: unsupported export_compression {self.export_compression!r}")
+        if self.heavy_hitters_capacity < 1:
+            raise ValueError("analysis: heavy_hitters_capacity must be at least 1")
+        if self.metadata_concurrency < 1:
+            raise ValueError("api: max_concurrency must be at least 1")
+        if self.api_max_retries < 0:
+            raise ValueError("api: max_retries must not be negative")
+        if not 1 <= self.audit_logs_lookback_days <= 180:
+            raise ValueError("api: audit_logs_lookback_days must be between 1 and 180")
+        if self.sample_fraction is not None and not 0 < self.sample_fraction <= 1:
+            raise ValueError("analysis: sample_fraction must be in (0, 1]")
+        if self.bootstrap_replicates < 1:
+            raise ValueError("analysis: bootstrap_replicates must be at least 1")
+        if self.progress_interval_seconds is not None and self.progress_interval_seconds <= 0:
+            raise ValueError("analysis: progress_interval must be positive")
+        if self.progress_stop_delta is not None and self.progress_stop_delta < 0:
+            raise ValueError("analysis: progress_stop_delta must not be negative")
+        if self.metadata_cache_ttl_hours < 0:
+            raise ValueError("api: metadata_cache_ttl_hours must not be negative")
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of every setting, usable as a cross-process cache key."""
+        payload = json.dumps(asdict(self), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
 def load_config(config_path: Optional[str] = None, thresholds_path: Optional[str] = None) -> Config:
-    """Load configuration from YAML files."""
+    """Load configuration from YAML files.
+
+    Results are cached per (path, modification time), so repeated calls
+    return the same immutable Config until either file changes.
+    """
 
     base_dir = Path(__file__).parent.parent
-    config = Config()
 
-    # Load thresholds
     if thresholds_path is None:
         thresholds_path = base_dir / "config" / "thresholds.yaml"
+    if config_path is None:
+        config_path = base_dir / "config" / "config.yaml"
+
+    return _load_config_cached(
+        str(config_path), _mtime(config_path),
+        str(thresholds_path), _mtime(thresholds_path),
+    )
+
+
+def _mtime(path) -> Optional[int]:
+    path = Path(path)
+    return path.stat().st_mtime_ns if path.exists() else None
 
-    if Path(thresholds_path).exists():
+
+@lru_cache(maxsize=32)
+def _load_config_cached(
+    config_path: str,
+    config_mtime: Optional[int],
+    thresholds_path: str,
+    thresholds_mtime: Optional[int],
+) -> Config:
+    """Parse both YAML files into a Config (memoized by path and mtime)."""
+
+    config = {}
+
+    # Load thresholds
+    if thresholds_mtime is not None:
         with open(thresholds_path) as f:
             thresholds_data = yaml.safe_load(f)
 
         if thresholds_data:
+            thresholds = {}
+
             perf = thresholds_data.get("performance", {})
             if "metric_execution" in perf:
-                config.thresholds.metric_execution = PerformanceThresholds(**perf["metric_execution"])
+                thresholds["metric_execution"] = PerformanceThresholds(**perf["metric_execution"])
             if "view_render" in perf:
-                config.thresholds.view_render = PerformanceThresholds(**perf["view_render"])
+                thresholds["view_render"] = PerformanceThresholds(**perf["view_render"])
 
             if "computed_rows" in thresholds_data:
-                config.thresholds.computed_rows = PerformanceThresholds(**thresholds_data["computed_rows"])
+                thresholds["computed_rows"] = PerformanceThresholds(**thresholds_data["computed_rows"])
 
             if "dimensions" in thresholds_data:
-                config.thresholds.dimensions = PerformanceThresholds(**thresholds_data["dimensions"])
+                thresholds["dimensions"] = PerformanceThresholds(**thresholds_data["dimensions"])
 
             scoping = thresholds_data.get("scoping", {})
-            config.thresholds.fully_scoped_target = scoping.get("fully_scoped_target", 50)
-            config.thresholds.non_scoped_warning = scoping.get("non_scoped_warning", 30)
-            config.thresholds.non_scoped_critical = scoping.get("non_scoped_critical", 50)
+            thresholds["fully_scoped_target"] = scoping.get("fully_scoped_target", 50)
+            thresholds["non_scoped_warning"] = scoping.get("non_scoped_warning", 30)
+            thresholds["non_scoped_critical"] = scoping.get("non_scoped_critical", 50)
+
+            anomalies = thresholds_data.get("anomalies", {})
+            if "robust_zscore" in anomalies:
+                thresholds["anomaly_zscore"] = PerformanceThresholds(**anomalies["robust_zscore"])
+            thresholds["anomaly_min_history_days"] = anomalies.get("min_history_days", 7)
+            thresholds["anomaly_seasonal_baseline"] = anomalies.get("seasonal_baseline", False)
+
+            change_impact = thresholds_data.get("change_impact", {})
+            thresholds["change_window_hours"] = change_impact.get("window_hours", 6)
+            thresholds["change_bucket_minutes"] = change_impact.get("bucket_minutes", 60)
+
+            config["thresholds"] = ThresholdsConfig(**thresholds)
 
             scoring = thresholds_data.get("scoring", {})
             if scoring:
-                config.scoring = ScoringConfig(
+                config["scoring"] = ScoringConfig(
                     performance_weight=scoring.get("performance_weight", 25),
                     optimization_weight=scoring.get("optimization_weight", 25),
                     complexity_weight=scoring.get("complexity_weight", 25),
@@ -119,42 +249,60 @@ def load_config(config_path: Optional[str] = None, thresholds_path: Optional[str
 
             grades = thresholds_data.get("grades", {})
             if grades:
-                config.grades = GradesConfig(**grades)
+                config["grades"] = GradesConfig(**grades)
 
     # Load main config
-    if config_path is None:
-        config_path = base_dir / "config" / "config.yaml"
-
-    if Path(config_path).exists():
+    if config_mtime is not None:
         with open(config_path) as f:
             config_data = yaml.safe_load(f)
 
         if config_data:
+            defaults = Config()
+
             # Data sources
             ds = config_data.get("data_sources", {})
-            config.executions_csv = ds.get("executions_csv")
-            config.views_csv = ds.get("views_csv")
-            config.armset_csv = ds.get("armset_csv")
+            config["executions_csv"] = ds.get("executions_csv")
+            config["views_csv"] = ds.get("views_csv")
+            config["armset_csv"] = ds.get("armset_csv")
 
             # API
             api = config_data.get("api", {})
-            config.api_base_url = api.get("base_url", config.api_base_url)
-            config.metadata_api_key = api.get("metadata_api_key") or None
-            config.audit_logs_api_key = api.get("audit_logs_api_key") or None
+            config["api_base_url"] = api.get("base_url", defaults.api_base_url)
+            config["metadata_api_key"] = api.get("metadata_api_key") or None
+            config["audit_logs_api_key"] = api.get("audit_logs_api_key") or None
+            config["enrich_metadata"] = api.get("enrich_metadata", defaults.enrich_metadata)
+            config["metadata_cache_path"] = api.get("metadata_cache", defaults.metadata_cache_path)
+            config["metadata_cache_ttl_hours"] = api.get("metadata_cache_ttl_hours", defaults.metadata_cache_ttl_hours)
+            config["metadata_concurrency"] = api.get("max_concurrency", defaults.metadata_concurrency)
+            config["api_max_retries"] = api.get("max_retries", defaults.api_max_retries)
+            config["audit_logs_store_path"] = api.get("audit_logs_store", defaults.audit_logs_store_path)
+            config["audit_logs_lookback_days"] = api.get("audit_logs_lookback_days", defaults.audit_logs_lookback_days)
 
             # Output
             output = config_data.get("output", {})
-            config.output_directory = output.get("directory", config.output_directory)
-            config.output_formats = output.get("formats", config.output_formats)
-            config.include_details = output.get("include_details", config.include_details)
-            config.max_findings_per_category = output.get("max_findings_per_category", config.max_findings_per_category)
+            config["output_directory"] = output.get("directory", defaults.output_directory)
+            config["output_formats"] = output.get("formats", defaults.output_formats)
+            config["include_details"] = output.get("include_details", defaults.include_details)
+            config["max_findings_per_category"] = output.get("max_findings_per_category", defaults.max_findings_per_category)
+            config["export_full_tables"] = output.get("full_exports", defaults.export_full_tables)
+            config["export_compression"] = output.get("export_compression") or None
+
+            # Analysis
+            analysis = config_data.get("analysis", {})
+            config["heavy_hitters_capacity"] = analysis.get("heavy_hitters_capacity", defaults.heavy_hitters_capacity)
+            config["query_store_path"] = analysis.get("query_store", defaults.query_store_path)
+            config["sample_fraction"] = analysis.get("sample_fraction") or None
+            config["sample_seed"] = analysis.get("sample_seed", defaults.sample_seed)
+            config["bootstrap_replicates"] = analysis.get("bootstrap_replicates", defaults.bootstrap_replicates)
+            config["progress_interval_seconds"] = analysis.get("progress_interval") or None
+            config["progress_stop_delta"] = analysis.get("progress_stop_delta")
 
             # Filters
             filters = config_data.get("filters", {})
-            config.filter_applications = filters.get("applications", [])
-            config.filter_date_from = filters.get("date_from") or None
-            config.filter_date_to = filters.get("date_to") or None
-            config.exclude_applications = filters.get("exclude_applications", [])
-            config.exclude_metrics = filters.get("exclude_metrics", [])
+            config["filter_applications"] = filters.get("applications", [])
+            config["filter_date_from"] = filters.get("date_from") or None
+            config["filter_date_to"] = filters.get("date_to") or None
+            config["exclude_applications"] = filters.get("exclude_applications", [])
+            config["exclude_metrics"] = filters.get("exclude_metrics", [])
 
-    return config
+    return Config(**config)
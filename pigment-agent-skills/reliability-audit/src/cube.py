@@ -0,0 +1,215 @@
+"""
+Pre-aggregated cube over metric executions.
+
+Executions are rolled up once per load into cells keyed by application,
+day, week, job type, scoped level and dimension-count bucket. Each cell
+keeps the row count, execution-time count, sum and max, plus a
+log-bucketed quantile sketch. Slices along any of these dimensions are
+then answered from the cells, which are far fewer than the raw rows. A
+separate hourly timeline of execution time serves hour-of-day and
+weekday patterns without multiplying the cells by 24.
+
+The sketch has a fixed relative accuracy, so a quantile read from it is
+within ``RELATIVE_ACCURACY`` of the exact value. Sketches of different
+cells merge by adding bucket counts.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Execution columns kept as cube dimensions, when present
+DIMENSIONS = ["application", "day", "week", "jobType", "scoped_level"]
+
+# Dimensions of the hourly timeline, derived from its start hour
+TIMELINE_DIMENSIONS = {
+    "hour": lambda started: started.dt.hour,
+    "weekday": lambda started: started.dt.dayofweek,
+}
+
+MEASURES = {"count": "sum", "time_count": "sum", "total_time": "sum", "max_time": "max"}
+
+# Relative error of quantiles read from the sketch
+RELATIVE_ACCURACY = 0.01
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = np.log(_GAMMA)
+
+# Sketch bucket for zero (and negative) execution times, sorted first
+_ZERO_BUCKET = np.iinfo(np.int32).min
+
+
+def _sketch_buckets(values: np.ndarray) -> np.ndarray:
+    positive = values > 0
+    buckets = np.full(len(values), _ZERO_BUCKET, dtype=np.int32)
+    buckets[positive] = np.ceil(np.log(values[positive]) / _LOG_GAMMA)
+    return buckets
+
+
+def _bucket_values(buckets: np.ndarray) -> np.ndarray:
+    """Representative value of each bucket, within the relative accuracy."""
+
+    buckets = np.asarray(buckets)
+    values = 2 * np.power(_GAMMA, buckets.astype(float)) / (_GAMMA + 1)
+    return np.where(buckets == _ZERO_BUCKET, 0.0, values)
+
+
+def _measures(cell: np.ndarray, n_cells: int, times: np.ndarray) -> pd.DataFrame:
+    """Count, time count, sum and max of ``times`` per cell id."""
+
+    timed = ~np.isnan(times)
+    return pd.DataFrame({
+        "count": np.bincount(cell, minlength=n_cells),
+        "time_count": np.bincount(cell, weights=timed, minlength=n_cells).astype(np.int64),
+        "total_time": np.bincount(cell, weights=np.where(timed, times, 0.0), minlength=n_cells),
+        "max_time": pd.Series(times).groupby(cell).max().reindex(range(n_cells)).to_numpy(),
+    })
+
+
+def _cells(keys: pd.DataFrame):
+    """Cell id per row and the key values of each cell."""
+
+    if len(keys.columns) == 0:
+        cell = np.zeros(len(keys), dtype=np.int64)
+    else:
+        cell = keys.groupby(list(keys.columns), observed=True, dropna=False, sort=False).ngroup().to_numpy()
+    n_cells = int(cell.max()) + 1 if len(cell) else 0
+
+    first = np.full(n_cells, len(cell), dtype=np.int64)
+    np.minimum.at(first, cell, np.arange(len(cell)))
+    return cell, n_cells, keys.iloc[first].reset_index(drop=True)
+
+
+class ExecutionCube:
+    """Cells of execution counts, times and quantile sketches."""
+
+    def __init__(
+        self,
+        cells: pd.DataFrame,
+        sketch: pd.DataFrame,
+        timeline: pd.DataFrame,
+        metric_counts: pd.Series,
+    ):
+        # One row per cell: dimension columns, then the MEASURES
+        self.cells = cells
+
+        # One row per (cell, bucket) with the number of executions in it
+        self.sketch = sketch
+
+        # One row per start hour (started_hour, then the MEASURES)
+        self.timeline = timeline
+
+        # Distinct metrics per application (not additive across cells)
+        self.metric_counts = metric_counts
+
+    @classmethod
+    def build(cls, executions: pd.DataFrame, dims_bins: Optional[Sequence[float]] = None) -> "ExecutionCube":
+        """Aggregate executions into cells in one pass.
+
+        ``dims_bins`` are the ``pd.cut`` edges for the ``dims_bucket``
+        dimension; without them ``nb_dims`` is not a dimension.
+        """
+
+        keys = pd.DataFrame(
+            {dim: executions[dim] for dim in DIMENSIONS if dim in executions.columns},
+            index=executions.index,
+        )
+        if dims_bins is not None and "nb_dims" in executions.columns:
+            keys["dims_bucket"] = pd.cut(executions["nb_dims"], bins=list(dims_bins), labels=False)
+
+        times = executions["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+        timed = ~np.isnan(times)
+
+        cell, n_cells, cells = _cells(keys)
+        cells = pd.concat([cells, _measures(cell, n_cells, times)], axis=1)
+
+        sketch = (
+            pd.DataFrame({"cell": cell[timed], "bucket": _sketch_buckets(times[timed])})
+            .value_counts(sort=False)
+            .rename("count")
+            .reset_index()
+        )
+
+        timeline = pd.DataFrame(columns=["started_hour", *MEASURES])
+        if "executionStartedAt" in executions.columns:
+            hour_keys = pd.DataFrame({"started_hour": executions["executionStartedAt"].dt.floor("h")})
+            hour, n_hours, timeline = _cells(hour_keys)
+            timeline = pd.concat([timeline, _measures(hour, n_hours, times)], axis=1)
+
+        if {"application", "metric_id"} <= set(executions.columns):
+            metric_counts = executions.groupby("application", observed=True)["metric_id"].nunique()
+        else:
+            metric_counts = pd.Series(dtype=np.int64)
+
+        return cls(cells, sketch, timeline, metric_counts)
+
+    def has(self, *dimensions: str) -> bool:
+        """Whether every named dimension can be sliced on."""
+
+        return all(
+            dim in self.cells.columns or (dim in TIMELINE_DIMENSIONS and len(self.timeline) > 0)
+            for dim in dimensions
+        )
+
+    def total(self, where: Optional[pd.Series] = None) -> pd.Series:
+        """Measures summed over all (or the selected) cells."""
+
+        cells = self.cells if where is None else self.cells[where]
+        return pd.Series({
+            "count": int(cells["count"].sum()),
+            "time_count": int(cells["time_count"].sum()),
+            "total_time": float(cells["total_time"].sum()),
+            "max_time": cells["max_time"].max(),
+        })
+
+    def rollup(self, by: Sequence[str], where: Optional[pd.Series] = None) -> pd.DataFrame:
+        """Measures per combination of ``by``, from the selected cells.
+
+        ``by`` may name cell dimensions, or timeline dimensions (``hour``,
+        ``weekday``) without ``where``. Missing key values are left out,
+        as with ``DataFrame.groupby``.
+        """
+
+        if any(name in TIMELINE_DIMENSIONS for name in by):
+            table = self.timeline
+            keys = [TIMELINE_DIMENSIONS[name](table["started_hour"]).rename(name) for name in by]
+        else:
+            table = self.cells if where is None else self.cells[where]
+            keys = [table[name] for name in by]
+
+        rolled = table[list(MEASURES)].groupby(keys, observed=True, sort=False).agg(MEASURES)
+        rolled["mean_time"] = rolled["total_time"] / rolled["time_count"].where(rolled["time_count"] > 0)
+
+        return rolled
+
+    def quantile(self, q: float, by: Optional[List[str]] = None, where: Optional[pd.Series] = None):
+        """Approximate execution-time quantile, overall or per ``by`` group."""
+
+        cell = self.sketch["cell"].to_numpy()
+        keep = np.ones(len(cell), dtype=bool) if where is None else where.to_numpy()[cell]
+
+        hist = pd.DataFrame({
+            "bucket": self.sketch["bucket"].to_numpy()[keep],
+            "count": self.sketch["count"].to_numpy()[keep],
+        })
+        group_by = list(by or ["_all"])
+        for name in group_by:
+            hist[name] = self.cells[name].to_numpy()[cell[keep]] if by else 0
+
+        # Cumulative counts per group in bucket order; the quantile falls in
+        # the first bucket whose cumulative count passes its rank
+        counts = hist.groupby(group_by + ["bucket"], observed=True, sort=True)["count"].sum()
+        groups = counts.groupby(level=group_by, observed=True, sort=False)
+        passed = groups.cumsum() > q * (groups.transform("sum") - 1)
+        first = passed & ~passed.groupby(level=group_by, observed=True, sort=False).shift(fill_value=False)
+
+        values = pd.Series(
+            _bucket_values(counts.index.get_level_values("bucket")[first.to_numpy()]),
+            index=counts.index[first.to_numpy()].droplevel("bucket"),
+        )
+
+        if by:
+            return values
+        return float(values.iloc[0]) if len(values) else float("nan")
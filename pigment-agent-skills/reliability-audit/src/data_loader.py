@@ -1,16 +1,45 @@
 """
 Data loader for Pigment performance data.
 
-Handles loading CSV files and optional API enrichment.
+Handles loading CSV files or in-memory frames, and optional API enrichment.
 """
 
+import sqlite3
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
 
 import pandas as pd
 
 from .config import Config
+from .cube import ExecutionCube
+from .sampling import SampleInfo, sample_frames
+
+
+NUMERIC_COLUMNS = [
+    "execution_time",
+    "computed_rows",
+    "updated_rows",
+    "upserted_rows",
+    "deleted_rows",
+    "nb_dims",
+    "nb_executions",
+    "nb_batch_executions",
+    "workers",
+]
+
+DATE_COLUMNS = ["executionStartedAt", "day"]
+
+
+# ID columns that share one dictionary across the executions, views and
+# armset frames, so equal IDs get equal integer codes in every frame
+ID_DOMAINS = {
+    "application": ["application", "app_id"],
+    "block": ["metric_id", "blockId", "backingMetricId"],
+    "block_name": ["metric_name", "blockName"],
+    "organization": ["org_id"],
+    "change": ["changeId"],
+}
 
 
 @dataclass
@@ -21,6 +50,18 @@ class PerformanceData:
     views: Optional[pd.DataFrame] = None
     armset: Optional[pd.DataFrame] = None
 
+    # Audit log events from the local event store (see audit_logs)
+    audit_events: Optional[pd.DataFrame] = None
+
+    # Shared categories per ID domain (see ID_DOMAINS)
+    id_categories: Dict[str, pd.Index] = field(default_factory=dict)
+
+    # Set when the frames are a stratified sample (see sampling)
+    sampling: Optional[SampleInfo] = None
+
+    # Pre-aggregated executions, built on first use (see execution_cube)
+    cube: Optional[ExecutionCube] = field(default=None, repr=False)
+
     @property
     def has_executions(self) -> bool:
         return self.executions is not None and len(self.executions) > 0
@@ -33,6 +74,32 @@ class PerformanceData:
     def has_armset(self) -> bool:
         return self.armset is not None and len(self.armset) > 0
 
+    def frames(self) -> Dict[str, pd.DataFrame]:
+        """Return the loaded frames by name."""
+        return {
+            name: df
+            for name, df in (
+                ("executions", self.executions),
+                ("views", self.views),
+                ("armset", self.armset),
+            )
+            if df is not None
+        }
+
+    def execution_cube(self, config: Config) -> Optional[ExecutionCube]:
+        """Cube over the executions, built once per load and then reused."""
+        if self.cube is None and self.has_executions:
+            dims = config.thresholds.dimensions
+            self.cube = ExecutionCube.build(
+                self.executions,
+                dims_bins=(-float("inf"), dims.watch, dims.warning, dims.critical, float("inf")),
+            )
+        return self.cube
+
+    def decode(self, domain: str, codes) -> pd.Index:
+        """Map integer codes from an encoded ID column back to their names."""
+        return self.id_categories[domain].take(codes)
+
     def summary(self) -> dict:
         """Return summary of loaded data."""
         return {
@@ -106,7 +173,7 @@ class DataLoader:
         # Apply filters
         data = self._apply_filters(data)
 
-        return data
+        return self._prepare(data, self._load_audit_events())
 
     def load_from_paths(
         self,
@@ -130,8 +197,98 @@ class DataLoader:
         # Apply filters
         data = self._apply_filters(data)
 
+        return self._prepare(data, self._load_audit_events())
+
+    def load_frames(
+        self,
+        executions: Any = None,
+        views: Any = None,
+        armset: Any = None,
+        audit_events: Optional[pd.DataFrame] = None,
+    ) -> PerformanceData:
+        """Build performance data from in-memory tables without file I/O.
+
+        Accepts pandas DataFrames or pyarrow Tables. Columns that already
+        have the expected dtype are used as-is; the caller's frames are
+        never modified. The audit log store is not read: change events are
+        used only when passed as ``audit_events`` (as returned by
+        ``AuditEventStore.query``).
+        """
+
+        data = PerformanceData()
+
+        for name, table in (("executions", executions), ("views", views), ("armset", armset)):
+            if table is None:
+                continue
+            df = table.to_pandas() if hasattr(table, "to_pandas") else table
+            df = self._convert_numeric_columns(df, name)
+            df = self._parse_dates(df)
+            setattr(data, name, df)
+
+        data = self._apply_filters(data)
+
+        return self._prepare(data, audit_events)
+
+    def _prepare(self, data: PerformanceData, audit_events: Optional[pd.DataFrame] = None) -> PerformanceData:
+        """Sample if configured, encode IDs, attach change events and, when enabled, join Metadata API attributes."""
+
+        if self.config.sample_fraction:
+            data = self._sample(data)
+
+        data = encode_ids(data)
+        data.audit_events = audit_events
+
+        if self.config.enrich_metadata:
+            from .enrichment import MetadataEnricher
+
+            data = MetadataEnricher(self.config, quiet=self.quiet).enrich(data)
+
+        return data
+
+    def _sample(self, data: PerformanceData) -> PerformanceData:
+        """Keep a stratified sample of every frame."""
+
+        frames, info = sample_frames(data.frames(), self.config.sample_fraction, self.config.sample_seed)
+        for name, df in frames.items():
+            setattr(data, name, df)
+        data.sampling = info
+
+        if not self.quiet:
+            rows = ", ".join(
+                f"{info.sample_rows[name]:,}/{info.population_rows[name]:,} {name}" for name in frames
+            )
+            print(f"Sampled {info.fraction:.0%} by application and job type ({rows})")
+
         return data
 
+    def _load_audit_events(self) -> Optional[pd.DataFrame]:
+        """Load model change events from the audit log store, if one was synced."""
+
+        store_path = Path(self.config.audit_logs_store_path)
+        if not store_path.is_absolute():
+            store_path = self.base_dir / store_path
+        if not store_path.exists():
+            return None
+
+        from .audit_logs import AuditEventStore
+        from .analyzers.change_impact_analyzer import CHANGE_EVENT_TYPES
+
+        try:
+            store = AuditEventStore(store_path, read_only=True)
+            try:
+                events = store.query(event_types=CHANGE_EVENT_TYPES)
+            finally:
+                store.close()
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            if not self.quiet:
+                print(f"Warning: audit log store not read ({store_path.name}): {e}")
+            return None
+
+        if not self.quiet:
+            print(f"Loaded {len(events)} change events from audit log store ({store_path.name})")
+
+        return events
+
     def _load_csv(self, path: str, data_type: str) -> Optional[pd.DataFrame]:
         """Load a single CSV file."""
 
@@ -166,35 +323,32 @@ class DataLoader:
     def _convert_numeric_columns(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Convert columns to appropriate numeric types."""
 
-        numeric_columns = [
-            "execution_time",
-            "computed_rows",
-            "updated_rows",
-            "upserted_rows",
-            "deleted_rows",
-            "nb_dims",
-            "nb_executions",
-            "nb_batch_executions",
-            "workers",
+        pending = [
+            col for col in NUMERIC_COLUMNS
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
         ]
+        if not pending:
+            return df
 
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+        df = df.copy(deep=False)
+        for col in pending:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
 
         return df
 
     def _parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Parse date columns."""
 
-        if "executionStartedAt" in df.columns:
-            df["executionStartedAt"] = pd.to_datetime(
-                df["executionStartedAt"],
-                errors="coerce"
-            )
+        pending = [
+            col for col in DATE_COLUMNS
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+        ]
+        if not pending:
+            return df
 
-        if "day" in df.columns:
-            df["day"] = pd.to_datetime(df["day"], errors="coerce")
+        df = df.copy(deep=False)
+        for col in pending:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
 
         return df
 
@@ -270,3 +424,40 @@ class DataLoader:
             df = df[df[date_col] <= date_to]
 
         return df
+
+
+def encode_ids(data: PerformanceData) -> PerformanceData:
+    """Dictionary-encode ID columns with categories shared across frames.
+
+    Each ID column becomes a categorical whose integer codes index the same
+    category list in every frame, so grouping and joining compare integers
+    rather than strings. Names are only materialized when read back.
+    """
+
+    frames = {name: df.copy(deep=False) for name, df in data.frames().items()}
+
+    for domain, columns in ID_DOMAINS.items():
+        present = [
+            (df, col) for df in frames.values() for col in columns if col in df.columns
+        ]
+        if not present:
+            continue
+
+        values = [
+            df[col].cat.categories if isinstance(df[col].dtype, pd.CategoricalDtype)
+            else pd.Index(df[col].dropna().unique())
+            for df, col in present
+        ]
+        categories = values[0].append(values[1:]).unique().astype(str).sort_values()
+        data.id_categories[domain] = categories
+
+        for df, col in present:
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype) and dtype.categories.equals(categories):
+                continue
+            df[col] = pd.Categorical(df[col].astype("string"), categories=categories)
+
+    for name, df in frames.items():
+        setattr(data, name, df)
+
+    return data
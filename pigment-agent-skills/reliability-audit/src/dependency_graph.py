@@ -0,0 +1,180 @@
+"""
+Metric dependency graph in compressed sparse row (CSR) form.
+
+Nodes are block codes (see ``ID_DOMAINS["block"]``) and an edge runs from
+a backing metric to each block it backs, i.e. from upstream to
+downstream. Out-edges are stored as ``indptr`` / ``indices`` arrays, with
+the reverse (in-edge) arrays alongside. Propagation walks the graph one
+topological level at a time, so each step is a handful of vectorized
+operations over a whole frontier, not a Python loop over nodes.
+
+Nodes on a cycle never reach in-degree zero. They are reported but left
+out of propagation.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+
+# Sources whose reachable sets are propagated together, one bit each
+REACH_BATCH = 512
+
+
+def _csr(src: np.ndarray, dst: np.ndarray, n_nodes: int):
+    """CSR arrays (indptr, indices) of edges ``src -> dst``."""
+
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+    return indptr, dst[order]
+
+
+def _gather(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray):
+    """Neighbors of ``nodes``, and the position in ``nodes`` each came from."""
+
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    owner = np.repeat(np.arange(len(nodes)), lengths)
+    within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return indices[starts[owner] + within], owner
+
+
+def _bit_sums(words: np.ndarray, cost: np.ndarray, chunk: int = 1 << 15) -> np.ndarray:
+    """Total ``cost`` of the rows with each bit of ``words`` (n_rows x n_words) set."""
+
+    sums = np.zeros(words.shape[1] * 64)
+    rows = np.flatnonzero(words.any(axis=1))
+    for start in range(0, len(rows), chunk):
+        block = rows[start:start + chunk]
+        bits = np.unpackbits(words[block].view(np.uint8), axis=1, bitorder="little")
+        sums += cost[block] @ bits
+    return sums
+
+
+class DependencyGraph:
+    """Directed graph over block codes, upstream to downstream."""
+
+    def __init__(self, src: np.ndarray, dst: np.ndarray, n_nodes: int):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+
+        # Drop self-loops and duplicate edges, keyed as one sorted int64
+        keep = src != dst
+        keys = np.sort(src[keep] * n_nodes + dst[keep])
+        keys = keys[np.diff(keys, prepend=-1) != 0]
+        self.src, self.dst = keys // n_nodes, keys % n_nodes
+        self.n_nodes = n_nodes
+
+        self.indptr, self.indices = _csr(self.src, self.dst, n_nodes)
+        self.rev_indptr, self.rev_indices = _csr(self.dst, self.src, n_nodes)
+
+        # Topological levels, and the out-edges (child, position in level) of each
+        self.levels, self._level_edges = self._levels()
+        self._ordered = np.zeros(n_nodes, dtype=bool)
+        for level in self.levels:
+            self._ordered[level] = True
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.src)
+
+    def in_degree(self) -> np.ndarray:
+        return np.diff(self.rev_indptr)
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def cyclic_nodes(self) -> np.ndarray:
+        """Nodes on (or downstream of) a cycle, which have no topological order."""
+
+        return np.flatnonzero(~self._ordered)
+
+    def _levels(self):
+        """Kahn's algorithm, one whole frontier per step."""
+
+        remaining = self.in_degree().copy()
+        frontier = np.flatnonzero(remaining == 0)
+        levels, level_edges = [], []
+
+        # Scratch slots to deduplicate each frontier in linear time: a node
+        # listed several times keeps only the occurrence written last
+        slot = np.zeros(self.n_nodes, dtype=np.int64)
+
+        while len(frontier):
+            children, owner = _gather(self.indptr, self.indices, frontier)
+            levels.append(frontier)
+            level_edges.append((children, owner))
+            np.subtract.at(remaining, children, 1)
+            ready = children[remaining[children] == 0]
+            positions = np.arange(len(ready))
+            slot[ready] = positions
+            frontier = ready[slot[ready] == positions]
+        return levels, level_edges
+
+    def downstream_cost(self, cost: np.ndarray, sources: np.ndarray) -> np.ndarray:
+        """Own cost plus the cost of every distinct node reachable from each source.
+
+        A node reached along several paths (a diamond) is counted once. The
+        sets are propagated level by level as bitsets, ``REACH_BATCH``
+        sources at a time; nodes past a cycle contribute nothing.
+        """
+
+        sources = np.asarray(sources, dtype=np.int64)
+        cost = np.where(self._ordered, cost, 0.0)
+
+        # Each level's edges grouped by child, so a child's parents are
+        # merged with one reduceat instead of an unbuffered ufunc.at
+        grouped = []
+        for level, (children, owner) in zip(self.levels, self._level_edges):
+            order = np.argsort(children, kind="stable")
+            children = children[order]
+            starts = np.flatnonzero(np.diff(children, prepend=-1) != 0)
+            grouped.append((level[owner[order]], children[starts], starts))
+
+        totals = np.zeros(len(sources))
+        for start in range(0, len(sources), REACH_BATCH):
+            batch = sources[start:start + REACH_BATCH]
+            bits = np.arange(len(batch))
+
+            # Bit i of a node's words is set when batch[i] reaches it
+            reach = np.zeros((self.n_nodes, (len(batch) + 63) // 64), dtype=np.uint64)
+            np.bitwise_or.at(reach, (batch, bits // 64), np.uint64(1) << (bits % 64).astype(np.uint64))
+            for parents, children, starts in grouped:
+                if len(children):
+                    reach[children] |= np.bitwise_or.reduceat(reach[parents], starts, axis=0)
+
+            totals[start:start + len(batch)] = _bit_sums(reach, cost)[:len(batch)]
+        return totals
+
+    def longest_paths(self, cost: np.ndarray):
+        """Costliest path ending at each node, and the parent it came through.
+
+        Returns ``(path_cost, parent)``, with parent -1 at path starts.
+        """
+
+        path_cost = np.where(self._ordered, cost, np.nan).astype(float)
+        best_in = np.zeros(self.n_nodes)
+        for level, (children, owner) in zip(self.levels, self._level_edges):
+            path_cost[level] = cost[level] + best_in[level]
+            np.maximum.at(best_in, children, path_cost[level][owner])
+
+        # Each node's parent is the in-neighbor with the costliest path
+        parent = np.full(self.n_nodes, -1, dtype=np.int64)
+        ordered = self._ordered[self.src] & self._ordered[self.dst]
+        src, dst = self.src[ordered], self.dst[ordered]
+        order = np.lexsort((-path_cost[src], dst))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = dst[order][1:] != dst[order][:-1]
+        parent[dst[order][first]] = src[order][first]
+
+        return path_cost, parent
+
+    @staticmethod
+    def trace(parent: np.ndarray, node: int, limit: Optional[int] = None) -> List[int]:
+        """Nodes from the start of the path ending at ``node``, upstream first."""
+
+        path = [node]
+        while parent[path[-1]] >= 0 and (limit is None or len(path) < limit):
+            path.append(int(parent[path[-1]]))
+        return path[::-1]
@@ -0,0 +1,218 @@
+"""
+Metadata API enrichment.
+
+Fetches application and block metadata from the Pigment Metadata API
+(``/v1/applications`` and ``/v1/blocks?applicationId=``) and joins it onto
+the performance frames. Requests run concurrently through ``ApiClient``.
+Responses are cached in a local SQLite file with a TTL, so repeated audits
+only call the API for entries that are missing or expired.
+"""
+
+import asyncio
+import http.client
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .api_client import APIError, ApiClient
+from .config import Config
+from .data_loader import PerformanceData
+
+
+# Primary ID column per frame for each joined entity
+APPLICATION_COLUMNS = {"executions": "application", "views": "app_id", "armset": "app_id"}
+BLOCK_COLUMNS = {"executions": "metric_id", "views": "blockId", "armset": "blockId"}
+
+
+class MetadataCache:
+    """SQLite-backed cache of API payloads keyed by (endpoint, key)."""
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                endpoint TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (endpoint, key)
+            )
+            """
+        )
+
+    def get_many(self, endpoint: str, keys: List[str]) -> Dict[str, object]:
+        """Return the fresh cached payloads among ``keys``."""
+
+        cutoff = time.time() - self.ttl_seconds
+        found = {}
+        for key in keys:
+            row = self.conn.execute(
+                "SELECT payload FROM metadata WHERE endpoint = ? AND key = ? AND fetched_at >= ?",
+                (endpoint, key, cutoff),
+            ).fetchone()
+            if row:
+                found[key] = json.loads(row[0])
+        return found
+
+    def put_many(self, endpoint: str, payloads: Dict[str, object]):
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO metadata (endpoint, key, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                [(endpoint, key, now, json.dumps(payload)) for key, payload in payloads.items()],
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class MetadataEnricher:
+    """Join Metadata API application and block attributes onto the frames."""
+
+    def __init__(self, config: Config, quiet: bool = False):
+        self.config = config
+        self.quiet = quiet
+        self.base_dir = Path(__file__).parent.parent
+
+    def enrich(self, data: PerformanceData) -> PerformanceData:
+        """Return ``data`` with metadata columns added where IDs match."""
+
+        if not self.config.metadata_api_key:
+            if not self.quiet:
+                print("Warning: metadata enrichment skipped, no metadata_api_key configured")
+            return data
+
+        app_ids = list(data.id_categories.get("application", []))
+        if not app_ids:
+            return data
+
+        cache_path = Path(self.config.metadata_cache_path)
+        if not cache_path.is_absolute():
+            cache_path = self.base_dir / cache_path
+        cache = MetadataCache(cache_path, self.config.metadata_cache_ttl_hours * 3600)
+
+        try:
+            applications, blocks = asyncio.run(self._fetch(cache, app_ids))
+        except (APIError, OSError, http.client.HTTPException, ValueError) as e:
+            if not self.quiet:
+                print(f"Warning: metadata enrichment skipped: {e}")
+            return data
+        finally:
+            cache.close()
+
+        if not self.quiet:
+            print(f"Enriched with metadata for {len(applications)} applications, {len(blocks)} blocks")
+
+        return apply_metadata(data, applications, blocks)
+
+    async def _fetch(self, cache: MetadataCache, app_ids: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Load applications and their blocks, calling the API only for cache misses."""
+
+        client = ApiClient(
+            self.config.api_base_url,
+            self.config.metadata_api_key,
+            concurrency=self.config.metadata_concurrency,
+            max_retries=self.config.api_max_retries,
+        )
+        try:
+            cached = cache.get_many("applications", ["*"])
+            if "*" in cached:
+                applications = cached["*"]
+            else:
+                applications = await client.get_all("/v1/applications", "applications")
+                cache.put_many("applications", {"*": applications})
+
+            # Only applications present in the data need their blocks
+            known = {app.get("id") for app in applications}
+            wanted = [app_id for app_id in app_ids if app_id in known]
+
+            blocks = cache.get_many("blocks", wanted)
+            missing = [app_id for app_id in wanted if app_id not in blocks]
+            fetched = await asyncio.gather(*(
+                client.get_all("/v1/blocks", "blocks", {"applicationId": app_id})
+                for app_id in missing
+            ))
+            fresh = dict(zip(missing, fetched))
+            if fresh:
+                cache.put_many("blocks", fresh)
+            blocks.update(fresh)
+        finally:
+            client.close()
+
+        app_frame = pd.DataFrame(
+            [
+                {
+                    "id": app.get("id"),
+                    "app_name": app.get("name"),
+                    "app_modified_at": app.get("modifiedAt"),
+                }
+                for app in applications
+            ],
+            columns=["id", "app_name", "app_modified_at"],
+        )
+        block_frame = pd.DataFrame(
+            [
+                {
+                    "id": block.get("id"),
+                    "block_type": block.get("type"),
+                    "block_dimension_count": len(block.get("dimensions") or []),
+                }
+                for app_blocks in blocks.values()
+                for block in app_blocks
+            ],
+            columns=["id", "block_type", "block_dimension_count"],
+        )
+        app_frame["app_modified_at"] = pd.to_datetime(app_frame["app_modified_at"], errors="coerce", utc=True)
+
+        return app_frame, block_frame
+
+
+def _lookup(categories: pd.Index, meta: pd.DataFrame, codes: np.ndarray) -> Dict[str, np.ndarray]:
+    """Gather metadata columns for dictionary-encoded IDs.
+
+    ``meta`` is aligned once to the shared category list, so the join per
+    row is an integer take on the category codes instead of a string merge.
+    """
+
+    aligned = meta.drop_duplicates("id").set_index("id").reindex(categories)
+    missing = codes < 0
+    return {
+        col: pd.Series(aligned[col].to_numpy()[np.where(missing, 0, codes)]).mask(missing).to_numpy()
+        for col in aligned.columns
+    }
+
+
+def apply_metadata(data: PerformanceData, applications: pd.DataFrame, blocks: pd.DataFrame) -> PerformanceData:
+    """Add application and block metadata columns to every frame."""
+
+    frames = {name: df.copy(deep=False) for name, df in data.frames().items()}
+
+    for domain, columns, meta in (
+        ("application", APPLICATION_COLUMNS, applications),
+        ("block", BLOCK_COLUMNS, blocks),
+    ):
+        categories = data.id_categories.get(domain)
+        if categories is None or len(categories) == 0 or meta.empty:
+            continue
+
+        for name, df in frames.items():
+            col = columns[name]
+            if col not in df.columns:
+                continue
+            for meta_col, values in _lookup(categories, meta, df[col].cat.codes.to_numpy()).items():
+                if meta_col not in df.columns:
+                    df[meta_col] = values
+
+    for name, df in frames.items():
+        setattr(data, name, df)
+
+    return data
@@ -0,0 +1,324 @@
+"""
+Bootstrap confidence intervals for audits run on a sample.
+
+The score components, execution-time percentiles and severity counts are
+estimated from the sample and recomputed on bootstrap replicates, each
+redrawn with replacement within the same strata and units as the sample
+itself. A replicate is a weight per sampled unit, so it reuses the
+per-metric and per-view aggregates of the sample instead of copying and
+re-analyzing the rows.
+
+Severity counts are scaled to the population with a ratio estimator
+(flagged share of the sampled metrics or views x their number before
+sampling), and the score components are computed from those scaled
+counts with each analyzer's own scoring rules.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import Config
+from .data_loader import PerformanceData
+from .sampling import SampleInfo, ENTITY_COLUMNS, bootstrap_weights, group_ids
+from .analyzers import PerformanceAnalyzer, ScopingAnalyzer, ComplexityAnalyzer, WorkloadAnalyzer, WritePathAnalyzer
+from .analyzers.performance_analyzer import PerformanceAnalysisResult, classify_severity
+from .analyzers.scoping_analyzer import ScopingAnalysisResult
+from .analyzers.complexity_analyzer import ComplexityAnalysisResult
+from .analyzers.workload_analyzer import WorkloadAnalysisResult
+from .analyzers.write_path_analyzer import WritePathAnalysisResult, written_rows
+
+
+# Two-sided confidence level of the reported intervals
+CONFIDENCE = 0.95
+
+# Scoped levels counted in the scoping percentages, in result order
+APPLICABLE_LEVELS = ["FullyScoped", "PartiallyScoped", "NoChange"]
+
+SEVERITIES = ["critical", "warning", "watch"]
+
+
+@dataclass(slots=True)
+class Estimate:
+    """A statistic estimated from the sample, with its bootstrap interval."""
+
+    statistic: str
+    estimate: float
+    ci_low: float
+    ci_high: float
+
+
+@dataclass
+class SampleEstimate:
+    """Estimates for a sampled audit."""
+
+    fraction: float = 0.0
+    confidence: float = CONFIDENCE
+    replicates: int = 0
+    sample_rows: Dict[str, int] = field(default_factory=dict)
+    population_rows: Dict[str, int] = field(default_factory=dict)
+    estimates: List[Estimate] = field(default_factory=list)
+
+    def get(self, statistic: str) -> Optional[Estimate]:
+        return next((e for e in self.estimates if e.statistic == statistic), None)
+
+
+def weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+    """Linearly interpolated quantile of sorted ``values`` repeated ``weights`` times.
+
+    With integer weights this equals ``Series.quantile`` of the expanded
+    values, so a replicate and the sample itself are measured alike.
+    """
+
+    cumulative = np.cumsum(weights)
+    if len(cumulative) == 0 or cumulative[-1] == 0:
+        return float("nan")
+
+    rank = q * (cumulative[-1] - 1)
+    lower = int(np.floor(rank))
+    below, above = np.searchsorted(cumulative, [lower, lower + 1], side="right")
+    above = min(above, len(values) - 1)
+    return float(values[below] + (rank - lower) * (values[above] - values[below]))
+
+
+class _Frame:
+    """Per-row arrays of one sampled frame, reused by every replicate."""
+
+    def __init__(self, df: pd.DataFrame, units: np.ndarray, entity_cols: List[str]):
+        self.units = units
+        self.times = df["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+        self.timed = ~np.isnan(self.times)
+
+        # Entity (metric or view) of each row
+        self.entities = group_ids(df, entity_cols)
+        self.n_entities = int(self.entities.max()) + 1 if len(self.entities) else 0
+        self.entity_rows = np.bincount(self.entities, minlength=self.n_entities)
+
+        # Timed rows in time order, for percentiles
+        self.order = np.flatnonzero(self.timed)[np.argsort(self.times[self.timed], kind="stable")]
+        self.sorted_times = self.times[self.order]
+
+    def row_weights(self, unit_weights: np.ndarray) -> np.ndarray:
+        return unit_weights[self.units].astype(float)
+
+    def mean_time(self, weights: np.ndarray) -> float:
+        timed = weights[self.timed]
+        return float((timed * self.times[self.timed]).sum() / timed.sum()) if timed.sum() else 0.0
+
+    def percentile(self, weights: np.ndarray, q: float) -> float:
+        return weighted_quantile(self.sorted_times, weights[self.order], q)
+
+    def entity_weights(self, weights: np.ndarray) -> np.ndarray:
+        """Weight of each entity, counted once however many rows it has."""
+
+        return np.bincount(self.entities, weights=weights, minlength=self.n_entities) / self.entity_rows
+
+    def entity_means(self, weights: np.ndarray):
+        """Weighted mean time per entity, and which entities were drawn."""
+
+        drawn = np.bincount(self.entities, weights=weights, minlength=self.n_entities) > 0
+        timed = np.bincount(self.entities, weights=weights * self.timed, minlength=self.n_entities)
+        total = np.bincount(
+            self.entities, weights=weights * np.where(self.timed, self.times, 0.0), minlength=self.n_entities
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.Series(np.where(timed > 0, total / timed, np.nan)), drawn
+
+
+class SampleEstimator:
+    """Estimate audit statistics and their confidence intervals from a sample."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.thresholds = config.thresholds
+
+    def estimate(self, data: PerformanceData, info: SampleInfo) -> SampleEstimate:
+        """Point estimates from the sample and percentile bootstrap intervals."""
+
+        result = SampleEstimate(
+            fraction=info.fraction,
+            replicates=self.config.bootstrap_replicates,
+            sample_rows=dict(info.sample_rows),
+            population_rows=dict(info.population_rows),
+        )
+
+        frames = {
+            name: _Frame(df, info.units[name], ENTITY_COLUMNS[name])
+            for name, df in data.frames().items()
+            if name in ENTITY_COLUMNS and "execution_time" in df.columns
+        }
+        prepared = self._prepare(data, frames)
+
+        # The sample itself is the replicate that draws every sampled unit once
+        point = self._statistics(data, info, frames, prepared, {
+            name: (np.bincount(frame.units, minlength=len(info.unit_strata[name])) > 0).astype(np.int64)
+            for name, frame in frames.items()
+        })
+
+        rng = np.random.default_rng(info.seed + 1)
+        replicates = [
+            self._statistics(data, info, frames, prepared, {
+                name: bootstrap_weights(frame.units, info.unit_strata[name], rng)
+                for name, frame in frames.items()
+            })
+            for _ in range(self.config.bootstrap_replicates)
+        ]
+
+        alpha = (1 - CONFIDENCE) / 2
+        for name, value in point.items():
+            draws = np.array([r[name] for r in replicates], dtype=float)
+            low, high = np.nanquantile(draws, [alpha, 1 - alpha]) if len(draws) else (value, value)
+            result.estimates.append(Estimate(
+                statistic=name,
+                estimate=round(float(value), 2),
+                ci_low=round(float(low), 2),
+                ci_high=round(float(high), 2),
+            ))
+
+        return result
+
+    def _prepare(self, data: PerformanceData, frames: Dict[str, "_Frame"]) -> dict:
+        """Replicate-independent inputs: per-metric severities and scoped levels."""
+
+        prepared = {}
+
+        # ARMSET/UPMSET rows are sampled by row, so their no-op share is
+        # taken as sampled: (no-op time, time with writes recorded)
+        armset = data.armset if data.has_armset else None
+        written = written_rows(armset, "armset") if armset is not None else None
+        if written is not None:
+            times = armset["execution_time"].to_numpy(dtype=float, na_value=np.nan)
+            times = np.where(np.isnan(written), 0.0, np.nan_to_num(times))
+            prepared["armset_write_time"] = (times[written == 0].sum(), times.sum())
+
+        executions = frames.get("executions")
+        if executions is None:
+            return prepared
+
+        df = data.executions
+
+        # All rows of a sampled metric are kept, so its average, severity and
+        # dimension count are the same in every replicate
+        means, _ = executions.entity_means(np.ones(len(df)))
+        prepared["metric_severity"] = classify_severity(means, self.thresholds.metric_execution)
+
+        if "nb_dims" in df.columns:
+            dims = df["nb_dims"].to_numpy(dtype=float, na_value=np.nan)
+            with_dims = np.flatnonzero(dims > 0)
+            metric_dims = pd.Series(dims[with_dims]).groupby(executions.entities[with_dims]).first()
+            metric_dims = metric_dims.reindex(range(executions.n_entities))
+            prepared["metric_dims"] = metric_dims.to_numpy()
+            prepared["complexity_severity"] = classify_severity(metric_dims, self.thresholds.dimensions)
+
+        if {"jobType", "scoped_level"} <= set(df.columns):
+            formula = (df["jobType"] == "Formula").to_numpy()
+            levels = pd.Categorical(df["scoped_level"], categories=APPLICABLE_LEVELS).codes
+            prepared["formula"] = formula
+            prepared["scoped_level"] = np.where(formula, levels, -1)
+
+        written = written_rows(df, "executions")
+        if written is not None:
+            prepared["noop"] = written == 0
+            prepared["write_recorded"] = ~np.isnan(written)
+
+        return prepared
+
+    def _statistics(self, data, info, frames, prepared, unit_weights) -> Dict[str, float]:
+        """The estimated statistics for one set of unit weights."""
+
+        perf = PerformanceAnalysisResult()
+        scoping = ScopingAnalysisResult()
+        complexity = ComplexityAnalysisResult()
+        workload = WorkloadAnalysisResult()
+        write_path = WritePathAnalysisResult()
+        stats = {}
+
+        executions = frames.get("executions")
+        if executions is not None:
+            weights = executions.row_weights(unit_weights["executions"])
+            metric_weights = executions.entity_weights(weights)
+            population = info.population_entities.get("executions", executions.n_entities)
+            scale = population / metric_weights.sum() if metric_weights.sum() else 0.0
+
+            perf.metric_avg_execution_time_ms = executions.mean_time(weights)
+            counts = {
+                severity: (metric_weights * (prepared["metric_severity"] == severity)).sum() * scale
+                for severity in SEVERITIES
+            }
+            perf.metric_critical_count = counts["critical"]
+
+            if "metric_dims" in prepared:
+                dims = prepared["metric_dims"]
+                with_dims = metric_weights * ~np.isnan(dims)
+                complexity.total_metrics = with_dims.sum() * scale
+                complexity.critical_count = (with_dims * (prepared["complexity_severity"] == "critical")).sum() * scale
+                complexity.warning_count = (with_dims * (prepared["complexity_severity"] == "warning")).sum() * scale
+                if with_dims.sum():
+                    complexity.avg_dimensions = round(float(np.nansum(with_dims * dims) / with_dims.sum()), 2)
+
+            if "formula" in prepared:
+                scoping.total_formula_executions = weights[prepared["formula"]].sum()
+                levels = prepared["scoped_level"]
+                applicable = np.bincount(levels[levels >= 0], weights=weights[levels >= 0], minlength=3)
+                if applicable.sum():
+                    pct = np.round(applicable / applicable.sum() * 100, 1)
+                    scoping.fully_scoped_pct, scoping.partially_scoped_pct, scoping.no_change_pct = pct
+
+            stats.update({
+                "metric_p50_execution_time_ms": executions.percentile(weights, 0.5),
+                "metric_p95_execution_time_ms": executions.percentile(weights, 0.95),
+                "metric_p99_execution_time_ms": executions.percentile(weights, 0.99),
+                "metric_critical_count": counts["critical"],
+                "metric_warning_count": counts["warning"],
+                "metric_watch_count": counts["watch"],
+                "complexity_critical_count": complexity.critical_count,
+                "complexity_warning_count": complexity.warning_count,
+            })
+
+        views = frames.get("views")
+        if views is not None:
+            weights = views.row_weights(unit_weights["views"])
+
+            # Views are sampled by row, so their averages vary per replicate
+            means, drawn = views.entity_means(weights)
+            severity = classify_severity(means, self.thresholds.view_render)[drawn]
+            population = info.population_entities.get("views", views.n_entities)
+            scale = population / drawn.sum() if drawn.sum() else 0.0
+
+            workload.total_view_executions = weights.sum()
+            if weights.sum():
+                slow = views.timed & (np.nan_to_num(views.times) > self.thresholds.view_render.warning)
+                workload.slow_views_pct = round(float(weights[slow].sum() / weights.sum() * 100), 1)
+
+            stats.update({
+                "view_p50_execution_time_ms": views.percentile(weights, 0.5),
+                "view_p95_execution_time_ms": views.percentile(weights, 0.95),
+                "view_p99_execution_time_ms": views.percentile(weights, 0.99),
+                **{
+                    f"view_{severity_name}_count": (severity == severity_name).sum() * scale
+                    for severity_name in SEVERITIES
+                },
+            })
+
+        if "noop" in prepared or "armset_write_time" in prepared:
+            noop_time, write_time = prepared.get("armset_write_time", (0.0, 0.0))
+            if "noop" in prepared:
+                weighted = executions.row_weights(unit_weights["executions"]) * np.nan_to_num(executions.times)
+                noop_time += weighted[prepared["noop"]].sum()
+                write_time += weighted[prepared["write_recorded"]].sum()
+            write_path.noop_time_pct = round(float(noop_time / write_time * 100), 1) if write_time else 0.0
+            stats["noop_time_pct"] = write_path.noop_time_pct
+
+        scores = {
+            "performance_score": PerformanceAnalyzer(self.config)._calculate_score(perf),
+            "optimization_score": round(
+                ScopingAnalyzer(self.config)._calculate_score(scoping)
+                * WritePathAnalyzer(self.config)._calculate_penalty(write_path),
+                1,
+            ),
+            "complexity_score": ComplexityAnalyzer(self.config)._calculate_score(complexity),
+            "views_score": WorkloadAnalyzer(self.config)._calculate_score(workload),
+        }
+        return {"total_score": round(sum(scores.values()), 1), **scores, **stats}
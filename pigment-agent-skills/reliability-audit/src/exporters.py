@@ -0,0 +1,227 @@
+"""
+Bulk and tabular exporters for audit data and results.
+
+Full per-entity aggregate tables are not capped at
+``max_findings_per_category``: every metric, view and application is
+written, straight from the frames in buffered chunks. Audit results can
+also be flattened into typed tables for columnar (Parquet / Arrow IPC)
+output.
+"""
+
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from .atomic import atomic_path
+from .config import Config
+from .data_loader import PerformanceData
+from .scoring import ApplicationScore, ReliabilityScore
+from .analyzers.performance_analyzer import PerformanceFinding, classify_severity
+from .analyzers.scoping_analyzer import ScopingFinding
+from .analyzers.complexity_analyzer import ComplexityFinding
+from .analyzers.workload_analyzer import ApplicationWorkload
+from .analyzers.anomaly_analyzer import AnomalyFinding
+from .analyzers.change_impact_analyzer import ChangeImpactFinding
+from .analyzers.dependency_analyzer import CriticalPath, DependencyRoot
+from .analyzers.formula_analyzer import FormulaHotspot
+from .analyzers.worker_scaling_analyzer import WorkerScalingFit, WorkerScalingPoint, WorkerSizingFinding
+from .analyzers.write_path_analyzer import BlockWriteFinding, ChangeChurnFinding
+from .estimates import Estimate
+
+
+# Rows formatted and written per chunk
+EXPORT_CHUNK_ROWS = 100_000
+
+
+class AggregateExporter:
+    """Write complete per-entity aggregate tables as (optionally gzipped) CSV."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.thresholds = config.thresholds
+
+    def tables(self, data: PerformanceData) -> Dict[str, Callable[[], pd.DataFrame]]:
+        """Return builders for each available aggregate table, keyed by name."""
+
+        tables = {}
+        if data.has_executions:
+            tables["metric_aggregates"] = lambda: self.metric_aggregates(data.executions)
+            tables["application_aggregates"] = lambda: self.application_aggregates(data.executions)
+        if data.has_views:
+            tables["view_aggregates"] = lambda: self.view_aggregates(data.views)
+        return tables
+
+    def export(self, data: PerformanceData, output_dir: Path, timestamp: str) -> List[str]:
+        """Write every aggregate table and return the file paths."""
+
+        compression = self.config.export_compression or None
+        suffix = ".csv.gz" if compression == "gzip" else ".csv"
+
+        files = []
+        for name, build in self.tables(data).items():
+            path = output_dir / f"{name}_{timestamp}{suffix}"
+            write_csv(build(), path, compression)
+            files.append(str(path))
+
+        return files
+
+    def metric_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """One row per metric with execution-time, row and dimension stats."""
+
+        stats = df.groupby(
+            ["application", "metric_id", "metric_name"],
+            observed=True,
+            sort=False,
+        ).agg(
+            execution_count=("execution_time", "count"),
+            total_execution_time_ms=("execution_time", "sum"),
+            avg_execution_time_ms=("execution_time", "mean"),
+            max_execution_time_ms=("execution_time", "max"),
+            avg_computed_rows=("computed_rows", "mean"),
+            dimensions=("nb_dims", "first"),
+        ).reset_index()
+
+        stats["dimensions"] = stats["dimensions"].round().astype("Int64")
+        stats["severity"] = classify_severity(
+            stats["avg_execution_time_ms"], self.thresholds.metric_execution
+        )
+        return stats.sort_values("total_execution_time_ms", ascending=False)
+
+    def view_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """One row per view with render-time and row stats."""
+
+        stats = df.groupby(
+            ["app_id", "blockId", "blockName"],
+            observed=True,
+            sort=False,
+        ).agg(
+            execution_count=("execution_time", "count"),
+            total_execution_time_ms=("execution_time", "sum"),
+            avg_execution_time_ms=("execution_time", "mean"),
+            max_execution_time_ms=("execution_time", "max"),
+            avg_computed_rows=("computed_rows", "mean"),
+        ).reset_index()
+
+        stats["severity"] = classify_severity(
+            stats["avg_execution_time_ms"], self.thresholds.view_render
+        )
+        return stats.sort_values("total_execution_time_ms", ascending=False)
+
+    def application_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """One row per application with its share of total compute."""
+
+        stats = df.groupby("application", observed=True, sort=False).agg(
+            execution_count=("execution_time", "count"),
+            total_execution_time_ms=("execution_time", "sum"),
+            avg_execution_time_ms=("execution_time", "mean"),
+            unique_metrics=("metric_id", "nunique"),
+        ).reset_index()
+
+        total = stats["total_execution_time_ms"].sum()
+        stats["pct_of_total_time"] = (
+            (stats["total_execution_time_ms"] / total * 100).round(2) if total > 0 else 0.0
+        )
+        return stats.sort_values("total_execution_time_ms", ascending=False)
+
+
+def write_csv(df: pd.DataFrame, path: Path, compression: Optional[str] = None):
+    """Write a frame to CSV in buffered chunks."""
+
+    with atomic_path(path) as tmp:
+        df.to_csv(
+            tmp,
+            index=False,
+            chunksize=EXPORT_CHUNK_ROWS,
+            compression=compression,
+            float_format="%.2f",
+        )
+
+
+def records_frame(items: list, record_type: type) -> pd.DataFrame:
+    """Build a frame from dataclass records, keeping columns when empty."""
+
+    columns = [f.name for f in fields(record_type)]
+    return pd.DataFrame([asdict(item) for item in items], columns=columns)
+
+
+def score_tables(score: ReliabilityScore) -> Dict[str, pd.DataFrame]:
+    """Flatten a ReliabilityScore into typed tables keyed by name.
+
+    Every table carries an ``audit_timestamp`` column so tables from
+    successive audits can be appended into one history.
+    """
+
+    date_from, date_to = score.data_summary.get("date_range", (None, None))
+    summary = {
+        "total_score": float(score.total_score),
+        "grade": score.grade,
+        "performance_score": float(score.performance_score),
+        "optimization_score": float(score.optimization_score),
+        "complexity_score": float(score.complexity_score),
+        "views_score": float(score.views_score),
+        **{k: v for k, v in score.data_summary.items() if k != "date_range"},
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+
+    perf = score.performance_result
+    scoping = score.scoping_result
+    complexity = score.complexity_result
+    workload = score.workload_result
+    anomalies = score.anomaly_result
+    changes = score.change_impact_result
+    dependencies = score.dependency_result
+    formulas = score.formula_result
+    scaling = score.worker_scaling_result
+    writes = score.write_path_result
+
+    distributions = []
+    if complexity:
+        distributions += [("dimensions", k, v) for k, v in complexity.dims_distribution.items()]
+    if workload:
+        distributions += [("job_type", k, v) for k, v in workload.job_type_distribution.items()]
+        distributions += [("hour_pct", k, v) for k, v in workload.temporal_patterns.hourly_distribution.items()]
+        distributions += [("weekday_pct", k, v) for k, v in workload.temporal_patterns.daily_distribution.items()]
+
+    tables = {
+        "audit_summary": pd.DataFrame([summary]),
+        "metric_performance_findings": records_frame(perf.metric_findings if perf else [], PerformanceFinding),
+        "view_performance_findings": records_frame(perf.view_findings if perf else [], PerformanceFinding),
+        "scoping_findings": records_frame(scoping.findings if scoping else [], ScopingFinding),
+        "complexity_findings": records_frame(complexity.findings if complexity else [], ComplexityFinding),
+        "anomaly_findings": records_frame(anomalies.findings if anomalies else [], AnomalyFinding),
+        "change_impact_findings": records_frame(changes.findings if changes else [], ChangeImpactFinding),
+        "dependency_roots": records_frame(dependencies.root_findings if dependencies else [], DependencyRoot),
+        "critical_paths": records_frame(dependencies.critical_paths if dependencies else [], CriticalPath),
+        "formula_hotspots": records_frame(formulas.findings if formulas else [], FormulaHotspot),
+        "worker_scaling_fits": records_frame(scaling.fits if scaling else [], WorkerScalingFit),
+        "worker_scaling": records_frame(scaling.curve if scaling else [], WorkerScalingPoint),
+        "worker_sizing": records_frame(scaling.findings if scaling else [], WorkerSizingFinding),
+        "write_path_findings": records_frame(writes.block_findings if writes else [], BlockWriteFinding),
+        "change_churn": records_frame(writes.change_findings if writes else [], ChangeChurnFinding),
+        "sample_estimates": records_frame(score.sample_estimate.estimates if score.sample_estimate else [], Estimate),
+        "application_workloads": records_frame(workload.app_workloads if workload else [], ApplicationWorkload),
+        "application_scores": records_frame(score.application_scores, ApplicationScore),
+        "distributions": pd.DataFrame(
+            [(name, str(key), float(value)) for name, key, value in distributions],
+            columns=["distribution", "key", "value"],
+        ),
+    }
+
+    audit_timestamp = pd.Timestamp(score.timestamp)
+    for table in tables.values():
+        table.insert(0, "audit_timestamp", audit_timestamp)
+
+    return tables
+
+
+def write_columnar(df: pd.DataFrame, path: Path, fmt: str):
+    """Write a frame as Parquet or Arrow IPC (Feather v2); requires pyarrow."""
+
+    with atomic_path(path) as tmp:
+        if fmt == "parquet":
+            df.to_parquet(tmp, index=False)
+        else:
+            df.reset_index(drop=True).to_feather(tmp)
@@ -0,0 +1,152 @@
+"""
+Bounded-memory heavy-hitter tracking for execution workloads.
+
+Keeps the heaviest consumers of execution time (metrics, views, apps,
+changes) of a chunked input without holding an exact aggregate for every
+key. Execution time is tracked with a mergeable Space-Saving /
+Misra-Gries summary and execution counts with a Count-Min sketch, so both
+carry a known error bound. Frames already in memory are aggregated
+exactly by the analyzers instead.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Distinct hash keys for the two Count-Min hash functions (16 bytes each)
+_HASH_KEY_A = "audit-cms-hash-a"
+_HASH_KEY_B = "audit-cms-hash-b"
+
+
+@dataclass(slots=True)
+class HeavyHitter:
+    """A top consumer of execution time."""
+
+    entity_type: str  # "metric", "view", "application" or "change"
+    entity_id: str
+    entity_name: str
+    application: str
+    total_execution_time: float  # Lower bound
+    execution_count: int  # Upper bound
+    time_error_bound_ms: float  # True time is at most total + this
+    count_error_bound: int  # True count is at least count - this
+
+
+class CountMinSketch:
+    """Count-Min sketch over row keys, updated with vectorized hashing."""
+
+    def __init__(self, width: int = 2 ** 14, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    def update(self, keys: pd.DataFrame, weights: Optional[np.ndarray] = None):
+        """Add one observation (or its weight) per row of ``keys``."""
+
+        for row, idx in enumerate(self._indices(keys)):
+            self.table[row] += np.bincount(idx, weights=weights, minlength=self.width).astype(np.int64)
+        self.total += len(keys) if weights is None else int(np.sum(weights))
+
+    def estimate(self, keys: pd.DataFrame) -> np.ndarray:
+        """Return an upper-bound estimate per row of ``keys``."""
+
+        estimates = [self.table[row, idx] for row, idx in enumerate(self._indices(keys))]
+        return np.min(estimates, axis=0)
+
+    @property
+    def error_bound(self) -> int:
+        """Overestimate bound (e / width * total) that holds with high probability."""
+
+        return int(np.ceil(np.e / self.width * self.total))
+
+    def _indices(self, keys: pd.DataFrame):
+        # Double hashing: h_i = h_a + i * h_b
+        h_a = pd.util.hash_pandas_object(keys, index=False, hash_key=_HASH_KEY_A).to_numpy()
+        h_b = pd.util.hash_pandas_object(keys, index=False, hash_key=_HASH_KEY_B).to_numpy()
+        for row in range(self.depth):
+            yield ((h_a + np.uint64(row) * h_b) % np.uint64(self.width)).astype(np.intp)
+
+
+class HeavyHitters:
+    """Track the top consumers of execution time with bounded memory.
+
+    Each update pre-aggregates its chunk, merges it into the summary and,
+    once more than ``capacity`` keys are held, subtracts the
+    ``capacity + 1``-th largest total from every counter. Reported totals
+    therefore never exceed the true total and undershoot it by at most
+    ``time_error_bound_ms``, which is itself at most total time divided
+    by ``capacity + 1``.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        id_col: str,
+        name_col: Optional[str] = None,
+        app_col: Optional[str] = None,
+        capacity: int = 1000,
+    ):
+        self.entity_type = entity_type
+        self.id_col = id_col
+        self.name_col = name_col
+        self.app_col = app_col
+        self.capacity = capacity
+        self.keys = list(dict.fromkeys(c for c in (app_col, id_col, name_col) if c))
+
+        self.counts = CountMinSketch()
+        self.total_time = 0.0
+        self.time_error = 0.0
+        self._summary: Optional[pd.Series] = None
+
+    def update(self, df: pd.DataFrame):
+        """Merge a chunk of executions into the summary."""
+
+        df = df.dropna(subset=self.keys)
+        if len(df) == 0:
+            return
+
+        self.counts.update(df[self.keys])
+
+        chunk = df.groupby(self.keys, observed=True, sort=False)["execution_time"].sum()
+        self.total_time += chunk.sum()
+
+        merged = chunk if self._summary is None else pd.concat([self._summary, chunk])
+        merged = merged.groupby(level=list(range(len(self.keys))), observed=True, sort=False).sum()
+
+        if len(merged) > self.capacity:
+            cut = merged.nlargest(self.capacity + 1).iloc[-1]
+            merged = merged[merged > cut] - cut
+            self.time_error += cut
+
+        self._summary = merged
+
+    def top(self, k: int) -> List[HeavyHitter]:
+        """Return the ``k`` heaviest consumers, largest first."""
+
+        if self._summary is None or len(self._summary) == 0:
+            return []
+
+        top = self._summary.nlargest(k).reset_index(name="total_time")
+        counts = self.counts.estimate(top[self.keys])
+        count_error = self.counts.error_bound
+
+        hitters = []
+        for row, count in zip(top.itertuples(index=False), counts):
+            values = row._asdict()
+            entity_id = values[self.id_col]
+            hitters.append(HeavyHitter(
+                entity_type=self.entity_type,
+                entity_id=entity_id,
+                entity_name=values[self.name_col] if self.name_col else entity_id,
+                application=values[self.app_col] if self.app_col else "",
+                total_execution_time=round(float(values["total_time"]), 2),
+                execution_count=int(count),
+                time_error_bound_ms=round(float(self.time_error), 2),
+                count_error_bound=count_error,
+            ))
+
+        return hitters
@@ -0,0 +1,378 @@
+"""
+Precompiled templates for the HTML report.
+
+The page shell is a ``string.Template`` compiled once at import. Findings
+tables are not rendered server-side: their rows are embedded once as
+compact JSON and drawn in the browser with pagination and virtual
+scrolling, so report size and generation time grow only with the data
+itself rather than with the markup per row.
+"""
+
+from string import Template
+
+
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Pigment Reliability Audit Report</title>
+    <style>
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #1f2937;
+            background: #f9fafb;
+            padding: 2rem;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        h1 { color: #111827; margin-bottom: 0.5rem; }
+        h2 { color: #374151; margin: 2rem 0 1rem; border-bottom: 2px solid #e5e7eb; padding-bottom: 0.5rem; }
+        h3 { color: #4b5563; margin: 1.5rem 0 0.75rem; }
+        .timestamp { color: #6b7280; font-size: 0.875rem; margin-bottom: 2rem; }
+
+        .score-card {
+            background: white;
+            border-radius: 1rem;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+            margin-bottom: 2rem;
+        }
+        .score-header {
+            display: flex;
+            align-items: center;
+            gap: 2rem;
+            margin-bottom: 1.5rem;
+        }
+        .grade {
+            width: 100px;
+            height: 100px;
+            border-radius: 50%;
+            background: ${grade_color};
+            color: white;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 3rem;
+            font-weight: bold;
+        }
+        .total-score {
+            font-size: 2rem;
+            font-weight: bold;
+        }
+        .total-score span { font-size: 1rem; color: #6b7280; }
+
+        .score-breakdown {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+        }
+        .score-item {
+            background: #f3f4f6;
+            padding: 1rem;
+            border-radius: 0.5rem;
+        }
+        .score-item-label { font-size: 0.875rem; color: #6b7280; }
+        .score-item-value { font-size: 1.5rem; font-weight: bold; }
+        .score-bar {
+            height: 8px;
+            background: #e5e7eb;
+            border-radius: 4px;
+            margin-top: 0.5rem;
+            overflow: hidden;
+        }
+        .score-bar-fill {
+            height: 100%;
+            border-radius: 4px;
+            transition: width 0.3s;
+        }
+
+        .recommendations {
+            background: white;
+            border-radius: 1rem;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+            margin-bottom: 2rem;
+        }
+        .recommendation {
+            padding: 0.75rem 1rem;
+            margin: 0.5rem 0;
+            background: #fef3c7;
+            border-left: 4px solid #f59e0b;
+            border-radius: 0 0.5rem 0.5rem 0;
+        }
+        .recommendation.critical {
+            background: #fee2e2;
+            border-left-color: #ef4444;
+        }
+
+        .findings {
+            background: white;
+            border-radius: 1rem;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+            margin-bottom: 2rem;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.875rem;
+        }
+        th, td {
+            padding: 0.75rem;
+            text-align: left;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        th { background: #f9fafb; font-weight: 600; }
+        tr:hover { background: #f9fafb; }
+
+        .severity {
+            padding: 0.25rem 0.5rem;
+            border-radius: 0.25rem;
+            font-size: 0.75rem;
+            font-weight: 600;
+            text-transform: uppercase;
+        }
+        .severity.critical { background: #fee2e2; color: #dc2626; }
+        .severity.warning { background: #fef3c7; color: #d97706; }
+        .severity.watch { background: #dbeafe; color: #2563eb; }
+
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 1rem;
+            margin: 1rem 0;
+        }
+        .stat {
+            background: #f3f4f6;
+            padding: 1rem;
+            border-radius: 0.5rem;
+            text-align: center;
+        }
+        .stat-value { font-size: 1.5rem; font-weight: bold; color: #111827; }
+        .stat-label { font-size: 0.75rem; color: #6b7280; }
+        .data-table { margin-top: 0.5rem; font-size: 0.875rem; }
+        .dt-toolbar {
+            display: flex;
+            align-items: center;
+            gap: 0.75rem;
+            margin-bottom: 0.5rem;
+            color: #6b7280;
+        }
+        .dt-toolbar input, .dt-toolbar select, .dt-toolbar button {
+            font: inherit;
+            padding: 0.25rem 0.5rem;
+            border: 1px solid #e5e7eb;
+            border-radius: 0.25rem;
+            background: white;
+        }
+        .dt-toolbar .dt-info { margin-left: auto; }
+        .dt-row {
+            display: grid;
+            align-items: center;
+            height: 37px;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        .dt-row:hover { background: #f9fafb; }
+        .dt-head { background: #f9fafb; font-weight: 600; cursor: pointer; user-select: none; }
+        .dt-cell { padding: 0 0.75rem; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+        .dt-viewport { position: relative; overflow-y: auto; }
+        .dt-viewport .dt-row { position: absolute; left: 0; right: 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🔍 Pigment Reliability Audit Report</h1>
+        <p class="timestamp">Generated: ${timestamp}</p>
+
+        <div class="score-card">
+            <div class="score-header">
+                <div class="grade">${grade}</div>
+                <div>
+                    <div class="total-score">${total_score} <span>/ 100</span></div>
+                    <div style="color: #6b7280">Overall Reliability Score</div>
+                </div>
+            </div>
+
+            <div class="score-breakdown">
+                ${score_items}
+            </div>
+        </div>
+
+
+${sections}
+    </div>
+    <script type="application/json" id="audit-data">${table_data}</script>
+    <script>${table_script}</script>
+</body>
+</html>""")
+
+
+# Renders every <div class="data-table" data-table="..."> from #audit-data.
+# Only the rows inside the scroll viewport (plus a small buffer) exist in
+# the DOM at any time.
+TABLE_SCRIPT = """
+(function () {
+    var ROW_HEIGHT = 37;
+    var VISIBLE_ROWS = 15;
+    var BUFFER_ROWS = 10;
+    var PAGE_SIZES = [50, 500, 0];
+    var tables = JSON.parse(document.getElementById("audit-data").textContent);
+
+    function format(value, type) {
+        if (value === null || value === undefined || value === "") return "-";
+        switch (type) {
+            case "ms": return Math.round(value).toLocaleString() + " ms";
+            case "s": return (value / 1000).toLocaleString(undefined, {minimumFractionDigits: 1, maximumFractionDigits: 1}) + "s";
+            case "int": return Math.round(value).toLocaleString();
+            case "pct": return Number(value).toFixed(1) + "%";
+            case "num": return Number(value).toLocaleString(undefined, {maximumFractionDigits: 2});
+            default: return String(value);
+        }
+    }
+
+    function element(tag, className, text) {
+        var el = document.createElement(tag);
+        if (className) el.className = className;
+        if (text !== undefined) el.textContent = text;
+        return el;
+    }
+
+    function DataTable(root, spec) {
+        this.spec = spec;
+        this.filtered = spec.rows;
+        this.page = 0;
+        this.pageSize = PAGE_SIZES[0];
+        this.sortColumn = -1;
+        this.sortAsc = true;
+        this.template = "repeat(" + spec.columns.length + ", minmax(0, 1fr))";
+        this.build(root);
+        this.refresh();
+    }
+
+    DataTable.prototype.build = function (root) {
+        var self = this;
+        var toolbar = element("div", "dt-toolbar");
+
+        this.filterInput = element("input");
+        this.filterInput.placeholder = "Filter…";
+        this.filterInput.addEventListener("input", function () { self.applyFilter(); });
+        toolbar.appendChild(this.filterInput);
+
+        var sizeSelect = element("select");
+        PAGE_SIZES.forEach(function (size) {
+            var option = element("option", null, size ? size + " / page" : "All");
+            option.value = size;
+            sizeSelect.appendChild(option);
+        });
+        sizeSelect.addEventListener("change", function () {
+            self.pageSize = Number(sizeSelect.value);
+            self.page = 0;
+            self.refresh();
+        });
+        toolbar.appendChild(sizeSelect);
+
+        this.prevButton = element("button", null, "‹ Prev");
+        this.prevButton.addEventListener("click", function () { self.page--; self.refresh(); });
+        this.nextButton = element("button", null, "Next ›");
+        this.nextButton.addEventListener("click", function () { self.page++; self.refresh(); });
+        toolbar.appendChild(this.prevButton);
+        toolbar.appendChild(this.nextButton);
+
+        this.info = element("span", "dt-info");
+        toolbar.appendChild(this.info);
+        root.appendChild(toolbar);
+
+        var header = element("div", "dt-row dt-head");
+        header.style.gridTemplateColumns = this.template;
+        this.spec.columns.forEach(function (column, index) {
+            var cell = element("div", "dt-cell", column.label);
+            cell.addEventListener("click", function () { self.sortBy(index); });
+            header.appendChild(cell);
+        });
+        root.appendChild(header);
+
+        this.viewport = element("div", "dt-viewport");
+        this.spacer = element("div");
+        this.viewport.appendChild(this.spacer);
+        this.viewport.addEventListener("scroll", function () { self.draw(); });
+        root.appendChild(this.viewport);
+    };
+
+    DataTable.prototype.applyFilter = function () {
+        var query = this.filterInput.value.toLowerCase();
+        this.filtered = !query ? this.spec.rows : this.spec.rows.filter(function (row) {
+            return row.some(function (value) {
+                return value !== null && String(value).toLowerCase().indexOf(query) !== -1;
+            });
+        });
+        this.page = 0;
+        this.refresh();
+    };
+
+    DataTable.prototype.sortBy = function (index) {
+        this.sortAsc = this.sortColumn === index ? !this.sortAsc : false;
+        this.sortColumn = index;
+        var direction = this.sortAsc ? 1 : -1;
+        this.filtered = this.filtered.slice().sort(function (a, b) {
+            if (a[index] === b[index]) return 0;
+            if (a[index] === null) return 1;
+            if (b[index] === null) return -1;
+            return a[index] < b[index] ? -direction : direction;
+        });
+        this.refresh();
+    };
+
+    DataTable.prototype.refresh = function () {
+        var total = this.filtered.length;
+        var size = this.pageSize || Math.max(total, 1);
+        var pages = Math.max(Math.ceil(total / size), 1);
+        this.page = Math.min(Math.max(this.page, 0), pages - 1);
+
+        this.start = this.page * size;
+        this.end = Math.min(this.start + size, total);
+        this.info.textContent = total
+            ? (this.start + 1).toLocaleString() + "–" + this.end.toLocaleString() + " of " + total.toLocaleString()
+            : "No rows";
+        this.prevButton.disabled = this.page === 0;
+        this.nextButton.disabled = this.page >= pages - 1;
+
+        var rows = this.end - this.start;
+        this.spacer.style.height = rows * ROW_HEIGHT + "px";
+        this.viewport.style.height = Math.min(Math.max(rows, 1), VISIBLE_ROWS) * ROW_HEIGHT + "px";
+        this.viewport.scrollTop = 0;
+        this.draw();
+    };
+
+    DataTable.prototype.draw = function () {
+        var columns = this.spec.columns;
+        var first = Math.max(Math.floor(this.viewport.scrollTop / ROW_HEIGHT) - BUFFER_ROWS, 0);
+        var last = Math.min(first + VISIBLE_ROWS + 2 * BUFFER_ROWS, this.end - this.start);
+
+        while (this.viewport.childNodes.length > 1) this.viewport.removeChild(this.viewport.lastChild);
+
+        for (var i = first; i < last; i++) {
+            var row = this.filtered[this.start + i];
+            var line = element("div", "dt-row");
+            line.style.gridTemplateColumns = this.template;
+            line.style.top = i * ROW_HEIGHT + "px";
+            columns.forEach(function (column, index) {
+                var cell = element("div", "dt-cell");
+                var text = format(row[index], column.type);
+                if (column.badge !== undefined) {
+                    cell.appendChild(element("span", "severity " + row[column.badge], text));
+                } else {
+                    cell.textContent = text;
+                }
+                line.appendChild(cell);
+            });
+            this.viewport.appendChild(line);
+        }
+    };
+
+    document.querySelectorAll(".data-table").forEach(function (root) {
+        new DataTable(root, tables[root.getAttribute("data-table")]);
+    });
+})();
+"""
@@ -14,13 +14,28 @@ Options:
     --views PATH        Path to views CSV
     --armset PATH       Path to ARMSET/UPMSET CSV
     --output-dir PATH   Output directory for reports
-    --format FORMAT     Output format: csv, html, or all (default: all)
+    --format FORMAT     Output format: csv, html, json, parquet, arrow, or all (default: all)
+    --stdout            Stream the JSON result to stdout instead of writing files
+    --sync-audit-logs   Fetch new Audit Logs API events into the local event store
+    --enrich            Join Metadata API application/block attributes (cached locally)
+    --full-export       Also write complete per-entity aggregate tables
+    --per-app           Also write one report set per application, in parallel
+    --per-org           Also write one report set per organization, in parallel
+    --workers N         Worker processes for --per-app / --per-org (default: CPU count)
+
+Subcommands:
+    query SQL           Run ad-hoc SQL over the data (see ``query --help``)
 """
 
 import argparse
+import importlib.util
+import sqlite3
 import sys
+from dataclasses import replace
 from pathlib import Path
 
+import pandas as pd
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -28,6 +43,12 @@ from src.config import load_config
 from src.data_loader import DataLoader
 from src.scoring import ReliabilityScorer
 from src.report_generator import ReportGenerator
+from src.batch import BatchAuditRunner
+from src.api_client import APIError
+from src.audit_logs import AuditLogSync
+from src.query_store import QueryStore, source_key
+from src.progressive import ProgressiveLoader
+from src import serialization
 
 
 def print_banner():
@@ -67,6 +88,23 @@ def print_score_summary(score):
     └── Views:         {score.views_score}/25
     """)
 
+    estimate = score.sample_estimate
+    if estimate is not None:
+        confidence = f"{estimate.confidence:.0%} CI"
+        print(f"Estimated from a {estimate.fraction:.0%} sample ({estimate.replicates} bootstrap replicates):")
+        print("-" * 60)
+        for name, label in [
+            ("total_score", "Total Score"),
+            ("metric_p95_execution_time_ms", "Metric P95 (ms)"),
+            ("view_p95_execution_time_ms", "View P95 (ms)"),
+            ("metric_critical_count", "Critical Metrics"),
+            ("view_critical_count", "Critical Views"),
+        ]:
+            e = estimate.get(name)
+            if e is not None:
+                print(f"  {label + ':':<18} {e.estimate:>12,.1f}  ({confidence} {e.ci_low:,.1f} – {e.ci_high:,.1f})")
+        print()
+
     if score.recommendations:
         print("Top Recommendations:")
         print("-" * 60)
@@ -76,9 +114,126 @@ def print_score_summary(score):
     print("=" * 60 + "\n")
 
 
+def data_overrides(args, config) -> dict:
+    """Config overrides for the data source arguments, with sample defaults."""
+
+    overrides = {}
+    if args.executions:
+        overrides["executions_csv"] = args.executions
+    if args.views:
+        overrides["views_csv"] = args.views
+    if args.armset:
+        overrides["armset_csv"] = args.armset
+
+    # Set default paths if not provided
+    if not (overrides.get("executions_csv") or config.executions_csv):
+        overrides["executions_csv"] = "sample-data/1. Executions.csv"
+    if not (overrides.get("views_csv") or config.views_csv):
+        overrides["views_csv"] = "sample-data/6. Views Executions.csv"
+    if not (overrides.get("armset_csv") or config.armset_csv):
+        overrides["armset_csv"] = "sample-data/2. Armset and Upmset Executions.csv"
+
+    return overrides
+
+
+def query_main(argv) -> int:
+    """Run ad-hoc SQL against the embedded analytical store."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main query",
+        description="Run SQL over the executions, views and armset tables",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Applications by total compute load
+  python -m src.main query "SELECT application, SUM(execution_time) AS total
+                            FROM executions GROUP BY application ORDER BY total DESC"
+
+  # Daily view render time for one application, as CSV
+  python -m src.main query --output csv \\
+      "SELECT day, SUM(execution_time) FROM views WHERE app_id = 'APP_1' GROUP BY day"
+
+  # List tables and columns
+  python -m src.main query --tables
+        """
+    )
+    parser.add_argument("sql", nargs="?", help="SQL statement, or - to read it from stdin")
+    parser.add_argument("--config", type=str, default=None, help="Path to configuration YAML file")
+    parser.add_argument("--executions", type=str, default=None, help="Path to executions CSV file")
+    parser.add_argument("--views", type=str, default=None, help="Path to views CSV file")
+    parser.add_argument("--armset", type=str, default=None, help="Path to ARMSET/UPMSET CSV file")
+    parser.add_argument(
+        "--output",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="Result format (default: table)"
+    )
+    parser.add_argument("--tables", action="store_true", help="List stored tables and their columns")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild the store from the CSV files")
+    args = parser.parse_args(argv)
+
+    if not args.sql and not args.tables:
+        parser.error("an SQL statement or --tables is required")
+
+    try:
+        config = load_config(args.config)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: Invalid configuration: {e}")
+        return 1
+
+    # The store always holds every row, whatever the audit sample setting
+    config = replace(config, **data_overrides(args, config), sample_fraction=None)
+
+    loader = DataLoader(config, quiet=True)
+    store_path = Path(config.query_store_path)
+    if not store_path.is_absolute():
+        store_path = loader.base_dir / store_path
+
+    store = QueryStore(store_path)
+    try:
+        key = source_key(config, loader.base_dir)
+        if args.refresh or not store.is_current(key):
+            print("📂 Loading data into the query store...", file=sys.stderr)
+            data = loader.load()
+            if not data.has_executions and not data.has_views:
+                print("❌ Error: No data loaded. Please check your CSV file paths.")
+                return 1
+            counts = store.load(data, key)
+            print(
+                "   ✓ " + ", ".join(f"{rows:,} {name}" for name, rows in counts.items()),
+                file=sys.stderr,
+            )
+
+        if args.tables:
+            for name, columns in store.tables().items():
+                print(f"{name}: {', '.join(columns)}")
+            return 0
+
+        sql = sys.stdin.read() if args.sql == "-" else args.sql
+        try:
+            result = store.query(sql)
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            print(f"❌ Error: Query failed: {e}")
+            return 1
+    finally:
+        store.close()
+
+    if args.output == "csv":
+        result.to_csv(sys.stdout, index=False)
+    elif args.output == "json":
+        print(result.to_json(orient="records", date_format="iso"))
+    else:
+        print(result.to_string(index=False))
+
+    return 0
+
+
 def main():
     """Main entry point."""
 
+    if sys.argv[1:2] == ["query"]:
+        return query_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="Pigment Workspace Reliability Audit Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -95,6 +250,24 @@ Examples:
 
   # Generate only HTML report
   python -m src.main --format html
+
+  # Also write one report set per application using 8 workers
+  python -m src.main --per-app --workers 8
+
+  # Audit every organization separately, with a global roll-up
+  python -m src.main --per-org
+
+  # Pipe the JSON result into another tool without touching disk
+  python -m src.main --stdout | jq .total_score
+
+  # Write typed Parquet tables for BI tools
+  python -m src.main --format parquet
+
+  # Quick audit of a 5% stratified sample, with confidence intervals
+  python -m src.main --sample 0.05
+
+  # Show a partial score every 30s while loading; stop once it is stable
+  python -m src.main --progress 30 --progress-stop-delta 0.5
         """
     )
 
@@ -131,9 +304,70 @@ Examples:
     parser.add_argument(
         "--format",
         type=str,
-        choices=["csv", "html", "all"],
+        choices=["csv", "html", "json", "parquet", "arrow", "all"],
         default="all",
-        help="Output format (default: all)"
+        help="Output format; parquet and arrow require pyarrow (default: all = csv and html)"
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Write the JSON result to stdout instead of report files (implies --quiet)"
+    )
+    parser.add_argument(
+        "--sync-audit-logs",
+        action="store_true",
+        help="Incrementally sync Audit Logs API events into the local store before auditing"
+    )
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Enrich data with Metadata API attributes (requires api.metadata_api_key)"
+    )
+    parser.add_argument(
+        "--full-export",
+        action="store_true",
+        help="Also write complete per-entity aggregate tables (uncapped)"
+    )
+    parser.add_argument(
+        "--sample",
+        type=float,
+        nargs="?",
+        const=0.1,
+        default=None,
+        metavar="FRACTION",
+        help="Audit a stratified sample of the data and estimate confidence intervals (default fraction: 0.1)"
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        nargs="?",
+        const=10.0,
+        default=None,
+        metavar="SECONDS",
+        help="Load in chunks and print a partial score, throughput and ETA at this interval (default: 10)"
+    )
+    parser.add_argument(
+        "--progress-stop-delta",
+        type=float,
+        default=None,
+        metavar="POINTS",
+        help="With --progress, stop reading once successive partial scores agree within this many points"
+    )
+    parser.add_argument(
+        "--per-app",
+        action="store_true",
+        help="Also generate reports for each application in parallel, with a manifest"
+    )
+    parser.add_argument(
+        "--per-org",
+        action="store_true",
+        help="Also audit each organization (org_id) in parallel, with a roll-up manifest"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --per-app / --per-org (default: CPU count)"
     )
     parser.add_argument(
         "--quiet",
@@ -143,6 +377,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # Stdout carries the JSON document only
+    if args.stdout:
+        args.quiet = True
+
     if not args.quiet:
         print_banner()
 
@@ -150,37 +388,72 @@ Examples:
     if not args.quiet:
         print("📋 Loading configuration...")
 
-    config = load_config(args.config)
+    try:
+        config = load_config(args.config)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: Invalid configuration: {e}")
+        sys.exit(1)
 
     # Override config with command line arguments
-    if args.executions:
-        config.executions_csv = args.executions
-    if args.views:
-        config.views_csv = args.views
-    if args.armset:
-        config.armset_csv = args.armset
+    overrides = data_overrides(args, config)
     if args.output_dir:
-        config.output_directory = args.output_dir
+        overrides["output_directory"] = args.output_dir
+    if args.full_export:
+        overrides["export_full_tables"] = True
+    if args.enrich:
+        overrides["enrich_metadata"] = True
+    if args.sample is not None:
+        overrides["sample_fraction"] = args.sample
+    if args.progress is not None:
+        overrides["progress_interval_seconds"] = args.progress
+    if args.progress_stop_delta is not None:
+        overrides["progress_stop_delta"] = args.progress_stop_delta
     if args.format == "all":
-        config.output_formats = ["csv", "html"]
+        overrides["output_formats"] = ("csv", "html")
     else:
-        config.output_formats = [args.format]
+        overrides["output_formats"] = (args.format,)
 
-    # Set default paths if not provided
-    if not config.executions_csv:
-        config.executions_csv = "sample-data/1. Executions.csv"
-    if not config.views_csv:
-        config.views_csv = "sample-data/6. Views Executions.csv"
-    if not config.armset_csv:
-        config.armset_csv = "sample-data/2. Armset and Upmset Executions.csv"
+    try:
+        config = replace(config, **overrides)
+    except ValueError as e:
+        print(f"❌ Error: Invalid configuration: {e}")
+        sys.exit(1)
+
+    if args.sync_audit_logs and not config.audit_logs_api_key:
+        print("❌ Error: --sync-audit-logs requires api.audit_logs_api_key in the configuration.")
+        sys.exit(1)
+
+    if config.enrich_metadata and not config.metadata_api_key:
+        print("❌ Error: --enrich requires api.metadata_api_key in the configuration.")
+        sys.exit(1)
+
+    if set(config.output_formats) & {"parquet", "arrow"} and importlib.util.find_spec("pyarrow") is None:
+        print("❌ Error: parquet/arrow output requires pyarrow (pip install pyarrow).")
+        sys.exit(1)
+
+    if args.sync_audit_logs:
+        if not args.quiet:
+            print("\n🔄 Syncing audit log events...")
+
+        try:
+            AuditLogSync(config, quiet=args.quiet).sync()
+        except (APIError, OSError) as e:
+            print(f"❌ Error: Audit log sync failed: {e}")
+            sys.exit(1)
 
     # Load data
     if not args.quiet:
         print("\n📂 Loading data...")
 
-    loader = DataLoader(config, quiet=args.quiet)
+    if config.progress_interval_seconds:
+        loader = ProgressiveLoader(config, quiet=args.quiet, publish=not args.stdout)
+    else:
+        loader = DataLoader(config, quiet=args.quiet)
     data = loader.load()
 
+    if isinstance(loader, ProgressiveLoader) and loader.progress.stopped_early and not args.quiet:
+        print(f"Warning: auditing only the first {loader.progress.fraction:.0%} of the input")
+
     if not data.has_executions and not data.has_views:
         print("❌ Error: No data loaded. Please check your CSV file paths.")
         sys.exit(1)
@@ -202,18 +475,51 @@ Examples:
     if not args.quiet:
         print_score_summary(score)
 
+    if args.stdout:
+        serialization.dump(score, sys.stdout.buffer)
+        return 0
+
     # Generate reports
     if not args.quiet:
         print("📄 Generating reports...")
 
     generator = ReportGenerator(config)
-    files = generator.generate(score)
+    files = generator.generate(score, data)
 
     if not args.quiet:
         print("\n✅ Reports generated:")
         for f in files:
             print(f"   → {f}")
 
+    if args.per_app:
+        if not args.quiet:
+            print("\n🗂️  Generating per-application reports...")
+
+        try:
+            manifest = BatchAuditRunner(config, workers=args.workers, quiet=args.quiet).run(data)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
+        if not args.quiet:
+            print(f"   → {manifest}")
+
+    if args.per_org:
+        if not args.quiet:
+            print("\n🏢 Generating per-organization reports...")
+
+        try:
+            manifest = BatchAuditRunner(
+                config, workers=args.workers, shard_by="organization", quiet=args.quiet
+            ).run(data)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
+        if not args.quiet:
+            print(f"   → {manifest}")
+
+    if not args.quiet:
         print("\n🎉 Audit complete!")
 
     return 0
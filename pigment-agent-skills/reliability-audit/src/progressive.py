@@ -0,0 +1,291 @@
+"""
+Progressive loading with anytime results.
+
+The CSVs are read in chunks, interleaved so every file advances at the
+same share of its bytes. At intervals the rows read so far are scored,
+and the partial ``ReliabilityScore`` is published with rows processed,
+throughput and ETA: printed to the console and written atomically to
+``audit_progress.json`` in the output directory for other tools to poll.
+
+Snapshots re-score everything read so far, so their cost grows with the
+input. The gap between snapshots is stretched to keep their share of the
+run time under ``SNAPSHOT_SHARE``. Reading stops early when the total score
+of the last ``STABLE_SNAPSHOTS`` snapshots lies within the configured delta,
+or on Ctrl-C. The audit then covers the rows read up to that point.
+Snapshots are taken from the start of each file, so they only converge on
+the final score when the files are not ordered by something that moves it
+(such as time, when performance drifts).
+
+Each chunk also feeds bounded-memory heavy-hitter summaries, so every
+snapshot publishes the top consumers read so far, with their error
+bounds, without aggregating the earlier chunks again. The final audit
+aggregates the loaded frames exactly.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .atomic import atomic_open
+from .data_loader import DataLoader, PerformanceData, encode_ids
+from .heavy_hitters import HeavyHitters
+from .scoring import ReliabilityScore, ReliabilityScorer
+from . import serialization
+
+
+# Rows per CSV chunk
+CHUNK_ROWS = 250_000
+
+# Largest share of the run time spent scoring snapshots
+SNAPSHOT_SHARE = 0.2
+
+# Snapshots whose total scores must agree before reading stops early
+STABLE_SNAPSHOTS = 3
+
+PROGRESS_FILE = "audit_progress.json"
+
+# Top consumers tracked per frame: (entity type, ID, name and application
+# columns). ARMSET/UPMSET changes share the executions' change summary.
+TRACKED: Dict[str, List[Tuple[str, str, Optional[str], Optional[str]]]] = {
+    "executions": [
+        ("metric", "metric_id", "metric_name", "application"),
+        ("application", "application", None, None),
+        ("change", "changeId", None, "application"),
+    ],
+    "views": [("view", "blockId", "blockName", "app_id")],
+    "armset": [("change", "changeId", None, "application")],
+}
+
+
+@dataclass
+class LoadProgress:
+    """How far a progressive load has got."""
+
+    rows: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    fraction: float = 0.0
+    rows_per_second: float = 0.0
+    eta_seconds: Optional[float] = None
+    snapshots: int = 0
+    stopped_early: bool = False
+
+
+class _CsvStream:
+    """Chunked reader of one CSV file that reports its byte position."""
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.size = path.stat().st_size
+        self.handle = open(path, "rb")
+        self.reader = pd.read_csv(self.handle, chunksize=CHUNK_ROWS)
+        self.started = False
+        self.done = False
+
+    @property
+    def position(self) -> int:
+        # The parser buffers ahead, so a small file may look fully read
+        # before its first chunk is returned
+        if self.done:
+            return self.size
+        return min(self.handle.tell(), self.size) if self.started else 0
+
+    def read(self) -> Optional[pd.DataFrame]:
+        self.started = True
+        try:
+            return next(self.reader)
+        except StopIteration:
+            self.done = True
+            return None
+
+    def close(self):
+        self.reader.close()
+        self.handle.close()
+
+
+def format_duration(seconds: float) -> str:
+    """Seconds as ``1h 02m``, ``3m 05s`` or ``12s``."""
+
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressiveLoader(DataLoader):
+    """Load the configured CSVs in chunks, publishing partial scores on the way."""
+
+    def __init__(self, config, quiet: bool = False, publish: bool = True):
+        super().__init__(config, quiet=quiet)
+        self.interval = config.progress_interval_seconds
+        self.publish = publish
+        self.progress = LoadProgress()
+        self.history: List[float] = []
+        self.heavy_hitters: Dict[str, HeavyHitters] = {}
+
+    def load(self) -> PerformanceData:
+        """Read every configured CSV (or until the score is stable) and prepare it."""
+
+        streams = self._open_streams()
+        chunks: Dict[str, List[pd.DataFrame]] = {stream.name: [] for stream in streams}
+        self.progress.total_bytes = sum(stream.size for stream in streams)
+
+        started = time.monotonic()
+        next_snapshot = started + self.interval
+
+        try:
+            while not all(stream.done for stream in streams):
+                # Advance the file that is furthest behind, by bytes
+                stream = min(
+                    (s for s in streams if not s.done),
+                    key=lambda s: s.position / s.size if s.size else 1.0,
+                )
+                try:
+                    chunk = stream.read()
+                except Exception as e:
+                    if not self.quiet:
+                        print(f"Error loading {stream.name} CSV: {e}")
+                    stream.done = True
+                    chunks[stream.name] = []
+                    continue
+
+                if chunk is not None:
+                    self.progress.rows += len(chunk)
+                    chunk = self._prepare_chunk(stream.name, chunk)
+                    chunks[stream.name].append(chunk)
+                    self._track(stream.name, chunk)
+
+                self._update(streams, started)
+                if time.monotonic() < next_snapshot or all(s.done for s in streams):
+                    continue
+
+                snapshot_started = time.monotonic()
+                score = self._snapshot(chunks)
+                duration = time.monotonic() - snapshot_started
+                next_snapshot = time.monotonic() + max(
+                    self.interval, duration * (1 - SNAPSHOT_SHARE) / SNAPSHOT_SHARE
+                )
+
+                if self._stable(score):
+                    self.progress.stopped_early = True
+                    if not self.quiet:
+                        print(
+                            f"   ✓ Score stable within {self.config.progress_stop_delta:g} over "
+                            f"{STABLE_SNAPSHOTS} snapshots; stopping at {self.progress.fraction:.0%} of the input"
+                        )
+                    break
+        except KeyboardInterrupt:
+            self.progress.stopped_early = True
+            if not self.quiet:
+                print(f"\n   ✋ Interrupted; auditing the {self.progress.fraction:.0%} of the input read so far")
+        finally:
+            for stream in streams:
+                stream.close()
+
+        return self._prepare(self._frames(chunks), self._load_audit_events())
+
+    def _open_streams(self) -> List[_CsvStream]:
+        streams = []
+        for name, path in (
+            ("executions", self.config.executions_csv),
+            ("views", self.config.views_csv),
+            ("armset", self.config.armset_csv),
+        ):
+            if not path:
+                continue
+            csv_path = Path(path) if Path(path).is_absolute() else self.base_dir / path
+            if not csv_path.exists():
+                if not self.quiet:
+                    print(f"Warning: {name} CSV not found at {csv_path}")
+                continue
+            streams.append(_CsvStream(name, csv_path))
+        return streams
+
+    def _prepare_chunk(self, name: str, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Typed and filtered chunk, so filtered-out rows are never kept."""
+
+        chunk = self._parse_dates(self._convert_numeric_columns(chunk, name))
+        part = PerformanceData()
+        setattr(part, name, chunk)
+        return getattr(self._apply_filters(part), name)
+
+    def _track(self, name: str, chunk: pd.DataFrame):
+        """Merge a chunk into the top consumer summaries its columns allow."""
+
+        if name == "armset":
+            chunk = chunk.rename(columns={"app_id": "application"})
+        for entity_type, id_col, name_col, app_col in TRACKED[name]:
+            columns = {id_col, name_col, app_col, "execution_time"} - {None}
+            if not columns <= set(chunk.columns):
+                continue
+            if entity_type not in self.heavy_hitters:
+                self.heavy_hitters[entity_type] = HeavyHitters(
+                    entity_type, id_col, name_col, app_col, capacity=self.config.heavy_hitters_capacity
+                )
+            self.heavy_hitters[entity_type].update(chunk)
+
+    def _frames(self, chunks: Dict[str, List[pd.DataFrame]]) -> PerformanceData:
+        data = PerformanceData()
+        for name, parts in chunks.items():
+            if parts:
+                setattr(data, name, pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0])
+        return data
+
+    def _update(self, streams: List[_CsvStream], started: float):
+        progress = self.progress
+        progress.bytes_read = sum(stream.position for stream in streams)
+        progress.elapsed_seconds = time.monotonic() - started
+        progress.fraction = progress.bytes_read / progress.total_bytes if progress.total_bytes else 1.0
+        progress.rows_per_second = progress.rows / progress.elapsed_seconds if progress.elapsed_seconds else 0.0
+        if 0 < progress.fraction < 1:
+            progress.eta_seconds = progress.elapsed_seconds * (1 - progress.fraction) / progress.fraction
+        else:
+            progress.eta_seconds = None
+
+    def _snapshot(self, chunks: Dict[str, List[pd.DataFrame]]) -> Optional[ReliabilityScore]:
+        """Score the rows read so far and publish the result."""
+
+        data = encode_ids(self._frames(chunks))
+        if not data.has_executions and not data.has_views:
+            return None
+
+        score = ReliabilityScorer(self.config).score(data)
+        self.progress.snapshots += 1
+        self.history.append(score.total_score)
+
+        progress = self.progress
+        if not self.quiet:
+            eta = format_duration(progress.eta_seconds) if progress.eta_seconds is not None else "–"
+            print(
+                f"   ⏳ {progress.rows:,} rows ({progress.fraction:.0%}) · "
+                f"{progress.rows_per_second:,.0f} rows/s · ETA {eta} · "
+                f"score {score.total_score} ({score.grade})"
+            )
+
+        if self.publish:
+            output_dir = self.base_dir / self.config.output_directory
+            output_dir.mkdir(parents=True, exist_ok=True)
+            payload = serialization.score_to_dict(score)
+            payload["progress"] = asdict(progress)
+            payload["top_consumers"] = [
+                asdict(hitter)
+                for tracker in self.heavy_hitters.values()
+                for hitter in tracker.top(self.config.max_findings_per_category)
+            ]
+            with atomic_open(output_dir / PROGRESS_FILE, "wb") as f:
+                f.write(serialization.encode(payload, indent=True))
+
+        return score
+
+    def _stable(self, score: Optional[ReliabilityScore]) -> bool:
+        delta = self.config.progress_stop_delta
+        if score is None or delta is None or len(self.history) < STABLE_SNAPSHOTS:
+            return False
+        recent = self.history[-STABLE_SNAPSHOTS:]
+        return max(recent) - min(recent) <= delta
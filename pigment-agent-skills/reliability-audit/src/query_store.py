@@ -0,0 +1,152 @@
+"""
+Embedded analytical store for ad-hoc SQL over the performance data.
+
+``PerformanceData`` is written to a local SQLite database with one table
+per frame (``executions``, ``views``, ``armset``), indexed on application,
+metric/block and day. The database persists between runs and is rebuilt
+only when the source files or data filters change, so repeated queries
+skip CSV parsing entirely. Queries run on a read-only connection.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .config import Config
+from .data_loader import PerformanceData
+
+
+# Indexed columns per table: application, metric/block and day
+INDEXES = {
+    "executions": ["application", "metric_id", "day", ("application", "day")],
+    "views": ["app_id", "blockId", "day", ("app_id", "day")],
+    "armset": ["app_id", "blockId", "day", ("app_id", "day")],
+}
+
+# Rows per INSERT batch while loading
+CHUNK_ROWS = 100_000
+
+
+def source_key(config: Config, base_dir: Path) -> str:
+    """Digest of the source files and filters the store was built from."""
+
+    sources = []
+    for path in (config.executions_csv, config.views_csv, config.armset_csv):
+        if not path:
+            continue
+        csv_path = Path(path) if Path(path).is_absolute() else base_dir / path
+        stat = csv_path.stat() if csv_path.exists() else None
+        sources.append([str(csv_path), stat.st_size if stat else None, stat.st_mtime_ns if stat else None])
+
+    payload = json.dumps({
+        "sources": sources,
+        "filters": [
+            config.filter_applications, config.filter_date_from, config.filter_date_to,
+            config.exclude_applications, config.exclude_metrics,
+        ],
+    }, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class QueryStore:
+    """SQLite copy of the performance frames for ad-hoc queries."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+
+    def meta(self) -> dict:
+        return dict(self.conn.execute("SELECT key, value FROM store_meta"))
+
+    def is_current(self, key: str) -> bool:
+        return self.meta().get("source_key") == key
+
+    def load(self, data: PerformanceData, key: str) -> Dict[str, int]:
+        """Replace the stored tables with ``data`` and return row counts."""
+
+        # Forget the old source first, so an interrupted load is rebuilt
+        with self.conn:
+            self.conn.execute("DELETE FROM store_meta WHERE key = 'source_key'")
+
+        self.conn.execute("PRAGMA synchronous=OFF")
+        counts = {}
+
+        for name in INDEXES:
+            self.conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+
+        for name, df in data.frames().items():
+            df = _storable(df)
+            df.to_sql(name, self.conn, index=False, chunksize=CHUNK_ROWS)
+            counts[name] = len(df)
+
+            # Indexes are built once after the bulk insert, which is far
+            # cheaper than maintaining them row by row
+            for columns in INDEXES[name]:
+                columns = (columns,) if isinstance(columns, str) else columns
+                if not set(columns) <= set(df.columns):
+                    continue
+                index = f"{name}_by_{'_'.join(columns)}"
+                quoted = ", ".join(f'"{col}"' for col in columns)
+                self.conn.execute(f'CREATE INDEX "{index}" ON "{name}" ({quoted})')
+
+        self.conn.execute("ANALYZE")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                [
+                    ("source_key", key),
+                    ("loaded_at", datetime.now(timezone.utc).isoformat()),
+                    ("row_counts", json.dumps(counts)),
+                ],
+            )
+        self.conn.execute("PRAGMA synchronous=FULL")
+
+        return counts
+
+    def tables(self) -> Dict[str, List[str]]:
+        """Column names of each stored table."""
+
+        names = [
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?, ?) ORDER BY name",
+                tuple(INDEXES),
+            )
+        ]
+        return {
+            name: [row[1] for row in self.conn.execute(f'PRAGMA table_info("{name}")')]
+            for name in names
+        }
+
+    def query(self, sql: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """Run ``sql`` on a read-only connection and return the result."""
+
+        conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            return pd.read_sql_query(sql, conn, params=params)
+        finally:
+            conn.close()
+
+    def close(self):
+        self.conn.close()
+
+
+def _storable(df: pd.DataFrame) -> pd.DataFrame:
+    """Frame with dates as ISO text, so SQL comparisons and GROUP BY day work."""
+
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        fmt = "%Y-%m-%d" if col == "day" else "%Y-%m-%dT%H:%M:%S.%f"
+        df[col] = df[col].dt.strftime(fmt)
+    return df
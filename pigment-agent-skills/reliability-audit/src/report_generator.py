@@ -1,16 +1,29 @@
 """
 Report generator for reliability audit results.
 
-Generates CSV and HTML reports.
+Generates CSV and HTML reports, a versioned JSON result document, and
+Parquet / Arrow IPC tables.
 """
 
 import csv
+import json
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
+from . import serialization
+from .atomic import atomic_open
 from .config import Config
+from .data_loader import PerformanceData
+from .exporters import AggregateExporter, score_tables, write_columnar
+from .html_templates import PAGE_TEMPLATE, TABLE_SCRIPT
 from .scoring import ReliabilityScore
+from .analyzers.formula_analyzer import MIN_SHARED_BLOCKS
+from .analyzers.performance_analyzer import SEVERITY_ORDER
+
+
+# Columnar output formats and their file extensions
+COLUMNAR_FORMATS = {"parquet": "parquet", "arrow": "arrow"}
 
 
 class ReportGenerator:
@@ -20,13 +33,22 @@ class ReportGenerator:
         self.config = config
         self.base_dir = Path(__file__).parent.parent
 
-    def generate(self, score: ReliabilityScore) -> List[str]:
-        """Generate reports in configured formats."""
+    def generate(
+        self,
+        score: ReliabilityScore,
+        data: Optional[PerformanceData] = None,
+        timestamp: Optional[str] = None,
+    ) -> List[str]:
+        """Generate reports in configured formats.
+
+        When ``data`` is given and full exports are enabled, complete
+        per-entity aggregate tables are written alongside the reports.
+        """
 
         output_dir = self.base_dir / self.config.output_directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         generated_files = []
 
         for fmt in self.config.output_formats:
@@ -34,8 +56,18 @@ class ReportGenerator:
                 files = self._generate_csv(score, output_dir, timestamp)
                 generated_files.extend(files)
             elif fmt == "html":
-                file = self._generate_html(score, output_dir, timestamp)
+                file = self._generate_html(score, output_dir, timestamp, data)
                 generated_files.append(file)
+            elif fmt == "json":
+                file = self._generate_json(score, output_dir, timestamp)
+                generated_files.append(file)
+            elif fmt in COLUMNAR_FORMATS:
+                files = self._generate_columnar(score, output_dir, timestamp, fmt)
+                generated_files.extend(files)
+
+        if data is not None and self.config.export_full_tables:
+            exporter = AggregateExporter(self.config)
+            generated_files.extend(exporter.export(data, output_dir, timestamp))
 
         return generated_files
 
@@ -46,7 +78,7 @@ class ReportGenerator:
 
         # Summary CSV
         summary_file = output_dir / f"audit_summary_{timestamp}.csv"
-        with open(summary_file, "w", newline="") as f:
+        with atomic_open(summary_file, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(["Metric", "Value"])
             writer.writerow(["Timestamp", score.timestamp])
@@ -67,12 +99,12 @@ class ReportGenerator:
             # Metric performance findings CSV
             if score.performance_result and score.performance_result.metric_findings:
                 perf_file = output_dir / f"metric_performance_findings_{timestamp}.csv"
-                with open(perf_file, "w", newline="") as f:
+                with atomic_open(perf_file, "w", newline="") as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         "Metric ID", "Metric Name", "Application",
                         "Severity", "Avg Execution Time (ms)", "Max Execution Time (ms)",
-                        "Execution Count", "Avg Computed Rows", "Dimensions"
+                        "Execution Count", "Total Execution Time (ms)", "Avg Computed Rows", "Dimensions"
                     ])
                     for finding in score.performance_result.metric_findings:
                         writer.writerow([
@@ -83,6 +115,7 @@ class ReportGenerator:
                             finding.avg_execution_time,
                             finding.max_execution_time,
                             finding.execution_count,
+                            finding.total_execution_time,
                             finding.avg_computed_rows or "",
                             finding.dimensions or "",
                         ])
@@ -91,12 +124,12 @@ class ReportGenerator:
             # View performance findings CSV
             if score.performance_result and score.performance_result.view_findings:
                 view_file = output_dir / f"view_performance_findings_{timestamp}.csv"
-                with open(view_file, "w", newline="") as f:
+                with atomic_open(view_file, "w", newline="") as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         "View ID", "View Name", "Application",
                         "Severity", "Avg Execution Time (ms)", "Max Execution Time (ms)",
-                        "Execution Count", "Avg Computed Rows"
+                        "Execution Count", "Total Execution Time (ms)", "Avg Computed Rows"
                     ])
                     for finding in score.performance_result.view_findings:
                         writer.writerow([
@@ -107,6 +140,7 @@ class ReportGenerator:
                             finding.avg_execution_time,
                             finding.max_execution_time,
                             finding.execution_count,
+                            finding.total_execution_time,
                             finding.avg_computed_rows or "",
                         ])
                 files.append(str(view_file))
@@ -114,12 +148,13 @@ class ReportGenerator:
             # Scoping findings CSV
             if score.scoping_result and score.scoping_result.findings:
                 scoping_file = output_dir / f"scoping_findings_{timestamp}.csv"
-                with open(scoping_file, "w", newline="") as f:
+                with atomic_open(scoping_file, "w", newline="") as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         "Metric ID", "Metric Name", "Application", "Scoped Level",
                         "Avg Execution Time (ms)", "Total Execution Time (ms)",
-                        "Execution Count", "Potential Savings %"
+                        "Execution Count", "Potential Savings %",
+                        "Potential Savings (ms)", "Savings Basis"
                     ])
                     for finding in score.scoping_result.findings:
                         writer.writerow([
@@ -131,13 +166,15 @@ class ReportGenerator:
                             finding.total_execution_time,
                             finding.execution_count,
                             finding.potential_savings_pct,
+                            finding.potential_savings_ms,
+                            finding.savings_basis,
                         ])
                 files.append(str(scoping_file))
 
             # Complexity findings CSV
             if score.complexity_result and score.complexity_result.findings:
                 complexity_file = output_dir / f"complexity_findings_{timestamp}.csv"
-                with open(complexity_file, "w", newline="") as f:
+                with atomic_open(complexity_file, "w", newline="") as f:
                     writer = csv.writer(f)
                     writer.writerow([
                         "Metric ID", "Metric Name", "Application", "Dimensions",
@@ -155,10 +192,300 @@ class ReportGenerator:
                         ])
                 files.append(str(complexity_file))
 
+            # Anomaly findings CSV
+            if score.anomaly_result and score.anomaly_result.findings:
+                anomaly_file = output_dir / f"anomaly_findings_{timestamp}.csv"
+                with atomic_open(anomaly_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Metric ID", "Metric Name", "Application", "Day", "Severity",
+                        "Daily Execution Time (ms)", "Baseline Execution Time (ms)",
+                        "Robust Z-Score", "Execution Count"
+                    ])
+                    for finding in score.anomaly_result.findings:
+                        writer.writerow([
+                            finding.metric_id,
+                            finding.metric_name,
+                            finding.application,
+                            finding.day,
+                            finding.severity,
+                            finding.daily_execution_time,
+                            finding.baseline_execution_time,
+                            finding.robust_zscore,
+                            finding.execution_count,
+                        ])
+                files.append(str(anomaly_file))
+
+            # Change impact findings CSV
+            if score.change_impact_result and score.change_impact_result.findings:
+                change_file = output_dir / f"change_impact_findings_{timestamp}.csv"
+                with atomic_open(change_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Change ID", "Source", "Application", "Block Name", "Changed At",
+                        "Spike At", "Lag (min)", "Signal", "Spike Value (ms)",
+                        "Baseline Value (ms)", "Robust Z-Score", "Severity", "Culprit Score"
+                    ])
+                    for finding in score.change_impact_result.findings:
+                        writer.writerow([
+                            finding.change_id,
+                            finding.source,
+                            finding.application,
+                            finding.block_name or "",
+                            finding.changed_at,
+                            finding.spike_at,
+                            finding.lag_minutes,
+                            finding.spike_signal,
+                            finding.spike_value,
+                            finding.baseline_value,
+                            finding.spike_zscore,
+                            finding.severity,
+                            finding.culprit_score,
+                        ])
+                files.append(str(change_file))
+
+            # Dependency graph CSVs
+            dependencies = score.dependency_result
+            if dependencies and dependencies.root_findings:
+                roots_file = output_dir / f"dependency_roots_{timestamp}.csv"
+                with atomic_open(roots_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Block ID", "Block Name", "Application", "Own Time (ms)",
+                        "Downstream Time (ms)", "Direct Dependents"
+                    ])
+                    for root in dependencies.root_findings:
+                        writer.writerow([
+                            root.block_id,
+                            root.block_name,
+                            root.application,
+                            root.own_execution_time,
+                            root.downstream_execution_time,
+                            root.direct_dependents,
+                        ])
+                files.append(str(roots_file))
+
+            if dependencies and dependencies.critical_paths:
+                paths_file = output_dir / f"critical_paths_{timestamp}.csv"
+                with atomic_open(paths_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Block ID", "Block Name", "Application", "Length",
+                        "Path Time (ms)", "Path"
+                    ])
+                    for path in dependencies.critical_paths:
+                        writer.writerow([
+                            path.block_id,
+                            path.block_name,
+                            path.application,
+                            path.length,
+                            path.path_execution_time,
+                            path.path,
+                        ])
+                files.append(str(paths_file))
+
+            # Formula hotspots CSV
+            if score.formula_result and score.formula_result.findings:
+                formula_file = output_dir / f"formula_hotspots_{timestamp}.csv"
+                with atomic_open(formula_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Formula", "Applications", "Blocks", "Executions", "Total Time (ms)",
+                        "Avg Time (ms)", "P95 Time (ms)", "Rows per ms", "Shared", "Severity"
+                    ])
+                    for hotspot in score.formula_result.findings:
+                        writer.writerow([
+                            hotspot.formula,
+                            hotspot.applications,
+                            hotspot.blocks,
+                            hotspot.execution_count,
+                            hotspot.total_execution_time,
+                            hotspot.avg_execution_time,
+                            hotspot.p95_execution_time,
+                            hotspot.rows_per_ms if hotspot.rows_per_ms is not None else "",
+                            hotspot.shared,
+                            hotspot.severity,
+                        ])
+                files.append(str(formula_file))
+
+            # Worker scaling CSVs
+            scaling = score.worker_scaling_result
+            if scaling and scaling.curve:
+                curve_file = output_dir / f"worker_scaling_{timestamp}.csv"
+                with atomic_open(curve_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Job Type", "Workers", "Executions", "Median Rows per ms",
+                        "Speedup", "Parallel Efficiency"
+                    ])
+                    for point in scaling.curve:
+                        writer.writerow([
+                            point.job_type,
+                            point.workers,
+                            point.executions,
+                            point.median_rows_per_ms,
+                            point.speedup,
+                            point.parallel_efficiency,
+                        ])
+                files.append(str(curve_file))
+
+            if scaling and scaling.findings:
+                sizing_file = output_dir / f"worker_sizing_{timestamp}.csv"
+                with atomic_open(sizing_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Execution ID", "Block Name", "Application", "Job Type", "Issue", "Workers",
+                        "Recommended Workers", "Computed Rows", "Execution Time (ms)",
+                        "Rows per Worker", "Impact (ms)"
+                    ])
+                    for finding in scaling.findings:
+                        writer.writerow([
+                            finding.execution_id or "",
+                            finding.block_name,
+                            finding.application,
+                            finding.job_type,
+                            finding.issue,
+                            finding.workers,
+                            finding.recommended_workers,
+                            finding.computed_rows,
+                            finding.execution_time,
+                            finding.rows_per_worker,
+                            finding.impact_ms,
+                        ])
+                files.append(str(sizing_file))
+
+            # Write path CSVs
+            writes = score.write_path_result
+            if writes and writes.block_findings:
+                write_file = output_dir / f"write_path_findings_{timestamp}.csv"
+                with atomic_open(write_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Block ID", "Block Name", "Application", "Executions", "Computed Rows",
+                        "Written Rows", "Write Amplification", "Upserted Rows", "Deleted Rows",
+                        "Churn Ratio", "No-op Executions", "No-op Time (ms)", "Total Time (ms)"
+                    ])
+                    for finding in writes.block_findings:
+                        writer.writerow([
+                            finding.block_id,
+                            finding.block_name,
+                            finding.application,
+                            finding.execution_count,
+                            finding.computed_rows,
+                            finding.written_rows,
+                            finding.write_amplification if finding.write_amplification is not None else "",
+                            finding.upserted_rows,
+                            finding.deleted_rows,
+                            finding.churn_ratio if finding.churn_ratio is not None else "",
+                            finding.noop_executions,
+                            finding.noop_execution_time,
+                            finding.total_execution_time,
+                        ])
+                files.append(str(write_file))
+
+            if writes and writes.change_findings:
+                churn_file = output_dir / f"change_churn_{timestamp}.csv"
+                with atomic_open(churn_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Change ID", "Application", "Blocks", "Executions", "Upserted Rows",
+                        "Deleted Rows", "Churn Ratio", "No-op Executions", "No-op Time (ms)", "Total Time (ms)"
+                    ])
+                    for finding in writes.change_findings:
+                        writer.writerow([
+                            finding.change_id,
+                            finding.application,
+                            finding.blocks,
+                            finding.execution_count,
+                            finding.upserted_rows,
+                            finding.deleted_rows,
+                            finding.churn_ratio if finding.churn_ratio is not None else "",
+                            finding.noop_executions,
+                            finding.noop_execution_time,
+                            finding.total_execution_time,
+                        ])
+                files.append(str(churn_file))
+
+            # Sample estimates CSV
+            if score.sample_estimate and score.sample_estimate.estimates:
+                estimate_file = output_dir / f"sample_estimates_{timestamp}.csv"
+                with atomic_open(estimate_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["Statistic", "Estimate", "CI Low", "CI High"])
+                    for estimate in score.sample_estimate.estimates:
+                        writer.writerow([
+                            estimate.statistic,
+                            estimate.estimate,
+                            estimate.ci_low,
+                            estimate.ci_high,
+                        ])
+                files.append(str(estimate_file))
+
+            # Per-application leaderboard CSV
+            if score.application_scores:
+                apps_file = output_dir / f"application_scores_{timestamp}.csv"
+                with atomic_open(apps_file, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        "Rank", "Application", "Total Score", "Grade",
+                        "Performance", "Optimization", "Complexity", "Views"
+                    ])
+                    for app in score.application_scores:
+                        writer.writerow([
+                            app.rank,
+                            app.application,
+                            app.total_score,
+                            app.grade,
+                            app.performance_score,
+                            app.optimization_score,
+                            app.complexity_score,
+                            app.views_score,
+                        ])
+                files.append(str(apps_file))
+
         return files
 
-    def _generate_html(self, score: ReliabilityScore, output_dir: Path, timestamp: str) -> str:
-        """Generate HTML report."""
+    def _generate_json(self, score: ReliabilityScore, output_dir: Path, timestamp: str) -> str:
+        """Generate the versioned JSON result document."""
+
+        json_file = output_dir / f"audit_result_{timestamp}.json"
+        with atomic_open(json_file, "wb") as f:
+            serialization.dump(score, f, indent=True)
+
+        return str(json_file)
+
+    def _generate_columnar(
+        self, score: ReliabilityScore, output_dir: Path, timestamp: str, fmt: str
+    ) -> List[str]:
+        """Generate typed columnar tables (Parquet or Arrow IPC)."""
+
+        files = []
+        extension = COLUMNAR_FORMATS[fmt]
+
+        for name, table in score_tables(score).items():
+            if name != "audit_summary" and not self.config.include_details:
+                continue
+            if name != "audit_summary" and len(table) == 0:
+                continue
+
+            path = output_dir / f"{name}_{timestamp}.{extension}"
+            write_columnar(table, path, fmt)
+            files.append(str(path))
+
+        return files
+
+    def _generate_html(
+        self,
+        score: ReliabilityScore,
+        output_dir: Path,
+        timestamp: str,
+        data: Optional[PerformanceData] = None,
+    ) -> str:
+        """Generate HTML report.
+
+        When ``data`` is given, the metric and view tables list every flagged
+        entity from the uncapped aggregates, not only the reported findings.
+        """
 
         html_file = output_dir / f"audit_report_{timestamp}.html"
 
@@ -172,192 +499,72 @@ class ReportGenerator:
         }
         grade_color = grade_colors.get(score.grade, "#6b7280")
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Pigment Reliability Audit Report</title>
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #1f2937;
-            background: #f9fafb;
-            padding: 2rem;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        h1 {{ color: #111827; margin-bottom: 0.5rem; }}
-        h2 {{ color: #374151; margin: 2rem 0 1rem; border-bottom: 2px solid #e5e7eb; padding-bottom: 0.5rem; }}
-        h3 {{ color: #4b5563; margin: 1.5rem 0 0.75rem; }}
-        .timestamp {{ color: #6b7280; font-size: 0.875rem; margin-bottom: 2rem; }}
-
-        .score-card {{
-            background: white;
-            border-radius: 1rem;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-bottom: 2rem;
-        }}
-        .score-header {{
-            display: flex;
-            align-items: center;
-            gap: 2rem;
-            margin-bottom: 1.5rem;
-        }}
-        .grade {{
-            width: 100px;
-            height: 100px;
-            border-radius: 50%;
-            background: {grade_color};
-            color: white;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 3rem;
-            font-weight: bold;
-        }}
-        .total-score {{
-            font-size: 2rem;
-            font-weight: bold;
-        }}
-        .total-score span {{ font-size: 1rem; color: #6b7280; }}
-
-        .score-breakdown {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-        }}
-        .score-item {{
-            background: #f3f4f6;
-            padding: 1rem;
-            border-radius: 0.5rem;
-        }}
-        .score-item-label {{ font-size: 0.875rem; color: #6b7280; }}
-        .score-item-value {{ font-size: 1.5rem; font-weight: bold; }}
-        .score-bar {{
-            height: 8px;
-            background: #e5e7eb;
-            border-radius: 4px;
-            margin-top: 0.5rem;
-            overflow: hidden;
-        }}
-        .score-bar-fill {{
-            height: 100%;
-            border-radius: 4px;
-            transition: width 0.3s;
-        }}
-
-        .recommendations {{
-            background: white;
-            border-radius: 1rem;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-bottom: 2rem;
-        }}
-        .recommendation {{
-            padding: 0.75rem 1rem;
-            margin: 0.5rem 0;
-            background: #fef3c7;
-            border-left: 4px solid #f59e0b;
-            border-radius: 0 0.5rem 0.5rem 0;
-        }}
-        .recommendation.critical {{
-            background: #fee2e2;
-            border-left-color: #ef4444;
-        }}
-
-        .findings {{
-            background: white;
-            border-radius: 1rem;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-bottom: 2rem;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 0.875rem;
-        }}
-        th, td {{
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid #e5e7eb;
-        }}
-        th {{ background: #f9fafb; font-weight: 600; }}
-        tr:hover {{ background: #f9fafb; }}
-
-        .severity {{
-            padding: 0.25rem 0.5rem;
-            border-radius: 0.25rem;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-        .severity.critical {{ background: #fee2e2; color: #dc2626; }}
-        .severity.warning {{ background: #fef3c7; color: #d97706; }}
-        .severity.watch {{ background: #dbeafe; color: #2563eb; }}
-
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 1rem;
-            margin: 1rem 0;
-        }}
-        .stat {{
-            background: #f3f4f6;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            text-align: center;
-        }}
-        .stat-value {{ font-size: 1.5rem; font-weight: bold; color: #111827; }}
-        .stat-label {{ font-size: 0.75rem; color: #6b7280; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🔍 Pigment Reliability Audit Report</h1>
-        <p class="timestamp">Generated: {score.timestamp}</p>
-
-        <div class="score-card">
-            <div class="score-header">
-                <div class="grade">{score.grade}</div>
-                <div>
-                    <div class="total-score">{score.total_score} <span>/ 100</span></div>
-                    <div style="color: #6b7280">Overall Reliability Score</div>
-                </div>
-            </div>
-
-            <div class="score-breakdown">
-                {self._render_score_item("Performance", score.performance_score, self.config.scoring.performance_weight)}
-                {self._render_score_item("Optimization", score.optimization_score, self.config.scoring.optimization_weight)}
-                {self._render_score_item("Complexity", score.complexity_score, self.config.scoring.complexity_weight)}
-                {self._render_score_item("Views", score.views_score, self.config.scoring.views_weight)}
-            </div>
-        </div>
-
-        {self._render_data_summary(score)}
-
-        {self._render_recommendations(score)}
-
-        {self._render_metric_performance_findings(score)}
-
-        {self._render_view_performance_findings(score)}
-
-        {self._render_scoping_analysis(score)}
+        # Table rows are collected here by the section renderers and
+        # embedded once as JSON for client-side rendering
+        tables = {}
+
+        sections = [
+            self._render_data_summary(score),
+            self._render_sample_estimate(score, tables),
+            self._render_recommendations(score),
+            self._render_metric_performance_findings(score, tables, data),
+            self._render_view_performance_findings(score, tables, data),
+            self._render_scoping_analysis(score, tables),
+            self._render_write_path(score, tables),
+            self._render_complexity_findings(score, tables),
+            self._render_anomaly_findings(score, tables),
+            self._render_change_impact(score, tables),
+            self._render_dependencies(score, tables),
+            self._render_formula_hotspots(score, tables),
+            self._render_worker_scaling(score, tables),
+            self._render_workload_analysis(score, tables),
+            self._render_application_scores(score, tables),
+        ]
+
+        score_items = "".join([
+            self._render_score_item("Performance", score.performance_score, self.config.scoring.performance_weight),
+            self._render_score_item("Optimization", score.optimization_score, self.config.scoring.optimization_weight),
+            self._render_score_item("Complexity", score.complexity_score, self.config.scoring.complexity_weight),
+            self._render_score_item("Views", score.views_score, self.config.scoring.views_weight),
+        ])
+
+        # JSON.parse rejects NaN, so missing values are sent as null; "</"
+        # must not appear inside a <script> element
+        table_data = json.dumps(
+            serialization.plain(tables), separators=(",", ":"), allow_nan=False, default=str
+        ).replace("</", "<\\/")
+
+        html = PAGE_TEMPLATE.substitute(
+            grade_color=grade_color,
+            timestamp=score.timestamp,
+            grade=score.grade,
+            total_score=score.total_score,
+            score_items=score_items,
+            sections="\n".join(section for section in sections if section),
+            table_data=table_data,
+            table_script=TABLE_SCRIPT,
+        )
+
+        with atomic_open(html_file, "w") as f:
+            f.write(html)
 
-        {self._render_complexity_findings(score)}
+        return str(html_file)
 
-        {self._render_workload_analysis(score)}
-    </div>
-</body>
-</html>"""
+    def _data_table(self, tables: dict, table_id: str, columns: list, rows: list) -> str:
+        """Register a client-rendered table and return its placeholder.
 
-        with open(html_file, "w") as f:
-            f.write(html)
+        ``columns`` holds ``(label, type)`` pairs, or ``(label, type, badge)``
+        where ``badge`` is the index of the row value used as severity class.
+        """
 
-        return str(html_file)
+        tables[table_id] = {
+            "columns": [
+                {"label": c[0], "type": c[1], **({"badge": c[2]} if len(c) > 2 else {})}
+                for c in columns
+            ],
+            "rows": rows,
+        }
+        return f'<div class="data-table" data-table="{table_id}"></div>'
 
     def _render_score_item(self, label: str, value: float, max_val: int) -> str:
         pct = (value / max_val) * 100
@@ -411,7 +618,23 @@ class ReportGenerator:
             {items}
         </div>"""
 
-    def _render_metric_performance_findings(self, score: ReliabilityScore) -> str:
+    def _flagged_rows(self, stats, columns: list) -> list:
+        """Rows of every flagged entity in ``stats``, by severity, then slowest first."""
+
+        flagged = stats[stats["severity"] != ""]
+        flagged = flagged.assign(
+            severity_rank=flagged["severity"].map(SEVERITY_ORDER),
+            sort_time=flagged["avg_execution_time_ms"].round(2),
+        ).sort_values(["severity_rank", "sort_time"], ascending=[True, False], kind="stable")
+
+        timings = ["avg_execution_time_ms", "max_execution_time_ms", "total_execution_time_ms"]
+        flagged[timings] = flagged[timings].round(2)
+        flagged["avg_computed_rows"] = flagged["avg_computed_rows"].round()
+        return flagged[columns].astype(object).to_numpy().tolist()
+
+    def _render_metric_performance_findings(
+        self, score: ReliabilityScore, tables: dict, data: Optional[PerformanceData] = None
+    ) -> str:
         if not self.config.include_details:
             return ""
 
@@ -420,18 +643,22 @@ class ReportGenerator:
 
         perf = score.performance_result
 
-        rows = ""
-        for f in perf.metric_findings[:20]:
-            rows += f"""
-            <tr>
-                <td>{f.entity_name}</td>
-                <td>{f.application}</td>
-                <td><span class="severity {f.severity}">{f.severity}</span></td>
-                <td>{f.avg_execution_time:,.0f} ms</td>
-                <td>{f.max_execution_time:,.0f} ms</td>
-                <td>{f.execution_count}</td>
-                <td>{f.dimensions or '-'}</td>
-            </tr>"""
+        if data is not None and data.has_executions:
+            rows = self._flagged_rows(AggregateExporter(self.config).metric_aggregates(data.executions), [
+                "metric_name", "application", "severity", "avg_execution_time_ms", "max_execution_time_ms",
+                "execution_count", "total_execution_time_ms", "dimensions",
+            ])
+        else:
+            rows = [
+                [f.entity_name, f.application, f.severity, f.avg_execution_time,
+                 f.max_execution_time, f.execution_count, f.total_execution_time, f.dimensions]
+                for f in perf.metric_findings
+            ]
+
+        table = self._data_table(tables, "metric_findings", [
+            ("Name", "text"), ("Application", "text"), ("Severity", "text", 2),
+            ("Avg Time", "ms"), ("Max Time", "ms"), ("Count", "int"), ("Total Time", "s"), ("Dims", "int"),
+        ], rows)
 
         return f"""
         <div class="findings">
@@ -454,24 +681,13 @@ class ReportGenerator:
                     <div class="stat-label">Warnings</div>
                 </div>
             </div>
-            <h3>Top Issues</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        <th>Application</th>
-                        <th>Severity</th>
-                        <th>Avg Time</th>
-                        <th>Max Time</th>
-                        <th>Count</th>
-                        <th>Dims</th>
-                    </tr>
-                </thead>
-                <tbody>{rows}</tbody>
-            </table>
+            <h3>Flagged Metrics</h3>
+            {table}
         </div>"""
 
-    def _render_view_performance_findings(self, score: ReliabilityScore) -> str:
+    def _render_view_performance_findings(
+        self, score: ReliabilityScore, tables: dict, data: Optional[PerformanceData] = None
+    ) -> str:
         if not self.config.include_details:
             return ""
 
@@ -480,18 +696,22 @@ class ReportGenerator:
 
         perf = score.performance_result
 
-        rows = ""
-        for f in perf.view_findings[:20]:
-            rows += f"""
-            <tr>
-                <td>{f.entity_name}</td>
-                <td>{f.application}</td>
-                <td><span class="severity {f.severity}">{f.severity}</span></td>
-                <td>{f.avg_execution_time:,.0f} ms</td>
-                <td>{f.max_execution_time:,.0f} ms</td>
-                <td>{f.execution_count}</td>
-                <td>{f.avg_computed_rows or '-'}</td>
-            </tr>"""
+        if data is not None and data.has_views:
+            rows = self._flagged_rows(AggregateExporter(self.config).view_aggregates(data.views), [
+                "blockName", "app_id", "severity", "avg_execution_time_ms", "max_execution_time_ms",
+                "execution_count", "total_execution_time_ms", "avg_computed_rows",
+            ])
+        else:
+            rows = [
+                [f.entity_name, f.application, f.severity, f.avg_execution_time,
+                 f.max_execution_time, f.execution_count, f.total_execution_time, f.avg_computed_rows]
+                for f in perf.view_findings
+            ]
+
+        table = self._data_table(tables, "view_findings", [
+            ("Name", "text"), ("Application", "text"), ("Severity", "text", 2),
+            ("Avg Time", "ms"), ("Max Time", "ms"), ("Count", "int"), ("Total Time", "s"), ("Avg Rows", "int"),
+        ], rows)
 
         return f"""
         <div class="findings">
@@ -514,24 +734,11 @@ class ReportGenerator:
                     <div class="stat-label">Warnings</div>
                 </div>
             </div>
-            <h3>Top Issues</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        <th>Application</th>
-                        <th>Severity</th>
-                        <th>Avg Time</th>
-                        <th>Max Time</th>
-                        <th>Count</th>
-                        <th>Avg Rows</th>
-                    </tr>
-                </thead>
-                <tbody>{rows}</tbody>
-            </table>
+            <h3>Flagged Views</h3>
+            {table}
         </div>"""
 
-    def _render_scoping_analysis(self, score: ReliabilityScore) -> str:
+    def _render_scoping_analysis(self, score: ReliabilityScore, tables: dict) -> str:
         if not self.config.include_details:
             return ""
 
@@ -540,35 +747,21 @@ class ReportGenerator:
 
         scoping = score.scoping_result
 
-        rows = ""
-        for f in scoping.findings[:15]:
-            rows += f"""
-            <tr>
-                <td>{f.metric_name}</td>
-                <td>{f.application}</td>
-                <td>{f.avg_execution_time:,.0f} ms</td>
-                <td>{f.total_execution_time:,.0f} ms</td>
-                <td>{f.execution_count}</td>
-                <td>{f.potential_savings_pct}%</td>
-            </tr>"""
-
         findings_table = ""
-        if rows:
+        if scoping.findings:
+            table = self._data_table(tables, "scoping_findings", [
+                ("Metric Name", "text"), ("Application", "text"), ("Avg Time", "ms"),
+                ("Total Time", "ms"), ("Count", "int"), ("Potential Savings", "pct"),
+                ("Savings Basis", "text"),
+            ], [
+                [f.metric_name, f.application, f.avg_execution_time, f.total_execution_time,
+                 f.execution_count, f.potential_savings_pct, f.savings_basis]
+                for f in scoping.findings
+            ])
             findings_table = f"""
             <h3>Optimization Candidates (NoChange metrics with high execution time)</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Metric Name</th>
-                        <th>Application</th>
-                        <th>Avg Time</th>
-                        <th>Total Time</th>
-                        <th>Count</th>
-                        <th>Potential Savings</th>
-                    </tr>
-                </thead>
-                <tbody>{rows}</tbody>
-            </table>"""
+            <p style="color: #6b7280;">Savings are learned from each metric's FullyScoped vs NoChange history, falling back to application and dimension-bucket medians.</p>
+            {table}"""
 
         return f"""
         <div class="findings">
@@ -594,7 +787,7 @@ class ReportGenerator:
             {findings_table}
         </div>"""
 
-    def _render_complexity_findings(self, score: ReliabilityScore) -> str:
+    def _render_complexity_findings(self, score: ReliabilityScore, tables: dict) -> str:
         if not self.config.include_details:
             return ""
 
@@ -603,34 +796,20 @@ class ReportGenerator:
 
         complexity = score.complexity_result
 
-        rows = ""
-        for f in complexity.findings[:15]:
-            avg_rows_str = f"{f.avg_computed_rows:,.0f}" if f.avg_computed_rows else "-"
-            rows += f"""
-            <tr>
-                <td>{f.metric_name}</td>
-                <td>{f.application}</td>
-                <td><span class="severity {f.severity}">{f.dimensions}</span></td>
-                <td>{f.avg_execution_time:,.0f} ms</td>
-                <td>{avg_rows_str}</td>
-            </tr>"""
-
         findings_table = ""
-        if rows:
+        if complexity.findings:
+            # Severity rides along after the displayed columns to color the badge
+            table = self._data_table(tables, "complexity_findings", [
+                ("Metric Name", "text"), ("Application", "text"), ("Dimensions", "int", 5),
+                ("Avg Time", "ms"), ("Avg Rows", "int"),
+            ], [
+                [f.metric_name, f.application, f.dimensions, f.avg_execution_time,
+                 f.avg_computed_rows, f.severity]
+                for f in complexity.findings
+            ])
             findings_table = f"""
             <h3>High-Dimension Metrics</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Metric Name</th>
-                        <th>Application</th>
-                        <th>Dimensions</th>
-                        <th>Avg Time</th>
-                        <th>Avg Rows</th>
-                    </tr>
-                </thead>
-                <tbody>{rows}</tbody>
-            </table>"""
+            {table}"""
 
         correlation_info = ""
         if complexity.dims_time_correlation is not None:
@@ -665,7 +844,347 @@ class ReportGenerator:
             {findings_table}
         </div>"""
 
-    def _render_workload_analysis(self, score: ReliabilityScore) -> str:
+    def _render_anomaly_findings(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        if not score.anomaly_result or not score.anomaly_result.findings:
+            return ""
+
+        anomalies = score.anomaly_result
+        baseline_label = "same weekday" if anomalies.seasonal_baseline else "metric median"
+
+        table = self._data_table(tables, "anomaly_findings", [
+            ("Metric Name", "text"), ("Application", "text"), ("Day", "text"),
+            ("Severity", "text", 3), ("Daily Time", "ms"), ("Baseline", "ms"), ("Z-Score", "num"),
+        ], [
+            [f.metric_name, f.application, f.day, f.severity, f.daily_execution_time,
+             f.baseline_execution_time, f.robust_zscore]
+            for f in anomalies.findings
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>📈 Execution-Time Anomalies</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{anomalies.metrics_scored:,}</div>
+                    <div class="stat-label">Metrics Scored</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{anomalies.anomalous_metrics:,}</div>
+                    <div class="stat-label">Anomalous Metrics</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #ef4444">{anomalies.critical_count}</div>
+                    <div class="stat-label">Critical Spikes</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #f59e0b">{anomalies.warning_count}</div>
+                    <div class="stat-label">Warnings</div>
+                </div>
+            </div>
+            <h3>Largest Spikes (baseline: {baseline_label})</h3>
+            {table}
+        </div>"""
+
+    def _render_change_impact(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        if not score.change_impact_result or not score.change_impact_result.findings:
+            return ""
+
+        changes = score.change_impact_result
+
+        table = self._data_table(tables, "change_impact_findings", [
+            ("Change ID", "text"), ("Block Name", "text"), ("Application", "text"),
+            ("Changed At", "text"), ("Lag (min)", "num"), ("Signal", "text"),
+            ("Severity", "text", 3), ("Z-Score", "num"), ("Culprit Score", "num"),
+        ], [
+            [f.change_id, f.block_name or "", f.application, f.changed_at, f.lag_minutes,
+             f.spike_signal, f.severity, f.spike_zscore, f.culprit_score]
+            for f in changes.findings
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>🧭 Change Impact</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{changes.changes_considered:,}</div>
+                    <div class="stat-label">Changes Considered</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{changes.spikes_detected:,}</div>
+                    <div class="stat-label">Spikes Detected</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{changes.attributed_changes:,}</div>
+                    <div class="stat-label">Changes Before a Spike</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #ef4444">{changes.critical_count}</div>
+                    <div class="stat-label">Critical</div>
+                </div>
+            </div>
+            <h3>Likely Culprits (spikes within {changes.window_hours:g}h of a change)</h3>
+            {table}
+        </div>"""
+
+    def _render_dependencies(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        dependencies = score.dependency_result
+        if not dependencies or not dependencies.root_findings:
+            return ""
+
+        roots = self._data_table(tables, "dependency_roots", [
+            ("Block", "text"), ("Application", "text"), ("Own Time (ms)", "num"),
+            ("Downstream Time (ms)", "num"), ("Direct Dependents", "num"),
+        ], [
+            [r.block_name, r.application, r.own_execution_time, r.downstream_execution_time, r.direct_dependents]
+            for r in dependencies.root_findings
+        ])
+        paths = self._data_table(tables, "critical_paths", [
+            ("Block", "text"), ("Application", "text"), ("Length", "num"),
+            ("Path Time (ms)", "num"), ("Path", "text"),
+        ], [
+            [p.block_name, p.application, p.length, p.path_execution_time, p.path]
+            for p in dependencies.critical_paths
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>🕸️ Dependency Graph</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{dependencies.blocks:,}</div>
+                    <div class="stat-label">Linked Blocks</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{dependencies.dependencies:,}</div>
+                    <div class="stat-label">Dependencies</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{dependencies.depth}</div>
+                    <div class="stat-label">Depth</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{dependencies.cyclic_blocks}</div>
+                    <div class="stat-label">Blocks on Cycles</div>
+                </div>
+            </div>
+            <h3>Costliest Upstream Roots</h3>
+            {roots}
+            <h3>Critical Paths</h3>
+            {paths}
+        </div>"""
+
+    def _render_formula_hotspots(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        formulas = score.formula_result
+        if not formulas or not formulas.findings:
+            return ""
+
+        table = self._data_table(tables, "formula_hotspots", [
+            ("Formula", "text"), ("Apps", "num"), ("Blocks", "num"), ("Executions", "num"),
+            ("Total Time (ms)", "num"), ("P95 (ms)", "num"), ("Rows per ms", "num"),
+            ("Severity", "text", 3),
+        ], [
+            [f.formula, f.applications, f.blocks, f.execution_count, f.total_execution_time,
+             f.p95_execution_time, f.rows_per_ms, f.severity]
+            for f in formulas.findings
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>🧮 Formula Hotspots</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{formulas.formulas:,}</div>
+                    <div class="stat-label">Formula Patterns</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{formulas.shared_formulas:,}</div>
+                    <div class="stat-label">Shared by {MIN_SHARED_BLOCKS}+ Blocks</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{formulas.shared_time_pct:g}%</div>
+                    <div class="stat-label">Compute in Shared Patterns</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value" style="color: #ef4444">{formulas.critical_count}</div>
+                    <div class="stat-label">Critical Shared</div>
+                </div>
+            </div>
+            <h3>Costliest Formula Patterns (severity flags shared patterns by P95)</h3>
+            {table}
+        </div>"""
+
+    def _render_write_path(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        writes = score.write_path_result
+        if not writes or not writes.executions_analyzed:
+            return ""
+
+        blocks = self._data_table(tables, "write_path_findings", [
+            ("Block", "text"), ("Application", "text"), ("Executions", "num"), ("Computed Rows", "num"),
+            ("Written Rows", "num"), ("Amplification", "num"), ("Churn Ratio", "num"),
+            ("No-op Executions", "num"), ("No-op Time (ms)", "num"),
+        ], [
+            [f.block_name, f.application, f.execution_count, f.computed_rows, f.written_rows,
+             f.write_amplification, f.churn_ratio, f.noop_executions, f.noop_execution_time]
+            for f in writes.block_findings
+        ])
+        changes = self._data_table(tables, "change_churn", [
+            ("Change", "text"), ("Application", "text"), ("Blocks", "num"), ("Upserted Rows", "num"),
+            ("Deleted Rows", "num"), ("Churn Ratio", "num"), ("No-op Executions", "num"),
+            ("No-op Time (ms)", "num"),
+        ], [
+            [f.change_id, f.application, f.blocks, f.upserted_rows, f.deleted_rows, f.churn_ratio,
+             f.noop_executions, f.noop_execution_time]
+            for f in writes.change_findings
+        ])
+        amplification = f"{writes.write_amplification:,.0f}×" if writes.write_amplification is not None else "–"
+
+        return f"""
+        <div class="findings">
+            <h2>♻️ Write Path</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{amplification}</div>
+                    <div class="stat-label">Computed per Written Row</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{writes.noop_pct:g}%</div>
+                    <div class="stat-label">Executions Writing Nothing</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{writes.noop_time_pct:g}%</div>
+                    <div class="stat-label">Compute Time Writing Nothing</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{writes.deleted_rows:,} / {writes.upserted_rows:,}</div>
+                    <div class="stat-label">Rows Deleted / Upserted</div>
+                </div>
+            </div>
+            <p style="color: #6b7280;">No-op compute scales the optimization score by {writes.penalty:g}.</p>
+            <h3>Blocks with the Most No-op Compute</h3>
+            {blocks}
+            <h3>Row Churn by Change</h3>
+            {changes}
+        </div>"""
+
+    def _render_worker_scaling(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        scaling = score.worker_scaling_result
+        if not scaling or not scaling.fits:
+            return ""
+
+        fits = self._data_table(tables, "worker_scaling_fits", [
+            ("Job Type", "text"), ("Executions", "num"), ("Worker Counts", "num"),
+            ("Worker Exponent", "num"), ("Efficiency at 2×", "num"), ("Typical Rows per Worker", "num"),
+        ], [
+            [f.job_type, f.executions, f.worker_levels, f.worker_exponent, f.efficiency_at_2x,
+             f.typical_rows_per_worker]
+            for f in scaling.fits
+        ])
+        curve = self._data_table(tables, "worker_scaling", [
+            ("Job Type", "text"), ("Workers", "num"), ("Executions", "num"),
+            ("Median Rows per ms", "num"), ("Speedup", "num"), ("Parallel Efficiency", "num"),
+        ], [
+            [p.job_type, p.workers, p.executions, p.median_rows_per_ms, p.speedup, p.parallel_efficiency]
+            for p in scaling.curve
+        ])
+        sizing = self._data_table(tables, "worker_sizing", [
+            ("Block", "text"), ("Application", "text"), ("Job Type", "text"), ("Issue", "text"),
+            ("Workers", "num"), ("Recommended", "num"), ("Rows", "num"), ("Time (ms)", "num"),
+            ("Impact (ms)", "num"),
+        ], [
+            [f.block_name, f.application, f.job_type, f.issue.replace("_", " "), f.workers,
+             f.recommended_workers, f.computed_rows, f.execution_time, f.impact_ms]
+            for f in scaling.findings
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>👷 Worker Scaling</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{scaling.executions_analyzed:,}</div>
+                    <div class="stat-label">Executions with Workers</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{scaling.too_many_workers_count:,}</div>
+                    <div class="stat-label">Too Many Workers</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{scaling.too_few_workers_count:,}</div>
+                    <div class="stat-label">Too Few Workers</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{scaling.idle_worker_time_ms / 3_600_000:.1f}</div>
+                    <div class="stat-label">Idle Worker-Hours</div>
+                </div>
+            </div>
+            <h3>Scaling by Job Type (time ∝ 1 / workers<sup>exponent</sup>)</h3>
+            {fits}
+            <h3>Throughput by Worker Count</h3>
+            {curve}
+            <h3>Mis-sized Executions</h3>
+            {sizing}
+        </div>"""
+
+    def _render_sample_estimate(self, score: ReliabilityScore, tables: dict) -> str:
+        estimate = score.sample_estimate
+        if not estimate or not estimate.estimates:
+            return ""
+
+        table = self._data_table(tables, "sample_estimates", [
+            ("Statistic", "text"), ("Estimate", "num"), ("CI Low", "num"), ("CI High", "num"),
+        ], [
+            [e.statistic, e.estimate, e.ci_low, e.ci_high]
+            for e in estimate.estimates
+        ])
+
+        total = estimate.get("total_score")
+        executions = estimate.sample_rows.get("executions", 0)
+        population = estimate.population_rows.get("executions", 0)
+
+        return f"""
+        <div class="findings">
+            <h2>🎲 Sampled Audit</h2>
+            <div class="stats-grid">
+                <div class="stat">
+                    <div class="stat-value">{estimate.fraction:.0%}</div>
+                    <div class="stat-label">Sample Fraction</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{executions:,} / {population:,}</div>
+                    <div class="stat-label">Executions Sampled</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{total.estimate:g}</div>
+                    <div class="stat-label">Estimated Score ({total.ci_low:g}–{total.ci_high:g})</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-value">{estimate.replicates}</div>
+                    <div class="stat-label">Bootstrap Replicates</div>
+                </div>
+            </div>
+            <h3>Estimates ({estimate.confidence:.0%} confidence intervals)</h3>
+            {table}
+        </div>"""
+
+    def _render_workload_analysis(self, score: ReliabilityScore, tables: dict) -> str:
         if not self.config.include_details:
             return ""
 
@@ -674,16 +1193,14 @@ class ReportGenerator:
 
         workload = score.workload_result
 
-        rows = ""
-        for app in workload.app_workloads[:10]:
-            rows += f"""
-            <tr>
-                <td>{app.application}</td>
-                <td>{app.total_execution_time_ms/1000:,.1f}s</td>
-                <td>{app.total_executions:,}</td>
-                <td>{app.unique_metrics}</td>
-                <td>{app.pct_of_total_time:.1f}%</td>
-            </tr>"""
+        table = self._data_table(tables, "app_workloads", [
+            ("Application", "text"), ("Total Time", "s"), ("Executions", "int"),
+            ("Metrics", "int"), ("P95", "ms"), ("% of Total", "pct"),
+        ], [
+            [app.application, app.total_execution_time_ms, app.total_executions,
+             app.unique_metrics, app.p95_execution_time_ms, app.pct_of_total_time]
+            for app in workload.app_workloads
+        ])
 
         return f"""
         <div class="findings">
@@ -707,16 +1224,28 @@ class ReportGenerator:
                 </div>
             </div>
             <h3>Applications by Compute Load</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Application</th>
-                        <th>Total Time</th>
-                        <th>Executions</th>
-                        <th>Metrics</th>
-                        <th>% of Total</th>
-                    </tr>
-                </thead>
-                <tbody>{rows}</tbody>
-            </table>
+            {table}
+        </div>"""
+
+
+    def _render_application_scores(self, score: ReliabilityScore, tables: dict) -> str:
+        if not self.config.include_details:
+            return ""
+
+        if not score.application_scores:
+            return ""
+
+        table = self._data_table(tables, "application_scores", [
+            ("Rank", "int"), ("Application", "text"), ("Score", "num"), ("Grade", "text"),
+            ("Performance", "num"), ("Optimization", "num"), ("Complexity", "num"), ("Views", "num"),
+        ], [
+            [app.rank, app.application, app.total_score, app.grade, app.performance_score,
+             app.optimization_score, app.complexity_score, app.views_score]
+            for app in score.application_scores
+        ])
+
+        return f"""
+        <div class="findings">
+            <h2>🏆 Application Leaderboard</h2>
+            {table}
         </div>"""
@@ -0,0 +1,154 @@
+"""
+Stratified sampling at ingestion time.
+
+Each frame is sampled within strata (application x jobType where both
+exist), so every application and job type keeps its share and none drops
+out of the sample entirely. For executions the sampling unit is the
+metric, placed in the stratum of its first execution: all rows of a
+sampled metric are kept, so per-metric averages (and the severities
+derived from them) stay exact and metric counts scale back up by the
+sampled share. Views are sampled by row, because a few views often hold
+most of the renders. Population sizes are recorded before sampling, and the unit ids are kept
+so bootstrap replicates can redraw the same units.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# Stratum columns per frame, used where present
+STRATA = {
+    "executions": ["application", "jobType"],
+    "views": ["app_id", "jobType"],
+    "armset": ["app_id", "jobType"],
+}
+
+# Sampling unit per frame; other frames are sampled by row
+UNIT_COLUMNS = {"executions": "metric_id"}
+
+# Entity columns per frame (a metric, a view) whose distinct count is kept
+# for scaling counts back to the population
+ENTITY_COLUMNS = {
+    "executions": ["application", "metric_id"],
+    "views": ["app_id", "blockId"],
+}
+
+
+@dataclass
+class SampleInfo:
+    """How the loaded data was sampled."""
+
+    fraction: float
+    seed: int
+    population_rows: Dict[str, int] = field(default_factory=dict)
+    sample_rows: Dict[str, int] = field(default_factory=dict)
+
+    # Distinct metrics / views before sampling (see ENTITY_COLUMNS)
+    population_entities: Dict[str, int] = field(default_factory=dict)
+
+    # Per frame: unit id of every sampled row, and stratum of every unit
+    units: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+    unit_strata: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+
+def group_ids(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Group id per row; rows with missing keys form their own groups."""
+
+    columns = [col for col in columns if col in df.columns]
+    if not columns:
+        return np.zeros(len(df), dtype=np.int64)
+    return df.groupby(columns, observed=True, dropna=False, sort=False).ngroup().to_numpy()
+
+
+def _units(df: pd.DataFrame, name: str):
+    """Unit id per row and stratum id per unit."""
+
+    strata = group_ids(df, STRATA[name])
+    unit_col = UNIT_COLUMNS.get(name)
+    if unit_col in df.columns:
+        units = group_ids(df, [STRATA[name][0], unit_col])
+    else:
+        units = np.arange(len(df))
+
+    # Each unit belongs to the stratum of its first row
+    unit_strata = np.zeros(units.max() + 1 if len(units) else 0, dtype=np.int64)
+    unit_strata[units[::-1]] = strata[::-1]
+    return units, unit_strata
+
+
+def stratified_choice(strata: np.ndarray, fraction: float, rng: np.random.Generator) -> np.ndarray:
+    """Indices into ``strata`` of a proportional sample without replacement.
+
+    Each stratum keeps ``ceil(fraction * size)`` members, so small strata
+    keep at least one. Indices are returned in ascending order.
+    """
+
+    if len(strata) == 0:
+        return np.arange(0)
+
+    sizes = np.bincount(strata)
+    take = np.ceil(sizes * fraction).astype(np.int64)
+
+    # Random order within each stratum, then keep the first ``take``
+    order = np.lexsort((rng.random(len(strata)), strata))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rank = np.arange(len(order)) - starts[strata[order]]
+    return np.sort(order[rank < take[strata[order]]])
+
+
+def bootstrap_weights(units: np.ndarray, unit_strata: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """How often each unit is drawn in one bootstrap replicate.
+
+    The sampled units of each stratum are redrawn with replacement; units
+    not in the sample get weight zero. Strata with a single sampled unit
+    would contribute no variance, so they are pooled into one stratum.
+    """
+
+    weights = np.zeros(len(unit_strata), dtype=np.int64)
+    if len(units) == 0:
+        return weights
+
+    present = np.unique(units)
+    strata = unit_strata[present]
+    singles = np.bincount(strata)[strata] < 2
+    strata = np.where(singles, -1, strata)
+    strata = np.unique(strata, return_inverse=True)[1]
+
+    # Redraw units within their stratum
+    by_stratum = np.argsort(strata, kind="stable")
+    sizes = np.bincount(strata)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    group = strata[by_stratum]
+    draws = present[by_stratum[starts[group] + (rng.random(len(group)) * sizes[group]).astype(np.int64)]]
+
+    np.add.at(weights, draws, 1)
+    return weights
+
+
+def sample_frames(frames: Dict[str, pd.DataFrame], fraction: float, seed: int):
+    """Sample every frame by its strata; return the samples and a SampleInfo."""
+
+    rng = np.random.default_rng(seed)
+    info = SampleInfo(fraction=fraction, seed=seed)
+    sampled = {}
+
+    for name, df in frames.items():
+        info.population_rows[name] = len(df)
+        entity_cols = ENTITY_COLUMNS.get(name)
+        if entity_cols and set(entity_cols) <= set(df.columns):
+            info.population_entities[name] = int(df.groupby(entity_cols, observed=True).ngroups)
+
+        units, unit_strata = _units(df, name)
+        chosen = np.zeros(len(unit_strata), dtype=bool)
+        chosen[stratified_choice(unit_strata, fraction, rng)] = True
+        positions = np.flatnonzero(chosen[units])
+
+        sampled[name] = df.iloc[positions]
+        info.sample_rows[name] = len(positions)
+        info.units[name] = units[positions]
+        info.unit_strata[name] = unit_strata
+
+    return sampled, info
@@ -0,0 +1,126 @@
+"""
+Compiled scoring tiers.
+
+Each tier ladder ("below 1000 ms → full marks, below 2000 ms → 90%, ...")
+is compiled once into a sorted array of inclusive upper bounds plus a
+value per tier. Looking up a score is a single ``np.searchsorted`` over
+those arrays, which works for one value or for a whole column of
+per-application or per-sweep values.
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .config import GradesConfig, ThresholdsConfig
+
+
+class ScoreTiers:
+    """A tier ladder compiled into lookup arrays."""
+
+    __slots__ = ("bounds", "values", "nan_value")
+
+    def __init__(self, bounds: np.ndarray, values: np.ndarray, nan_value: Any):
+        self.bounds = bounds
+        self.values = values
+        self.nan_value = nan_value
+
+    @classmethod
+    def compile(
+        cls,
+        steps: Iterable[Tuple[str, float, Any]],
+        otherwise: Any,
+        nan_value: Optional[Any] = None,
+    ) -> "ScoreTiers":
+        """Compile ascending ``(op, bound, value)`` steps, ``op`` being "<" or "<=".
+
+        A value falls in the first step whose condition holds, else gets
+        ``otherwise``. Strict bounds are stored as the next float below the
+        bound, so every comparison becomes an inclusive search. NaN inputs
+        get ``nan_value`` (``otherwise`` by default).
+        """
+
+        bounds, values = [], []
+        for op, bound, value in steps:
+            if op == "<":
+                bound = np.nextafter(float(bound), -np.inf)
+            elif op != "<=":
+                raise ValueError(f"Unsupported tier operator: {op!r}")
+            bounds.append(float(bound))
+            values.append(value)
+        values.append(otherwise)
+
+        bounds = np.asarray(bounds, dtype=float)
+        if np.any(np.diff(bounds) < 0):
+            raise ValueError("Tier bounds must be ascending")
+
+        return cls(bounds, np.asarray(values), otherwise if nan_value is None else nan_value)
+
+    def __call__(self, values):
+        """Return the tier value for each input value (scalar in, scalar out)."""
+
+        x = np.asarray(values, dtype=float)
+        out = self.values[np.searchsorted(self.bounds, x, side="left")]
+        out = np.where(np.isnan(x), self.nan_value, out)
+        return out.item() if out.ndim == 0 else out
+
+
+# Performance: share of the weight by average metric execution time (ms)
+AVG_EXECUTION_TIME = ScoreTiers.compile(
+    [("<", 1000, 1.0), ("<", 2000, 0.9), ("<", 3000, 0.8), ("<", 5000, 0.6), ("<", 10000, 0.4)],
+    otherwise=0.2,
+)
+
+# Scoping: share of the weight by scoped percentage (partial counts half)
+SCOPED_PCT = ScoreTiers.compile(
+    [("<", 10, 0.2), ("<", 30, 0.4), ("<", 50, 0.6), ("<", 70, 0.8)],
+    otherwise=1.0,
+    nan_value=0.2,
+)
+
+# Complexity: share of the weight by percentage of high-complexity metrics
+HIGH_COMPLEXITY_PCT = ScoreTiers.compile(
+    [("<=", 5, 1.0), ("<=", 10, 0.85), ("<=", 20, 0.7), ("<=", 30, 0.5)],
+    otherwise=0.3,
+)
+
+# Complexity: multiplier by average dimension count
+AVG_DIMENSIONS = ScoreTiers.compile(
+    [("<=", 3, 1.1), ("<", 6, 1.0)],
+    otherwise=0.85,
+    nan_value=1.0,
+)
+
+# Optimization: multiplier by percentage of compute time in executions that wrote no rows
+NOOP_TIME_PCT = ScoreTiers.compile(
+    [("<=", 10, 1.0), ("<=", 25, 0.9), ("<=", 50, 0.8)],
+    otherwise=0.7,
+    nan_value=1.0,
+)
+
+# Views: share of the weight by percentage of slow view renders
+SLOW_VIEWS_PCT = ScoreTiers.compile(
+    [("<=", 5, 1.0), ("<=", 10, 0.85), ("<=", 20, 0.7), ("<=", 30, 0.5)],
+    otherwise=0.3,
+)
+
+
+@lru_cache(maxsize=None)
+def no_change_penalty(thresholds: ThresholdsConfig) -> ScoreTiers:
+    """Scoping multiplier by NoChange percentage."""
+    return ScoreTiers.compile(
+        [("<=", thresholds.non_scoped_warning, 1.0), ("<=", thresholds.non_scoped_critical, 0.85)],
+        otherwise=0.7,
+        nan_value=1.0,
+    )
+
+
+@lru_cache(maxsize=None)
+def grade_tiers(grades: GradesConfig) -> ScoreTiers:
+    """Letter grade by total score."""
+    return ScoreTiers.compile(
+        [("<", grades.D, "F"), ("<", grades.C, "D"), ("<", grades.B, "C"), ("<", grades.A, "B")],
+        otherwise="A",
+        nan_value="F",
+    )
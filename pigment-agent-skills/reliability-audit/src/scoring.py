@@ -6,18 +6,49 @@ from dataclasses import dataclass, field
 from typing import Dict, List
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from .config import Config
 from .data_loader import PerformanceData
+from .score_tiers import grade_tiers
 from .analyzers import (
     PerformanceAnalyzer,
     ScopingAnalyzer,
     ComplexityAnalyzer,
     WorkloadAnalyzer,
+    AnomalyAnalyzer,
+    ChangeImpactAnalyzer,
+    DependencyAnalyzer,
+    FormulaAnalyzer,
+    WorkerScalingAnalyzer,
+    WritePathAnalyzer,
 )
 from .analyzers.performance_analyzer import PerformanceAnalysisResult
 from .analyzers.scoping_analyzer import ScopingAnalysisResult
 from .analyzers.complexity_analyzer import ComplexityAnalysisResult
 from .analyzers.workload_analyzer import WorkloadAnalysisResult
+from .analyzers.anomaly_analyzer import AnomalyAnalysisResult
+from .analyzers.change_impact_analyzer import ChangeImpactAnalysisResult
+from .analyzers.dependency_analyzer import DependencyAnalysisResult
+from .analyzers.formula_analyzer import FormulaAnalysisResult
+from .analyzers.worker_scaling_analyzer import WorkerScalingAnalysisResult
+from .analyzers.write_path_analyzer import WritePathAnalysisResult
+from .estimates import SampleEstimate, SampleEstimator
+
+
+@dataclass(slots=True)
+class ApplicationScore:
+    """Reliability score of a single application."""
+
+    rank: int
+    application: str
+    total_score: float
+    grade: str
+    performance_score: float
+    optimization_score: float
+    complexity_score: float
+    views_score: float
 
 
 @dataclass
@@ -43,6 +74,18 @@ class ReliabilityScore:
     scoping_result: ScopingAnalysisResult = None
     complexity_result: ComplexityAnalysisResult = None
     workload_result: WorkloadAnalysisResult = None
+    anomaly_result: AnomalyAnalysisResult = None
+    change_impact_result: ChangeImpactAnalysisResult = None
+    dependency_result: DependencyAnalysisResult = None
+    formula_result: FormulaAnalysisResult = None
+    worker_scaling_result: WorkerScalingAnalysisResult = None
+    write_path_result: WritePathAnalysisResult = None
+
+    # Estimates with confidence intervals, when scored on a sample
+    sample_estimate: SampleEstimate = None
+
+    # Per-application leaderboard (highest score first)
+    application_scores: List[ApplicationScore] = field(default_factory=list)
 
     # Top recommendations
     recommendations: List[str] = field(default_factory=list)
@@ -71,6 +114,11 @@ class ReliabilityScorer:
         result.scoping_result = scoping_analyzer.analyze(data)
         result.optimization_score = result.scoping_result.score
 
+        # Recomputations that write nothing lower the optimization score
+        write_path_analyzer = WritePathAnalyzer(self.config)
+        result.write_path_result = write_path_analyzer.analyze(data)
+        result.optimization_score = round(result.optimization_score * result.write_path_result.penalty, 1)
+
         complexity_analyzer = ComplexityAnalyzer(self.config)
         result.complexity_result = complexity_analyzer.analyze(data)
         result.complexity_score = result.complexity_result.score
@@ -79,6 +127,26 @@ class ReliabilityScorer:
         result.workload_result = workload_analyzer.analyze(data)
         result.views_score = result.workload_result.score
 
+        # Anomalies are reported as findings only; they do not affect the score
+        anomaly_analyzer = AnomalyAnalyzer(self.config)
+        result.anomaly_result = anomaly_analyzer.analyze(data)
+
+        # Change attribution is reported as findings only
+        change_impact_analyzer = ChangeImpactAnalyzer(self.config)
+        result.change_impact_result = change_impact_analyzer.analyze(data)
+
+        # The dependency graph is reported as findings only
+        dependency_analyzer = DependencyAnalyzer(self.config)
+        result.dependency_result = dependency_analyzer.analyze(data)
+
+        # Formula hotspots are reported as findings only
+        formula_analyzer = FormulaAnalyzer(self.config)
+        result.formula_result = formula_analyzer.analyze(data)
+
+        # Worker scaling is reported as findings only
+        worker_scaling_analyzer = WorkerScalingAnalyzer(self.config)
+        result.worker_scaling_result = worker_scaling_analyzer.analyze(data)
+
         # Calculate total score
         result.total_score = round(
             result.performance_score +
@@ -91,24 +159,69 @@ class ReliabilityScorer:
         # Determine grade
         result.grade = self._calculate_grade(result.total_score)
 
+        # Per-application leaderboard
+        result.application_scores = self.score_applications(data)
+
+        if data.sampling is not None:
+            result.sample_estimate = SampleEstimator(self.config).estimate(data, data.sampling)
+
         # Generate recommendations
         result.recommendations = self._generate_recommendations(result)
 
         return result
 
+    def score_applications(self, data: PerformanceData) -> List[ApplicationScore]:
+        """Score every application at once, one grouped pass per component."""
+
+        components = {
+            "performance_score": PerformanceAnalyzer(self.config),
+            "optimization_score": ScopingAnalyzer(self.config),
+            "complexity_score": ComplexityAnalyzer(self.config),
+            "views_score": WorkloadAnalyzer(self.config),
+        }
+
+        apps = []
+        if data.has_executions and "application" in data.executions.columns:
+            apps.append(data.executions["application"].dropna().unique())
+        if data.has_views and "app_id" in data.views.columns:
+            apps.append(data.views["app_id"].dropna().unique())
+        if not apps:
+            return []
+
+        applications = pd.Index(np.concatenate(apps).astype(str)).unique().sort_values()
+
+        table = pd.DataFrame({
+            name: analyzer.score_by_application(data, applications)
+            for name, analyzer in components.items()
+        }, index=applications)
+        table["optimization_score"] = (
+            table["optimization_score"] * WritePathAnalyzer(self.config).penalty_by_application(data, applications)
+        ).round(1)
+        table["total_score"] = table[list(components)].sum(axis=1).round(1)
+        table["grade"] = grade_tiers(self.grades)(table["total_score"].to_numpy())
+        table = table.rename_axis("application").reset_index().sort_values(
+            ["total_score", "application"], ascending=[False, True], kind="stable"
+        )
+        table["rank"] = np.arange(1, len(table) + 1)
+
+        return [
+            ApplicationScore(
+                rank=int(row.rank),
+                application=row.application,
+                total_score=float(row.total_score),
+                grade=row.grade,
+                performance_score=float(row.performance_score),
+                optimization_score=float(row.optimization_score),
+                complexity_score=float(row.complexity_score),
+                views_score=float(row.views_score),
+            )
+            for row in table.itertuples(index=False)
+        ]
+
     def _calculate_grade(self, score: float) -> str:
         """Convert numeric score to letter grade."""
 
-        if score >= self.grades.A:
-            return "A"
-        elif score >= self.grades.B:
-            return "B"
-        elif score >= self.grades.C:
-            return "C"
-        elif score >= self.grades.D:
-            return "D"
-        else:
-            return "F"
+        return grade_tiers(self.grades)(score)
 
     def _generate_recommendations(self, result: ReliabilityScore) -> List[str]:
         """Generate actionable recommendations based on findings."""
@@ -177,6 +290,62 @@ class ReliabilityScorer:
                 "Add page selectors and filters to reduce data displayed."
             )
 
+        # Anomaly recommendations
+        anomalies = result.anomaly_result
+        if anomalies and anomalies.critical_count > 0:
+            recommendations.append(
+                f"📈 {anomalies.critical_count} metric-days show critical execution-time spikes "
+                f"across {anomalies.anomalous_metrics} metrics. Check recent model changes on those days."
+            )
+
+        changes = result.change_impact_result
+        if changes and changes.critical_count > 0:
+            recommendations.append(
+                f"🧭 {changes.critical_count} model changes were followed by critical latency or "
+                f"compute spikes within {changes.window_hours:g}h. Review the top culprits in the change impact report."
+            )
+
+        dependencies = result.dependency_result
+        if dependencies and dependencies.root_findings:
+            root = dependencies.root_findings[0]
+            if root.downstream_execution_time > 2 * root.own_execution_time > 0:
+                recommendations.append(
+                    f"🕸️ {root.downstream_execution_time / 3_600_000:.1f} hours of compute depend on "
+                    f"{root.block_name} ({root.direct_dependents} direct dependents). "
+                    "Optimize it before the blocks it feeds."
+                )
+
+        formulas = result.formula_result
+        if formulas and formulas.critical_count > 0:
+            top = next((f for f in formulas.findings if f.severity == "critical"), None)
+            example = f" Start with {top.formula}, used by {top.blocks} blocks." if top else ""
+            recommendations.append(
+                f"🧮 {formulas.critical_count} formula patterns shared by several blocks are critically slow. "
+                f"Fixing a shared pattern speeds up every block that uses it.{example}"
+            )
+
+        writes = result.write_path_result
+        if writes and writes.noop_time_pct > 10:
+            top = writes.block_findings[0] if writes.block_findings else None
+            example = f" {top.block_name} alone spent {top.noop_execution_time / 1000:,.0f}s writing nothing." if top else ""
+            recommendations.append(
+                f"♻️ {writes.noop_time_pct:g}% of compute time went to recomputations that wrote no rows. "
+                f"Check what triggers them and narrow their scope.{example}"
+            )
+
+        scaling = result.worker_scaling_result
+        if scaling and scaling.too_many_workers_count > 0 and scaling.idle_worker_time_ms > 0:
+            recommendations.append(
+                f"👷 {scaling.too_many_workers_count:,} executions ran with more workers than their rows needed, "
+                f"holding {scaling.idle_worker_time_ms / 3_600_000:.1f} worker-hours idle. "
+                "Size workers to the computed row volume."
+            )
+        if scaling and scaling.too_few_workers_count > 0:
+            recommendations.append(
+                f"👷 {scaling.too_few_workers_count:,} slow executions ran with too few workers for their rows. "
+                "More parallelism would shorten them."
+            )
+
         # General recommendations based on grade
         if result.grade in ["D", "F"]:
             recommendations.append(
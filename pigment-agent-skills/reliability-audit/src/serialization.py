@@ -0,0 +1,84 @@
+"""
+Machine-readable serialization of audit results.
+
+A ``ReliabilityScore`` (including every analyzer result and finding) is
+converted to plain JSON types under a versioned envelope. ``orjson`` is
+used when installed; the standard library ``json`` module otherwise.
+"""
+
+import json
+import math
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+from . import __version__
+from .scoring import ReliabilityScore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Bump the minor version for added fields, the major version for renamed,
+# removed or retyped fields.
+SCHEMA_VERSION = "2.0"
+
+
+def plain(value: Any) -> Any:
+    """Recursively convert a value to JSON-native types (NaN and inf become None)."""
+
+    if isinstance(value, dict):
+        return {str(k): plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def score_to_dict(score: ReliabilityScore) -> dict:
+    """Return the versioned, JSON-ready representation of an audit result."""
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "tool_version": __version__,
+        **plain(asdict(score)),
+    }
+
+
+def dumps(score: ReliabilityScore, indent: bool = False) -> bytes:
+    """Serialize an audit result to UTF-8 JSON."""
+
+    return encode(score_to_dict(score), indent=indent)
+
+
+def encode(payload: dict, indent: bool = False) -> bytes:
+    """Encode a JSON-ready payload (see ``score_to_dict``) as UTF-8 JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def dump(score: ReliabilityScore, stream: IO[bytes], indent: bool = False):
+    """Write an audit result as JSON to a binary stream."""
+
+    stream.write(dumps(score, indent=indent))
+    stream.write(b"\n")
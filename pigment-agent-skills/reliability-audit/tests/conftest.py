@@ -0,0 +1,120 @@
+"""
+Shared fixtures: a local stand-in for the Pigment REST APIs.
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+API_KEY = "test-key"
+
+# Events per Audit Logs API page
+PAGE_SIZE = 100
+
+
+class StubApi:
+    """State and scripted failures behind the stub server.
+
+    ``failures`` holds ``(status, headers)`` responses returned, in order,
+    before any real one. ``fail_at_cursor`` answers HTTP 400 to the page
+    with that cursor, to interrupt a sync midway.
+    """
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self.applications: List[dict] = []
+        self.blocks: Dict[str, List[dict]] = {}
+        self.failures: List[Tuple[int, Dict[str, str]]] = []
+        self.fail_at_cursor: Optional[str] = None
+        self.requests: List[str] = []
+        self.lock = threading.Lock()
+
+    def add_events(self, count: int, ingested: str, start: Optional[int] = None):
+        start = len(self.events) if start is None else start
+        for i in range(start, start + count):
+            self.events.append({
+                "eventId": f"evt-{i}",
+                "eventType": "BlockModified",
+                "eventTimestamp": ingested,
+                "ingestionTimestamp": ingested,
+                "actor": {"memberId": f"member-{i % 3}"},
+                "target": {"applicationId": f"APP_{i % 5:04d}"},
+            })
+
+    def paths(self, path: str) -> List[str]:
+        return [request for request in self.requests if urlsplit(request).path == path]
+
+    def handle(self, request: str) -> Tuple[int, Dict[str, str], dict]:
+        with self.lock:
+            self.requests.append(request)
+            if self.failures:
+                status, headers = self.failures.pop(0)
+                return status, headers, {}
+
+        url = urlsplit(request)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/audit/v1/events":
+            cursor = query.get("cursor")
+            if cursor is not None and cursor == self.fail_at_cursor:
+                return 400, {}, {}
+            matching = [e for e in self.events if e["ingestionTimestamp"] >= query["ingestedSince"]]
+            page = int(cursor or 0)
+            body = {"events": matching[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]}
+            if (page + 1) * PAGE_SIZE < len(matching):
+                body["pagination"] = {"nextCursor": str(page + 1)}
+            return 200, {}, body
+
+        if url.path == "/v1/applications":
+            return 200, {}, {"applications": self.applications}
+
+        if url.path == "/v1/blocks":
+            return 200, {}, {"blocks": self.blocks.get(query.get("applicationId"), [])}
+
+        return 404, {}, {}
+
+
+@pytest.fixture
+def stub_api():
+    """Serve a ``StubApi`` on a free local port; yields ``(api, base_url)``."""
+
+    api = StubApi()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.headers.get("Authorization") != f"Bearer {API_KEY}":
+                status, headers, body = 401, {}, {}
+            else:
+                status, headers, body = api.handle(self.path)
+
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield api, f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,81 @@
+"""
+Retries of the shared API client against the stub server.
+"""
+
+import asyncio
+
+import pytest
+
+from src import api_client
+from src.api_client import APIError, ApiClient
+
+from conftest import API_KEY
+
+
+def _get(base_url, path="/v1/applications", **kwargs):
+    async def run():
+        client = ApiClient(base_url, API_KEY, **kwargs)
+        try:
+            return await client.get_json(path)
+        finally:
+            client.close()
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of waiting them out."""
+
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(api_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def test_429_waits_for_retry_after(stub_api, sleeps):
+    api, base_url = stub_api
+    api.failures = [(429, {"Retry-After": "7"})]
+
+    assert _get(base_url) == {"applications": []}
+    assert sleeps == [7.0]
+    assert len(api.requests) == 2
+
+
+def test_5xx_is_retried_with_backoff(stub_api, sleeps):
+    api, base_url = stub_api
+    api.failures = [(503, {}), (502, {})]
+
+    assert _get(base_url, backoff_seconds=1.0) == {"applications": []}
+    assert len(api.requests) == 3
+
+    # Exponential backoff with jitter in [0.5, 1.5) of the base
+    assert 0.5 <= sleeps[0] < 1.5
+    assert 1.0 <= sleeps[1] < 3.0
+
+
+def test_5xx_gives_up_after_max_retries(stub_api, sleeps):
+    api, base_url = stub_api
+    api.failures = [(500, {})] * 3
+
+    with pytest.raises(APIError) as error:
+        _get(base_url, max_retries=2)
+
+    assert error.value.status == 500
+    assert len(api.requests) == 3
+
+
+def test_client_errors_are_not_retried(stub_api, sleeps):
+    api, base_url = stub_api
+
+    with pytest.raises(APIError) as error:
+        _get(base_url, path="/v1/unknown")
+
+    assert error.value.status == 404
+    assert len(api.requests) == 1
+    assert sleeps == []
@@ -0,0 +1,133 @@
+"""
+Incremental Audit Logs sync against the stub server.
+"""
+
+import sqlite3
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.api_client import APIError
+from src.audit_logs import AuditEventStore, AuditLogSync, EVENTS_PATH
+from src.config import Config
+
+from conftest import API_KEY, PAGE_SIZE
+
+
+T0 = "2026-10-01T00:00:00Z"
+T1 = "2026-10-02T00:00:00Z"
+
+
+@pytest.fixture
+def sync_config(stub_api, tmp_path):
+    _, base_url = stub_api
+    return Config(
+        api_base_url=base_url,
+        audit_logs_api_key=API_KEY,
+        audit_logs_store_path=str(tmp_path / "audit_events.sqlite"),
+        api_max_retries=0,
+    )
+
+
+def _stored(config):
+    store = AuditEventStore(AuditLogSync(config).store_path())
+    try:
+        return store.query(), store.state()
+    finally:
+        store.close()
+
+
+def _params(request):
+    return {key: values[0] for key, values in parse_qs(urlsplit(request).query).items()}
+
+
+def test_pages_across_cursors(stub_api, sync_config):
+    api, _ = stub_api
+    api.add_events(2 * PAGE_SIZE + 50, T0)
+
+    result = AuditLogSync(sync_config, quiet=True).sync()
+
+    assert result.pages == 3
+    assert result.fetched == result.inserted == 2 * PAGE_SIZE + 50
+    assert [_params(r).get("cursor") for r in api.paths(EVENTS_PATH)] == [None, "1", "2"]
+
+    events, state = _stored(sync_config)
+    assert events["event_id"].is_unique and len(events) == 2 * PAGE_SIZE + 50
+    assert "cursor" not in state
+
+
+def test_duplicate_event_ids_are_stored_once(stub_api, sync_config):
+    api, _ = stub_api
+    api.add_events(PAGE_SIZE, T0)
+    api.add_events(10, T0, start=PAGE_SIZE - 10)  # Repeats the last 10 IDs on page 2
+
+    result = AuditLogSync(sync_config, quiet=True).sync()
+
+    assert result.fetched == PAGE_SIZE + 10
+    assert result.inserted == PAGE_SIZE
+    events, _ = _stored(sync_config)
+    assert len(events) == PAGE_SIZE
+
+
+def test_interrupted_sync_resumes_from_saved_cursor(stub_api, sync_config):
+    api, _ = stub_api
+    api.add_events(3 * PAGE_SIZE, T0)
+    api.fail_at_cursor = "2"
+
+    with pytest.raises(APIError):
+        AuditLogSync(sync_config, quiet=True).sync()
+
+    events, state = _stored(sync_config)
+    assert len(events) == 2 * PAGE_SIZE
+    assert state["cursor"] == "2"
+
+    api.fail_at_cursor = None
+    api.requests.clear()
+    result = AuditLogSync(sync_config, quiet=True).sync()
+
+    assert result.resumed
+    assert result.pages == 1 and result.inserted == PAGE_SIZE
+    assert _params(api.paths(EVENTS_PATH)[0])["cursor"] == "2"
+    events, state = _stored(sync_config)
+    assert len(events) == 3 * PAGE_SIZE
+    assert "cursor" not in state
+
+
+def test_watermark_limits_next_run_to_new_events(stub_api, sync_config):
+    api, _ = stub_api
+    api.add_events(PAGE_SIZE + 20, T0)
+
+    first = AuditLogSync(sync_config, quiet=True).sync()
+    assert first.watermark == T0
+
+    api.add_events(30, T1)
+    api.requests.clear()
+    second = AuditLogSync(sync_config, quiet=True).sync()
+
+    assert second.ingested_since == T0
+    assert _params(api.paths(EVENTS_PATH)[0])["ingestedSince"] == T0
+    assert second.inserted == 30
+    assert second.watermark == T1
+
+    # Only events at or after the new watermark are fetched next time
+    api.requests.clear()
+    third = AuditLogSync(sync_config, quiet=True).sync()
+    assert third.fetched == 30 and third.inserted == 0
+    assert _params(api.paths(EVENTS_PATH)[0])["ingestedSince"] == T1
+
+
+def test_read_only_store_never_writes(stub_api, sync_config, tmp_path):
+    api, _ = stub_api
+    api.add_events(10, T0)
+    AuditLogSync(sync_config, quiet=True).sync()
+
+    store = AuditEventStore(AuditLogSync(sync_config).store_path(), read_only=True)
+    try:
+        assert len(store.query()) == 10
+    finally:
+        store.close()
+
+    missing = tmp_path / "missing" / "audit_events.sqlite"
+    with pytest.raises(sqlite3.Error):
+        AuditEventStore(missing, read_only=True)
+    assert not missing.parent.exists()
@@ -0,0 +1,51 @@
+"""
+Cost propagation over the block dependency graph.
+"""
+
+import numpy as np
+
+from src.dependency_graph import REACH_BATCH, DependencyGraph
+
+
+def _stacked_diamonds(count):
+    """``count`` diamonds, each one's bottom the next one's top: 3 * count + 1 nodes."""
+
+    src, dst, top = [], [], 0
+    for i in range(count):
+        left, right, bottom = 3 * i + 1, 3 * i + 2, 3 * i + 3
+        src += [top, top, left, right]
+        dst += [left, right, bottom, bottom]
+        top = bottom
+    return DependencyGraph(np.array(src), np.array(dst), 3 * count + 1)
+
+
+def test_shared_descendants_are_counted_once():
+    graph = _stacked_diamonds(20)
+
+    totals = graph.downstream_cost(np.ones(graph.n_nodes), np.array([0, 3, graph.n_nodes - 1]))
+
+    np.testing.assert_array_equal(totals, [61, 58, 1])
+
+
+def test_sources_across_batches_match_a_graph_walk():
+    rng = np.random.default_rng(0)
+    n_nodes = 2_000
+    src, dst = rng.integers(0, n_nodes, (2, 6_000))
+    forward = src < dst
+    graph = DependencyGraph(src[forward], dst[forward], n_nodes)
+    cost = rng.random(n_nodes)
+    sources = np.flatnonzero(graph.in_degree() == 0)
+    assert len(sources) > REACH_BATCH
+
+    expected = []
+    for source in sources:
+        seen, stack = {source}, [source]
+        while stack:
+            node = stack.pop()
+            for child in graph.indices[graph.indptr[node]:graph.indptr[node + 1]]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        expected.append(cost[list(seen)].sum())
+
+    np.testing.assert_allclose(graph.downstream_cost(cost, sources), expected)
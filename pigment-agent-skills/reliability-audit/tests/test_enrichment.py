@@ -0,0 +1,72 @@
+"""
+Metadata enrichment and its cache against the stub server.
+"""
+
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from src.config import Config
+from src.data_loader import PerformanceData, encode_ids
+from src.enrichment import MetadataEnricher
+
+from conftest import API_KEY
+
+
+@pytest.fixture
+def enrich_config(stub_api, tmp_path):
+    api, base_url = stub_api
+    api.applications = [
+        {"id": "APP_0001", "name": "Planning", "modifiedAt": "2026-09-01T00:00:00Z"},
+        {"id": "APP_0002", "name": "Sales", "modifiedAt": "2026-09-02T00:00:00Z"},
+    ]
+    api.blocks = {
+        "APP_0001": [{"id": "MET_1", "type": "Metric", "dimensions": ["Month", "Entity"]}],
+        "APP_0002": [{"id": "MET_2", "type": "Metric", "dimensions": ["Month"]}],
+    }
+    return Config(
+        api_base_url=base_url,
+        metadata_api_key=API_KEY,
+        metadata_cache_path=str(tmp_path / "metadata.sqlite"),
+        api_max_retries=0,
+    )
+
+
+def _data():
+    return encode_ids(PerformanceData(executions=pd.DataFrame({
+        "application": ["APP_0001", "APP_0002", "APP_0001"],
+        "metric_id": ["MET_1", "MET_2", "MET_1"],
+        "execution_time": [100.0, 200.0, 300.0],
+    })))
+
+
+def test_enrichment_joins_metadata(enrich_config):
+    data = MetadataEnricher(enrich_config, quiet=True).enrich(_data())
+
+    assert data.executions["app_name"].tolist() == ["Planning", "Sales", "Planning"]
+    assert data.executions["block_dimension_count"].tolist() == [2, 1, 2]
+
+
+def test_cache_hits_skip_the_api(stub_api, enrich_config):
+    api, _ = stub_api
+
+    MetadataEnricher(enrich_config, quiet=True).enrich(_data())
+    assert len(api.paths("/v1/applications")) == 1
+    assert len(api.paths("/v1/blocks")) == 2
+
+    api.requests.clear()
+    data = MetadataEnricher(enrich_config, quiet=True).enrich(_data())
+    assert api.requests == []
+    assert data.executions["app_name"].tolist() == ["Planning", "Sales", "Planning"]
+
+
+def test_expired_entries_are_fetched_again(stub_api, enrich_config):
+    api, _ = stub_api
+
+    MetadataEnricher(enrich_config, quiet=True).enrich(_data())
+    api.requests.clear()
+    MetadataEnricher(replace(enrich_config, metadata_cache_ttl_hours=0), quiet=True).enrich(_data())
+
+    assert len(api.paths("/v1/applications")) == 1
+    assert len(api.paths("/v1/blocks")) == 2
@@ -0,0 +1,52 @@
+"""
+Sample estimates against the exact audit of the same data.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from src import audit
+from src.config import load_config
+
+
+def _executions():
+    """10 one-row metrics with 12 dimensions and 90 fifty-row metrics with 3."""
+
+    rng = np.random.default_rng(0)
+    metrics = [(f"MET_{i:03d}", 1, 12) for i in range(10)] + [(f"MET_{i:03d}", 50, 3) for i in range(10, 100)]
+    rows = [
+        {
+            "application": f"APP_{i % 4}",
+            "metric_id": metric,
+            "metric_name": metric,
+            "jobType": "Formula",
+            "scoped_level": "FullyScoped" if i % 3 else "NoChange",
+            "nb_dims": dims,
+        }
+        for i, (metric, count, dims) in enumerate(metrics)
+        for _ in range(count)
+    ]
+    df = pd.DataFrame(rows)
+    df["execution_time"] = rng.lognormal(7, 1.5, len(df)).round()
+    df["computed_rows"] = rng.integers(1, 10_000, len(df))
+    return df
+
+
+def test_full_sample_reproduces_the_exact_audit():
+    config = load_config()
+    executions = _executions()
+
+    exact = audit(executions=executions, config=config)
+    estimate = audit(executions=executions, config=replace(config, sample_fraction=1.0)).sample_estimate
+
+    assert exact.complexity_result.critical_count == 10
+    for statistic, value in [
+        ("complexity_critical_count", exact.complexity_result.critical_count),
+        ("complexity_warning_count", exact.complexity_result.warning_count),
+        ("metric_critical_count", exact.performance_result.metric_critical_count),
+        ("complexity_score", exact.complexity_score),
+        ("total_score", exact.total_score),
+    ]:
+        assert estimate.get(statistic).estimate == value, statistic
@@ -0,0 +1,22 @@
+"""
+Per-job-type scaling fits on degenerate and well-posed data.
+"""
+
+import numpy as np
+
+from src.analyzers.worker_scaling_analyzer import fit_scaling
+
+
+def test_constant_worker_count_is_not_fitted():
+    rng = np.random.default_rng(0)
+    job = np.repeat([0, 1, 2], 100)
+    log_rows = np.log(rng.integers(100, 1_000_000, len(job)).astype(float))
+    workers = np.where(job == 0, 4.0, np.where(job == 1, 8.0, rng.choice([2.0, 4.0, 8.0], len(job))))
+    log_workers = np.log(workers)
+    log_time = 0.5 + 0.8 * log_rows - 0.6 * log_workers + rng.normal(0, 0.05, len(job))
+
+    coefficients = fit_scaling(job, 4, log_rows, log_workers, log_time)
+
+    # One worker count, or no executions at all: nothing to fit
+    assert np.isnan(coefficients[[0, 1, 3]]).all()
+    np.testing.assert_allclose(coefficients[2, 1:], [0.8, -0.6], atol=0.05)